@@ -0,0 +1,123 @@
+"""
+Micro-benchmark of utils.crypto against the implementation it replaced, on the
+Kisskh workload (two kkey encryptions with a constant hexed key and iv per
+episode) and the rabbit-family one (decrypting salted sources).
+
+    PYTHONPATH=. python benchmarks/bench_crypto.py
+"""
+
+import base64
+import json
+import os
+import timeit
+from binascii import unhexlify
+
+from Crypto.Cipher import AES
+from Crypto.Hash import MD5
+
+from consumet_mc.utils import crypto
+
+_KK_KEY = "4f6bdaa39E2F8CB07f5e722d9EDEF314"
+_KK_IV = "01504af356e619cf2e42bba68C3F70F9"
+
+
+def reference_aes_unsalt(key, salt, key_len=32, iv_len=16):
+    key_iv = b""
+    prev = b""
+    while len(key_iv) < (key_len + iv_len):
+        prev = MD5.new(prev + key + salt).digest()
+        key_iv += prev
+    return key_iv[:key_len], key_iv[key_len : key_len + iv_len]
+
+
+def reference_aes_decrypt(ciphertext_b64, key, iv=None):
+    ciphertext = base64.b64decode(ciphertext_b64)
+    key_encoded = key.encode()
+    iv_encoded = iv.encode() if iv is not None else iv
+    if ciphertext[:8] == b"Salted__":
+        salt = ciphertext[8:16]
+        ciphertext = ciphertext[16:]
+        key_encoded, iv_encoded = reference_aes_unsalt(key_encoded, salt)
+    decrypted = AES.new(key_encoded, AES.MODE_CBC, iv_encoded).decrypt(ciphertext)
+    return decrypted[: -decrypted[-1]].decode("latin-1")
+
+
+def reference_aes_encrypt(data, key, iv=None, hexed=False):
+    b_size = 16
+    data = data + (b_size - len(data) % b_size) * chr(b_size - len(data) % b_size)
+    key_encoded = key.encode() if not hexed else unhexlify(key)
+    iv_encoded = (iv.encode() if not hexed else unhexlify(iv)) if iv else None
+    cipher = AES.new(key_encoded, AES.MODE_CBC, iv_encoded)
+    return base64.b64encode(cipher.encrypt(data.encode()))
+
+
+def kk_keys(episode_id):
+    return [
+        f"|{n}|{episode_id}||mg3c3b04ba|2.8.10|{guid}|4830201|kisskh|kisskh|00|"
+        for n, guid in ((1, "VgV52sWhwvBSf8BsM3BRY9weWiiCbtGp"), (2, "62f1"))
+    ]
+
+
+def salted(plaintext, password):
+    salt = os.urandom(8)
+    key, iv = reference_aes_unsalt(password.encode(), salt)
+    pad_len = 16 - len(plaintext) % 16
+    ciphertext = AES.new(key, AES.MODE_CBC, iv).encrypt(
+        plaintext + bytes([pad_len]) * pad_len
+    )
+    return base64.b64encode(b"Salted__" + salt + ciphertext).decode()
+
+
+def report(name, reference_fn, new_fn, number):
+    reference = timeit.timeit(reference_fn, number=number) / number
+    new = timeit.timeit(new_fn, number=number) / number
+    print(
+        f"{name:>28} {reference * 1e6:>9.1f} us {new * 1e6:>9.1f} us"
+        f" {reference / new:>7.1f}x"
+    )
+
+
+def main():
+    print(f"{'workload':>28} {'reference':>12} {'crypto':>12} {'speedup':>8}")
+
+    subs, vid = kk_keys(1234)
+    assert [reference_aes_encrypt(k, _KK_KEY, _KK_IV, True) for k in (subs, vid)] == (
+        crypto.aes_encrypt_many([subs, vid], _KK_KEY, _KK_IV, True)
+    )
+    report(
+        "kisskh kkeys per episode",
+        lambda: [reference_aes_encrypt(k, _KK_KEY, _KK_IV, True) for k in (subs, vid)],
+        lambda: crypto.aes_encrypt_many([subs, vid], _KK_KEY, _KK_IV, True),
+        20000,
+    )
+
+    sources = json.dumps(
+        [
+            {"file": f"https://cdn.example/{n}/master.m3u8", "type": "hls"}
+            for n in range(4)
+        ]
+    ).encode()
+    ciphertext = salted(sources, "rabbit-password")
+    assert reference_aes_decrypt(ciphertext, "rabbit-password") == crypto.aes_decrypt(
+        ciphertext, "rabbit-password"
+    )
+    report(
+        "rabbit sources, same salt",
+        lambda: reference_aes_decrypt(ciphertext, "rabbit-password"),
+        lambda: crypto.aes_decrypt(ciphertext, "rabbit-password"),
+        20000,
+    )
+
+    ciphertexts = [salted(sources, "rabbit-password") for _ in range(20000)]
+    fresh = iter(ciphertexts)
+    fresh_reference = iter(ciphertexts)
+    report(
+        "rabbit sources, fresh salts",
+        lambda: reference_aes_decrypt(next(fresh_reference), "rabbit-password"),
+        lambda: crypto.aes_decrypt(next(fresh), "rabbit-password"),
+        20000,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Import time of the plugin, measured with python -X importtime in fresh
+interpreters that already imported mov-cli, like mov-cli does before loading
+its plugins: loading the plugin hook, then the default scraper, then all of them.
+
+    PYTHONPATH=. python benchmarks/bench_import.py
+"""
+
+import statistics
+import subprocess
+import sys
+
+RUNS = 5
+
+# mov-cli has these imported by the time it loads the plugin
+_MOV_CLI = "import mov_cli, mov_cli.scraper, mov_cli.media, mov_cli.utils, mov_cli.http_client\n"
+
+SCENARIOS = {
+    "plugin hook": "import consumet_mc",
+    "hook + hianime": (
+        "import consumet_mc; consumet_mc.plugin['scrapers']['DEFAULT'].load()"
+    ),
+    "hook + every scraper": (
+        "import consumet_mc\n"
+        "for scraper in consumet_mc.plugin['scrapers'].values(): scraper.load()"
+    ),
+}
+
+
+def import_time(code: str) -> float:
+    """microseconds spent in the imports of code"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _MOV_CLI + code],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    total = 0
+    started = False
+    for line in stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, package = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        # interpreter startup imports come first, then the ones of the code run
+        started = started or package.strip() == "consumet_mc"
+        # top level imports only, the nested ones are part of their parent's time
+        if started and not package.startswith("  "):
+            total += int(cumulative)
+    return total
+
+
+def main():
+    print(f"{'scenario':>22} {'median':>10} {'min':>10}")
+    for name, code in SCENARIOS.items():
+        import_time(code)  # warm the bytecode cache
+        times = [import_time(code) for _ in range(RUNS)]
+        print(
+            f"{name:>22} {statistics.median(times) / 1000:>7.1f} ms"
+            f" {min(times) / 1000:>7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Micro-benchmark of consumet_mc.utils.packer.unpack against the per keyword
+re.sub loop it replaced, on packed scripts of different sizes.
+
+    PYTHONPATH=. python benchmarks/bench_packer.py
+"""
+
+import random
+import re
+import timeit
+from functools import partial
+
+from consumet_mc.utils import packer
+from consumet_mc.utils.packer import _to_base
+
+
+def reference_replace_tokens(p, a, c, k):
+    for i in range(c - 1, 0, -1):
+        if k[i]:
+            p = re.sub(r"\b" + _to_base(i, a) + r"\b", k[i], p)
+    return p
+
+
+def player_script(lines: int, seed: int = 0) -> str:
+    """a jwplayer setup script shaped like the ones kwik/filemoon/streamwish serve"""
+    rnd = random.Random(seed)
+    prefixes = ["var", "fn", "cfg", "el", "src"]
+    words = [f"{rnd.choice(prefixes)}{i}" for i in range(lines)]
+    body = []
+    for i in range(lines):
+        name, other = rnd.choice(words), rnd.choice(words)
+        body.append(
+            f"var {name}=jwplayer('vplayer').setup({{sources:[{{file:'https://cdn{i}.example/"
+            f"hls/{other}/master.m3u8'}}],image:'{other}.jpg',width:'100%',height:'100%'}});"
+        )
+    return "".join(body)
+
+
+def pack(source: str, a: int = 62) -> str:
+    words = re.findall(r"\w+", source)
+    counts = {}
+    for word in words:
+        counts[word] = counts.get(word, 0) + 1
+    keywords = sorted(counts, key=lambda w: -counts[w])
+    indexes = {word: i for i, word in enumerate(keywords)}
+    p = re.sub(r"\w+", lambda m: _to_base(indexes[m.group(0)], a), source)
+    p = p.replace("'", "\\'")
+    k = "|".join(keywords)
+    return (
+        "eval(function(p,a,c,k,e,d){while(c--)if(k[c])p=p.replace(new RegExp("
+        "'\\\\b'+c.toString(a)+'\\\\b','g'),k[c]);return p}"
+        f"('{p}',{a},{len(keywords)},'{k}'.split('|'),0,{{}}))"
+    )
+
+
+def main():
+    print(
+        f"{'script':>12} {'keywords':>9} {'reference':>12}"
+        f" {'single pass':>12} {'speedup':>8}"
+    )
+    for lines in (10, 100, 1000):
+        packed = pack(player_script(lines))
+        match = re.search(r"\}\('(.*?);?',(\d+),(\d+),'(.*)'", packed)
+        assert match
+        p, a, c = match.group(1), int(match.group(2)), int(match.group(3))
+        k = match.group(4).split("|")
+
+        assert reference_replace_tokens(p, a, c, k) == packer._replace_tokens(
+            p, a, c, k
+        )
+
+        number = max(1, 200 // lines)
+        reference = timeit.timeit(
+            partial(reference_replace_tokens, p, a, c, k), number=number
+        )
+        single_pass = timeit.timeit(
+            partial(packer._replace_tokens, p, a, c, k), number=number
+        )
+        print(
+            f"{len(packed) // 1024:>9} KiB {c:>9} {reference / number * 1000:>9.2f} ms"
+            f" {single_pass / number * 1000:>9.2f} ms {reference / single_pass:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Micro-benchmark of the module level compiled regexes against re.search with a
+pattern string rebuilt in every call, on synthetic embed pages of different sizes.
+
+    PYTHONPATH=. python benchmarks/bench_regex.py
+"""
+
+import random
+import re
+import string
+import timeit
+from functools import partial
+
+from consumet_mc.extractors import voe
+
+_JUNK_PATTERNS = ["@$", "^^", "~@", "%?", "*~", "!!", "#&"]
+
+
+def embed_page(kib: int, seed: int = 0) -> str:
+    """an embed page of about kib KiB with the player json near its end"""
+    rnd = random.Random(seed)
+    filler = []
+    while sum(map(len, filler)) < kib * 1024:
+        word = "".join(rnd.choices(string.ascii_letters, k=rnd.randint(3, 12)))
+        filler.append(f'<div class="{word}">{word}</div>\n')
+    payload = "".join(
+        rnd.choice(string.ascii_letters) + rnd.choice(_JUNK_PATTERNS)
+        for _ in range(256)
+    )
+    return (
+        "".join(filler)
+        + f'<script type="application/json">["{payload}"]</script>\n'
+        + "<script>window.location.href = 'https://voe.example/e/abc';</script>"
+    )
+
+
+def cold_search(pattern, page):
+    re.purge()
+    return re.search(pattern, page)
+
+
+def main():
+    number = 200
+    raw_patterns = [
+        r"window\.location\.href = '(?P<url>[^']+)'",
+        r"<script type=\"application/json\">.*\[(.*?)\]</script>",
+    ]
+    compiled_patterns = [voe._PAGE_URL_REGEX, voe._ENCODED_STR_REGEX]
+
+    print(f"{'search':>14} {'page':>8} {'raw str':>10} {'compiled':>10} {'speedup':>8}")
+    for kib in (1, 16, 128):
+        page = embed_page(kib)
+        for raw, compiled in zip(raw_patterns, compiled_patterns):
+            assert re.search(raw, page).group(1) == compiled.search(page).group(1)
+            # re keeps a cache of 512 patterns, purge it to measure a cold lookup
+            # like a process that just loaded a plugin with dozens of patterns
+            raw_time = timeit.timeit(partial(cold_search, raw, page), number=number)
+            compiled_time = timeit.timeit(partial(compiled.search, page), number=number)
+            print(
+                f"{compiled.pattern[:14]:>14} {kib:>4} KiB"
+                f" {raw_time / number * 1e6:>7.1f} us {compiled_time / number * 1e6:>7.1f} us"
+                f" {raw_time / compiled_time:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Micro-benchmark of Voe._decrypt_encoded_str against the per character
+rot13/char shift pipeline it replaced, on synthetic payloads of different sizes.
+
+    PYTHONPATH=. python benchmarks/bench_voe.py
+"""
+
+import base64
+import json
+import random
+import re
+import timeit
+from functools import partial
+
+from consumet_mc.extractors.voe import Voe
+from consumet_mc.models.video_server import VideoServer
+from consumet_mc.utils.obfuscation import char_shift, rot13
+
+_JUNK_PATTERNS = ["@$", "^^", "~@", "%?", "*~", "!!", "#&"]
+
+
+def reference_decrypt_encoded_str(s):
+    result = []
+    for c in s:
+        if "A" <= c <= "Z":
+            result.append(chr((ord(c) - ord("A") + 13) % 26 + ord("A")))
+        elif "a" <= c <= "z":
+            result.append(chr((ord(c) - ord("a") + 13) % 26 + ord("a")))
+        else:
+            result.append(c)
+    s = "".join(result)
+    for pattern in _JUNK_PATTERNS:
+        s = re.sub(re.escape(pattern), "_", s)
+    s = s.replace("_", "")
+    try:
+        s = base64.b64decode(s).decode("utf-8")
+    except ValueError:
+        s = ""
+    s = "".join(chr(ord(c) - 3) for c in s)[::-1]
+    try:
+        s = base64.b64decode(s).decode("utf-8")
+    except ValueError:
+        s = ""
+    try:
+        return json.loads(s)
+    except ValueError:
+        return {}
+
+
+def payload(kib: int, seed: int = 0) -> str:
+    """a voe player json of about kib KiB once decoded, encoded the way voe serves it"""
+    rnd = random.Random(seed)
+    captions = []
+    while len(json.dumps(captions)) < kib * 1024:
+        lang = "".join(rnd.choices("abcdefghijklmnopqrstuvwxyz", k=2))
+        captions.append({"file": f"/engine/vtt/{lang}.vtt", "label": lang})
+    data = {
+        "site_name": "voe.example",
+        "source": "https://cdn.example/engine/hls/master.m3u8",
+        "captions": captions,
+    }
+    s = base64.b64encode(json.dumps(data).encode()).decode()
+    s = base64.b64encode(char_shift(s[::-1], -3).encode()).decode()
+    s = "".join(c + (rnd.choice(_JUNK_PATTERNS) if rnd.random() < 0.3 else "") for c in s)
+    return rot13(s)
+
+
+def main():
+    voe = Voe(None, VideoServer("voe", "https://voe.example/e/abc"))  # type: ignore
+    print(f"{'payload':>12} {'reference':>12} {'translate':>12} {'speedup':>8}")
+    for kib in (1, 16, 128):
+        encoded = payload(kib)
+        assert reference_decrypt_encoded_str(encoded) == voe._decrypt_encoded_str(encoded)
+
+        number = max(1, 256 // kib)
+        reference = timeit.timeit(
+            partial(reference_decrypt_encoded_str, encoded), number=number
+        )
+        translate = timeit.timeit(
+            partial(voe._decrypt_encoded_str, encoded), number=number
+        )
+        print(
+            f"{len(encoded) // 1024:>8} KiB {reference / number * 1000:>9.2f} ms"
+            f" {translate / number * 1000:>9.2f} ms {reference / translate:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Micro-benchmark of xor_bytes against the per byte loops it replaced in
+megacloud_getsrcs.i and the AllAnime source url decoding.
+
+    PYTHONPATH=. python benchmarks/bench_xor.py
+"""
+
+import os
+import timeit
+from functools import partial
+
+from consumet_mc.utils.obfuscation import xor_bytes
+
+
+def reference_xor(data, key):
+    a = bytearray(data)
+    for i in range(len(a)):
+        a[i] = a[i] ^ key[i % len(key)]
+    return bytes(a)
+
+
+def reference_xor_56(data):
+    return bytes([segment ^ 56 for segment in bytearray(data)])
+
+
+def main():
+    key = os.urandom(4)
+    print(
+        f"{'payload':>10} {'key':>4} {'reference':>12} {'xor_bytes':>12} {'speedup':>8}"
+    )
+    for size in (32, 1024, 32 * 1024, 1024 * 1024):
+        data = os.urandom(size)
+        cases = (
+            ("4 B", partial(reference_xor, data, key), partial(xor_bytes, data, key)),
+            ("1 B", partial(reference_xor_56, data), partial(xor_bytes, data, b"8")),
+        )
+        for label, reference_fn, xor_fn in cases:
+            assert reference_fn() == xor_fn()
+
+            number = max(1, 2**20 // (size * 4))
+            reference = timeit.timeit(reference_fn, number=number) / number
+            fast = timeit.timeit(xor_fn, number=number * 10) / (number * 10)
+            print(
+                f"{size:>8} B {label:>4} {reference * 1e6:>9.1f} us"
+                f" {fast * 1e6:>9.1f} us {reference / fast:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,40 +1,44 @@
 from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
+from .utils.lazy import LazyScraper
+
 if TYPE_CHECKING:
+    from typing import Any
+
     from mov_cli.plugins import PluginHookData
 
-from .providers import (
-    Kisskh,
-    HiAnime,
-    Flixhq,
-    AnimePahe,
-    Turkish,
-    ViewAsian,
-    DramaCool,
-    AllAnime,
-    AniWorld,
-    HiMovies,
-    Sflix,
-)
+# providers are only imported once mov-cli instantiates them,
+# so loading the plugin costs just the scraper the user picked
+_hianime = LazyScraper("consumet_mc.providers.hianime", "HiAnime")
 
 plugin: PluginHookData = {
     "version": 1,
     "package_name": "consumet-mc",  # Required for the plugin update checker.
     "scrapers": {
-        "hianime": HiAnime,
-        "animepahe": AnimePahe,
-        "allanime": AllAnime,
-        "aniworld": AniWorld,
-        "dramacool": DramaCool,
-        "kisskh": Kisskh,
-        "viewasian": ViewAsian,
-        "flixhq": Flixhq,
-        "himovies": HiMovies,
-        "sflix": Sflix,
-        "turkish": Turkish,
-        "DEFAULT": HiAnime,
+        "hianime": _hianime,
+        "animepahe": LazyScraper("consumet_mc.providers.animepahe", "AnimePahe"),
+        "allanime": LazyScraper("consumet_mc.providers.allanime", "AllAnime"),
+        "aniworld": LazyScraper("consumet_mc.providers.aniworld", "AniWorld"),
+        "dramacool": LazyScraper("consumet_mc.providers.dramacool", "DramaCool"),
+        "kisskh": LazyScraper("consumet_mc.providers.kisskh", "Kisskh"),
+        "viewasian": LazyScraper("consumet_mc.providers.viewasian", "ViewAsian"),
+        "flixhq": LazyScraper("consumet_mc.providers.flixhq", "Flixhq"),
+        "himovies": LazyScraper("consumet_mc.providers.himovies", "HiMovies"),
+        "sflix": LazyScraper("consumet_mc.providers.sflix", "Sflix"),
+        "turkish": LazyScraper("consumet_mc.providers.turkish", "Turkish"),
+        "DEFAULT": _hianime,
     },
 }
 
 __version__ = "1.1.1"
+
+
+def __getattr__(name: str) -> Any:
+    # the provider classes used to be imported here eagerly
+    from . import providers
+
+    if name in providers.__all__:
+        return getattr(providers, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import TYPE_CHECKING
+
+from devgoldyutils import LoggerAdapter
+from mov_cli.logger import mov_cli_logger
+
+from consumet_mc.utils.cache import TTLCache
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, List, Optional, Tuple
+
+# seconds a key endpoint gets to answer before its key is given up on
+KEY_FETCH_TIMEOUT = 5
+
+logger = LoggerAdapter(mov_cli_logger, prefix="AESKeys")
+
+# the keys rotate rarely, a stale one is dropped as soon as decryption fails with it
+_aes_keys = TTLCache(ttl=60 * 60)
+
+
+def decrypt_with_cached_key(
+    name: str,
+    fetch: Callable[[], Optional[str]],
+    decrypt: Callable[[str], Any],
+) -> Any:
+    """
+    Runs decrypt with the process wide cached aes key called name, fetching it on a miss.
+    A key that fails to decrypt is invalidated and, if it came from the cache, refetched once.
+    Returns None when no key works.
+    """
+    return decrypt_with_first_key([(name, fetch)], decrypt)
+
+
+def decrypt_with_first_key(
+    candidates: List[Tuple[str, Callable[[], Optional[str]]]],
+    decrypt: Callable[[str], Any],
+    timeout: float = KEY_FETCH_TIMEOUT,
+) -> Any:
+    """
+    decrypt_with_cached_key over several key endpoints. Cached keys are tried first,
+    the missing ones are fetched concurrently and tried in the order they arrive,
+    so an endpoint that is down or slow does not fail the decryption.
+    """
+    missing = []
+    for name, fetch in candidates:
+        aes_key = _aes_keys.get((name,))
+        if aes_key is None:
+            missing.append((name, fetch))
+            continue
+
+        try:
+            return decrypt(aes_key)
+        except Exception as e:
+            logger.debug(
+                f"cached aes key {name} failed, refetching it: {e}", exc_info=True
+            )
+            invalidate_aes_key(name)
+            missing.append((name, fetch))
+
+    if not missing:
+        return None
+
+    executor = ThreadPoolExecutor(max_workers=len(missing))
+    futures = {
+        executor.submit(_aes_keys.get_or_fetch, (name,), fetch): name
+        for name, fetch in missing
+    }
+    try:
+        for future in as_completed(futures, timeout=timeout):
+            name = futures[future]
+            try:
+                aes_key = future.result()
+            except Exception as e:
+                logger.debug(f"fetching aes key {name} failed: {e}", exc_info=True)
+                continue
+
+            if not aes_key:
+                continue
+
+            try:
+                return decrypt(aes_key)
+            except Exception as e:
+                logger.debug(f"aes key {name} failed: {e}", exc_info=True)
+                invalidate_aes_key(name)
+    except FuturesTimeoutError:
+        pass
+    finally:
+        executor.shutdown(wait=False)
+
+    return None
+
+
+def invalidate_aes_key(name: Optional[str] = None) -> None:
+    if name is None:
+        _aes_keys.invalidate()
+    else:
+        _aes_keys.invalidate(name)
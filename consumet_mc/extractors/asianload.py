@@ -10,6 +10,9 @@ from consumet_mc.utils.utils import USER_AGENT
 from consumet_mc.extractors.video_extractor import VideoExtractor
 
 
+_VIDEO_URL_REGEX = re.compile(r"window\.atob\([\"\']([^\"\']+)[\"\']\)")
+
+
 class AsianLoad(VideoExtractor):
     def extract(self) -> Source:
         videos = []
@@ -30,8 +33,7 @@ class AsianLoad(VideoExtractor):
             decoded_source = unpack(response.text)
 
             if decoded_source:
-                video_url_regex = r"window\.atob\([\"\']([^\"\']+)[\"\']\)"
-                match = re.search(video_url_regex, decoded_source)
+                match = _VIDEO_URL_REGEX.search(decoded_source)
                 if match:
                     video_url = match.group(1)
                     video_url = base64.b64decode(video_url).decode("utf-8")
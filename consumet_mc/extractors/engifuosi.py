@@ -7,6 +7,9 @@ from consumet_mc.utils.packer import unpack
 from consumet_mc.extractors.video_extractor import VideoExtractor
 
 
+_VIDEO_URL_REGEX = re.compile(r"file:\"([^\"]*)\"")
+
+
 class Engifuosi(VideoExtractor):
     def extract(self) -> Source:
         videos = []
@@ -16,8 +19,7 @@ class Engifuosi(VideoExtractor):
             response.raise_for_status()
             decoded_source = unpack(response.text)
             if decoded_source:
-                video_url_regex = r"file:\"([^\"]*)\""
-                match = re.search(video_url_regex, decoded_source)
+                match = _VIDEO_URL_REGEX.search(decoded_source)
                 if match:
                     video_url = match.group(1)
                     videos.append(
@@ -9,6 +9,10 @@ from consumet_mc.extractors.video_extractor import VideoExtractor
 from consumet_mc.models.video import Video
 
 
+_FILE_MOON_URL_REGEX = re.compile(r"<iframe[^>]*\s+src=\"([^\"]+)\"")
+_VIDEO_URL_REGEX = re.compile(r"https?:\/\/[^\"]+?\.m3u8[^\"]*")
+
+
 class Filemoon(VideoExtractor):
     def extract(self) -> Source:
         videos = []
@@ -36,8 +40,7 @@ class Filemoon(VideoExtractor):
             response = self.http_client.request("GET", self.server.url, headers=headers)
             response.raise_for_status()
 
-            file_moon_url_regex = r"<iframe[^>]*\s+src=\"([^\"]+)\""
-            match = re.search(file_moon_url_regex, response.text)
+            match = _FILE_MOON_URL_REGEX.search(response.text)
 
             if not match:
                 return Source([])
@@ -48,8 +51,7 @@ class Filemoon(VideoExtractor):
             decoded_source = unpack(response.text)
 
             if decoded_source:
-                video_url_regex = r"https?:\/\/[^\"]+?\.m3u8[^\"]*"
-                match = re.search(video_url_regex, decoded_source)
+                match = _VIDEO_URL_REGEX.search(decoded_source)
                 if match:
                     video_url = match.group(0)
                     videos.append(
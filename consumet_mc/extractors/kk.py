@@ -1,19 +1,26 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 from typing import TYPE_CHECKING
 
 from consumet_mc.models.source import Source
 from consumet_mc.models.subtitle import Subtitle
 from consumet_mc.utils import crypto
+from consumet_mc.utils.store import JSONStore
 
 if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Dict, Iterable, List, Optional, Tuple
+
     from mov_cli.http_client import HTTPClient
 
 from .video_extractor import VideoExtractor
 from consumet_mc.models.video import Video
 from consumet_mc.models.video_server import VideoServer
-from ctypes import c_int32
+
+# kkeys kept on disk, about 200 bytes each
+MAX_CACHED_KKEYS = 5000
 
 
 class KK(VideoExtractor):
@@ -29,30 +36,90 @@ class KK(VideoExtractor):
 
     def extract(self) -> Source:
         episode_id = str(self.server.extra_data["episode_id"])
-        kk_vid_key = [
-            "",
-            episode_id,
-            "",
-            "mg3c3b04ba",
-            self._appVer,
+        encrypted_vid_key, encrypted_subs_key = self.kkeys([episode_id])[episode_id]
+
+        vid_data_url = f"{self.server.url}?kkey={encrypted_vid_key}"
+        subs_data_url = (
+            f"{self.server.extra_data['subs_url']}?kkey={encrypted_subs_key}"
+        )
+
+        vid_data_response = self.http_client.request("GET", vid_data_url)
+        subs_data_reponse = self.http_client.request("GET", subs_data_url)
+
+        vid_data_response.raise_for_status()
+
+        vid_data = vid_data_response.json()
+        video = Video(vid_data["Video"], False)
+        subtitles = []
+
+        if subs_data_reponse.status_code == 200:
+            subs_data = subs_data_reponse.json()
+            for sub_data in subs_data:
+                subtitle = Subtitle(sub_data["src"], sub_data["label"])
+                subtitles.append(subtitle)
+
+        return Source([video], subtitles)
+
+    def kkeys(self, episode_ids: Iterable[str]) -> Dict[str, Tuple[str, str]]:
+        """
+        (vid kkey, subs kkey) of every episode, the ones not cached yet are
+        encrypted in one batch and persisted
+        """
+        kkeys: Dict[str, Tuple[str, str]] = {}
+        missing: List[str] = []
+        for episode_id in episode_ids:
+            cached = kkey_cache.get(self._cache_key(episode_id))
+            if cached is None:
+                missing.append(episode_id)
+            else:
+                kkeys[episode_id] = cached
+
+        if not missing:
+            return kkeys
+
+        tokens = []
+        for episode_id in missing:
+            tokens.append(self._token(episode_id, self._viGuid))
+            tokens.append(self._token(episode_id, self._subGuid))
+
+        encrypted = [
+            base64.b64decode(data).hex().upper()
+            for data in crypto.aes_encrypt_many(
+                tokens, self._aes_key, self._aes_iv, True
+            )
+        ]
+        computed = {
+            episode_id: (encrypted[2 * n], encrypted[2 * n + 1])
+            for n, episode_id in enumerate(missing)
+        }
+        kkey_cache.set_many(
+            {self._cache_key(episode_id): kkey for episode_id, kkey in computed.items()}
+        )
+        kkeys.update(computed)
+        return kkeys
+
+    def _cache_key(self, episode_id: str) -> str:
+        # every input of the kkeys, a new guid or aes key must not hit old entries
+        inputs = [
             self._viGuid,
+            self._subGuid,
+            self._aes_key,
+            self._aes_iv,
             self._platformVer,
+            self._appVer,
             self._appName,
-            self._appName,
-            self._appName,
-            self._appName,
-            self._appName,
-            self._appName,
-            "00",
-            "",
+            episode_id,
         ]
-        kk_subs_key = [
+        return hashlib.sha256("|".join(inputs).encode()).hexdigest()
+
+    def _token(self, episode_id: str, guid: str) -> str:
+        key = [
             "",
             episode_id,
             "",
             "mg3c3b04ba",
             self._appVer,
-            self._subGuid,
+            guid,
             self._platformVer,
             self._appName,
             self._appName,
@@ -63,58 +130,49 @@ class KK(VideoExtractor):
             "00",
             "",
         ]
+        key.insert(1, str(self._calculate_hash("|".join(key))))
+        return "|".join(key)
 
-        kk_vid_key_word = self._calculate_hash("|".join(kk_vid_key))
-        kk_subs_key_word = self._calculate_hash("|".join(kk_subs_key))
-
-        kk_vid_key.insert(1, str(kk_vid_key_word))
-        kk_subs_key.insert(1, str(kk_subs_key_word))
+    def _calculate_hash(self, token_str: str):
+        word = 0
 
-        encrypted_subs_key = (
-            base64.b64decode(
-                crypto.aes_encrypt(
-                    "|".join(kk_subs_key), self._aes_key, self._aes_iv, True
-                )
-            )
-            .hex()
-            .upper()
-        )
-        encrypted_vid_key = (
-            base64.b64decode(
-                crypto.aes_encrypt(
-                    "|".join(kk_vid_key), self._aes_key, self._aes_iv, True
-                )
+        for c in token_str:
+            # (word << 5) wrapped to a signed int32, as c_int32 did
+            word = (
+                (((word << 5) + 0x80000000) & 0xFFFFFFFF) - 0x80000000 - word + ord(c)
             )
-            .hex()
-            .upper()
-        )
 
-        vid_data_url = f"{self.server.url}?kkey={encrypted_vid_key}"
-        subs_data_url = (
-            f"{self.server.extra_data['subs_url']}?kkey={encrypted_subs_key}"
-        )
+        return word
 
-        vid_data_response = self.http_client.request("GET", vid_data_url)
-        subs_data_reponse = self.http_client.request("GET", subs_data_url)
 
-        vid_data_response.raise_for_status()
+class KKeyCache:
+    """
+    kkeys of kisskh episodes keyed by KK._cache_key, they never change for given
+    inputs so they are persisted between runs
+    """
 
-        vid_data = vid_data_response.json()
-        video = Video(vid_data["Video"], False)
-        subtitles = []
+    def __init__(
+        self, path: Optional[Path] = None, max_entries: int = MAX_CACHED_KKEYS
+    ) -> None:
+        self._store = JSONStore("kisskh_kkeys", path, max_entries=max_entries)
 
-        if subs_data_reponse.status_code == 200:
-            subs_data = subs_data_reponse.json()
-            for sub_data in subs_data:
-                subtitle = Subtitle(sub_data["src"], sub_data["label"])
-                subtitles.append((subtitle))
+    @property
+    def path(self) -> Path:
+        return self._store.path
 
-        return Source([video], subtitles)
+    def get(self, key: str) -> Optional[Tuple[str, str]]:
+        kkeys = self._store.get(key)
+        if kkeys is None:
+            return None
+        return kkeys[0], kkeys[1]
 
-    def _calculate_hash(self, token_str: str):
-        word = 0
+    def set_many(self, kkeys: Dict[str, Tuple[str, str]]) -> None:
+        self._store.set_many(
+            {key: [vid_kkey, subs_kkey] for key, (vid_kkey, subs_kkey) in kkeys.items()}
+        )
 
-        for i in range(len(token_str)):
-            word = c_int32((word << 5)).value - word + ord(token_str[i])
+    def clear(self) -> None:
+        self._store.clear()
 
-        return word
+
+kkey_cache = KKeyCache()
@@ -8,6 +8,9 @@ from consumet_mc.extractors.video_extractor import VideoExtractor
 from consumet_mc.models.video import Video
 
 
+_VIDEO_URL_REGEX = re.compile(r"source='([^']*)'")
+
+
 class Kwik(VideoExtractor):
     def extract(self) -> Source:
         videos = []
@@ -18,8 +21,7 @@ class Kwik(VideoExtractor):
             response.raise_for_status()
             decoded_source = unpack(response.text)
             if decoded_source:
-                video_url_regex = r"source='([^']*)'"
-                match = re.search(video_url_regex, decoded_source)
+                match = _VIDEO_URL_REGEX.search(decoded_source)
                 if match:
                     video_url = match.group(1)
                     videos.append(
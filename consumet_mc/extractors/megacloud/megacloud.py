@@ -1,13 +1,14 @@
 from __future__ import annotations
 import json
-import re
 
 
+from consumet_mc.extractors.aes_keys import KEY_FETCH_TIMEOUT, decrypt_with_cached_key
 from consumet_mc.extractors.video_extractor import VideoExtractor
 from consumet_mc.models.source import Source
 from consumet_mc.models.subtitle import Subtitle
 from consumet_mc.models.video import Video
 from consumet_mc.utils import crypto
+from consumet_mc.utils.utils import BASE_URL_REGEX
 
 
 class Megacloud(VideoExtractor):
@@ -17,8 +18,7 @@ class Megacloud(VideoExtractor):
         try:
             referer = str(self.server.extra_data["referer"])
             headers = {"Referer": referer, "X-Requested-With": "XMLHttpRequest"}
-            base_url_regx = r"https://[a-zA-Z0-9.]*"
-            match = re.match(base_url_regx, self.server.url)
+            match = BASE_URL_REGEX.match(self.server.url)
             if not match:
                 return Source([])
             base_url = match.group(0)
@@ -34,11 +34,15 @@ class Megacloud(VideoExtractor):
             data = response.json()
 
             sources_encrypted = data["sources"]
-            aes_key = self._get_aes_key()
-            if not aes_key:
-                return Source([])
-            sources_json_str = self._decrypte_sources(sources_encrypted, aes_key)
-            sources = json.loads(sources_json_str)
+            sources = decrypt_with_cached_key(
+                "key.hi-anime.site/key",
+                self._get_aes_key,
+                lambda aes_key: json.loads(
+                    self._decrypte_sources(sources_encrypted, aes_key)
+                ),
+            )
+            if not sources:
+                raise Exception(f"Failed to decrypted source url:{sources_encrypted}")
             tracks = data["tracks"]
             video_url = sources[0]["file"]
             video_type = sources[0]["type"]
@@ -57,7 +61,7 @@ class Megacloud(VideoExtractor):
     def _get_aes_key(self):
         try:
             url = "https://key.hi-anime.site/"
-            response = self.http_client.request("GET", url)
+            response = self.http_client.request("GET", url, timeout=KEY_FETCH_TIMEOUT)
             response.raise_for_status()
             data = response.json()
             aes_key = data["key"]
@@ -1,13007 +1,21 @@
+import sys
 from array import array
+from functools import lru_cache
 
-decoded_png = array(
-    "B",
-    [
-        246,
-        246,
-        246,
-        255,
-        226,
-        234,
-        236,
-        255,
-        113,
-        170,
-        187,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        0,
-        255,
-        255,
-        1,
-        60,
-        139,
-        163,
-        192,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        130,
-        180,
-        196,
-        254,
-        242,
-        243,
-        244,
-        254,
-        246,
-        246,
-        246,
-        254,
-        243,
-        244,
-        245,
-        254,
-        105,
-        165,
-        184,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        132,
-        181,
-        196,
-        254,
-        243,
-        245,
-        245,
-        254,
-        188,
-        212,
-        220,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        63,
-        142,
-        165,
-        254,
-        217,
-        230,
-        233,
-        254,
-        132,
-        181,
-        196,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        177,
-        206,
-        216,
-        254,
-        119,
-        174,
-        190,
-        255,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        164,
-        198,
-        210,
-        255,
-        119,
-        174,
-        190,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        165,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        165,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        165,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        165,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        165,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        165,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        165,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        165,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        165,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        165,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        165,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        165,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        165,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        165,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        165,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        165,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        165,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        165,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        140,
-        164,
-        255,
-        163,
-        198,
-        210,
-        254,
-        119,
-        174,
-        190,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        254,
-        163,
-        198,
-        210,
-        254,
-        119,
-        174,
-        190,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        254,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        254,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        174,
-        190,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        131,
-        180,
-        195,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        233,
-        239,
-        240,
-        255,
-        218,
-        230,
-        234,
-        255,
-        143,
-        187,
-        200,
-        255,
-        66,
-        143,
-        167,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        173,
-        190,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        223,
-        233,
-        236,
-        255,
-        136,
-        183,
-        197,
-        255,
-        69,
-        145,
-        168,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        174,
-        190,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        139,
-        184,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        242,
-        243,
-        244,
-        255,
-        219,
-        231,
-        235,
-        255,
-        217,
-        229,
-        233,
-        255,
-        217,
-        229,
-        233,
-        255,
-        217,
-        229,
-        233,
-        255,
-        217,
-        229,
-        233,
-        255,
-        217,
-        229,
-        233,
-        255,
-        217,
-        229,
-        233,
-        255,
-        217,
-        229,
-        233,
-        255,
-        217,
-        229,
-        233,
-        255,
-        217,
-        229,
-        233,
-        255,
-        217,
-        229,
-        233,
-        255,
-        217,
-        229,
-        233,
-        255,
-        217,
-        229,
-        233,
-        255,
-        217,
-        229,
-        233,
-        255,
-        217,
-        229,
-        233,
-        255,
-        97,
-        160,
-        180,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        174,
-        190,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        173,
-        190,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        165,
-        255,
-        60,
-        140,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        174,
-        190,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        174,
-        190,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        174,
-        190,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        173,
-        190,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        174,
-        190,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        139,
-        184,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        174,
-        190,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        173,
-        190,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        174,
-        190,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        241,
-        243,
-        244,
-        255,
-        227,
-        235,
-        238,
-        255,
-        243,
-        245,
-        245,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        230,
-        237,
-        239,
-        255,
-        239,
-        242,
-        243,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        233,
-        239,
-        241,
-        255,
-        235,
-        239,
-        241,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        239,
-        242,
-        243,
-        255,
-        230,
-        236,
-        239,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        174,
-        190,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        216,
-        230,
-        233,
-        255,
-        94,
-        160,
-        179,
-        255,
-        66,
-        143,
-        166,
-        255,
-        99,
-        161,
-        182,
-        255,
-        221,
-        232,
-        236,
-        255,
-        246,
-        246,
-        246,
-        255,
-        245,
-        245,
-        245,
-        255,
-        127,
-        178,
-        194,
-        255,
-        68,
-        144,
-        168,
-        255,
-        79,
-        150,
-        173,
-        255,
-        187,
-        213,
-        220,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        154,
-        193,
-        205,
-        255,
-        73,
-        147,
-        170,
-        255,
-        72,
-        146,
-        169,
-        255,
-        156,
-        194,
-        206,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        208,
-        223,
-        229,
-        255,
-        85,
-        154,
-        176,
-        255,
-        65,
-        143,
-        166,
-        255,
-        112,
-        169,
-        187,
-        255,
-        236,
-        240,
-        242,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        174,
-        190,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        165,
-        255,
-        60,
-        140,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        137,
-        184,
-        197,
-        255,
-        60,
-        140,
-        165,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        88,
-        156,
-        177,
-        255,
-        210,
-        226,
-        230,
-        255,
-        133,
-        181,
-        196,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        165,
-        255,
-        60,
-        140,
-        164,
-        255,
-        85,
-        154,
-        175,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        239,
-        242,
-        243,
-        255,
-        64,
-        143,
-        166,
-        255,
-        60,
-        140,
-        165,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        146,
-        189,
-        202,
-        255,
-        203,
-        221,
-        227,
-        255,
-        70,
-        145,
-        168,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        165,
-        255,
-        60,
-        140,
-        164,
-        255,
-        165,
-        200,
-        210,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        173,
-        190,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        137,
-        183,
-        198,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        67,
-        144,
-        167,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        86,
-        154,
-        175,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        237,
-        241,
-        242,
-        255,
-        64,
-        142,
-        166,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        64,
-        141,
-        166,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        164,
-        200,
-        211,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        163,
-        183,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        174,
-        190,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        139,
-        184,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        218,
-        230,
-        234,
-        255,
-        83,
-        153,
-        174,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        67,
-        144,
-        167,
-        255,
-        174,
-        206,
-        215,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        153,
-        193,
-        205,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        101,
-        163,
-        182,
-        255,
-        226,
-        235,
-        238,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        174,
-        190,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        213,
-        227,
-        231,
-        255,
-        85,
-        154,
-        175,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        64,
-        142,
-        165,
-        255,
-        178,
-        208,
-        216,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        242,
-        243,
-        244,
-        255,
-        148,
-        189,
-        203,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        97,
-        160,
-        180,
-        255,
-        231,
-        238,
-        240,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        173,
-        190,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        244,
-        245,
-        245,
-        255,
-        112,
-        169,
-        187,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        67,
-        143,
-        167,
-        255,
-        229,
-        236,
-        239,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        200,
-        220,
-        226,
-        255,
-        61,
-        141,
-        165,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        140,
-        186,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        174,
-        190,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        235,
-        240,
-        242,
-        255,
-        133,
-        181,
-        196,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        86,
-        155,
-        176,
-        255,
-        221,
-        232,
-        236,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        203,
-        221,
-        227,
-        255,
-        70,
-        145,
-        168,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        150,
-        191,
-        204,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        174,
-        190,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        165,
-        199,
-        210,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        115,
-        171,
-        188,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        245,
-        245,
-        245,
-        255,
-        83,
-        153,
-        174,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        61,
-        141,
-        165,
-        255,
-        192,
-        215,
-        222,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        174,
-        190,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        165,
-        255,
-        60,
-        140,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        131,
-        181,
-        196,
-        255,
-        60,
-        140,
-        165,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        67,
-        143,
-        168,
-        255,
-        140,
-        185,
-        200,
-        255,
-        83,
-        153,
-        174,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        165,
-        255,
-        60,
-        140,
-        164,
-        255,
-        79,
-        151,
-        173,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        231,
-        238,
-        240,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        165,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        89,
-        156,
-        177,
-        255,
-        124,
-        176,
-        192,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        165,
-        255,
-        60,
-        140,
-        164,
-        255,
-        158,
-        195,
-        207,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        173,
-        190,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        181,
-        208,
-        217,
-        255,
-        68,
-        144,
-        167,
-        255,
-        60,
-        139,
-        164,
-        255,
-        64,
-        141,
-        166,
-        255,
-        174,
-        205,
-        214,
-        255,
-        245,
-        246,
-        246,
-        255,
-        209,
-        224,
-        229,
-        255,
-        81,
-        151,
-        173,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        129,
-        179,
-        194,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        245,
-        246,
-        246,
-        255,
-        104,
-        165,
-        184,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        96,
-        160,
-        180,
-        255,
-        231,
-        237,
-        239,
-        255,
-        242,
-        244,
-        244,
-        255,
-        140,
-        185,
-        200,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        68,
-        144,
-        168,
-        255,
-        205,
-        222,
-        228,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        163,
-        183,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        174,
-        190,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        192,
-        215,
-        222,
-        255,
-        155,
-        194,
-        206,
-        255,
-        194,
-        216,
-        223,
-        255,
-        245,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        220,
-        231,
-        235,
-        255,
-        160,
-        197,
-        208,
-        255,
-        177,
-        207,
-        215,
-        255,
-        238,
-        242,
-        242,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        227,
-        236,
-        237,
-        255,
-        169,
-        202,
-        212,
-        255,
-        169,
-        202,
-        212,
-        255,
-        226,
-        234,
-        237,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        242,
-        244,
-        244,
-        255,
-        183,
-        210,
-        219,
-        255,
-        155,
-        194,
-        206,
-        255,
-        205,
-        222,
-        228,
-        255,
-        245,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        174,
-        190,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        173,
-        190,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        174,
-        190,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        139,
-        184,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        174,
-        190,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        215,
-        229,
-        233,
-        255,
-        222,
-        233,
-        236,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        223,
-        233,
-        236,
-        255,
-        213,
-        227,
-        232,
-        255,
-        245,
-        245,
-        245,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        174,
-        190,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        165,
-        255,
-        60,
-        140,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        242,
-        244,
-        244,
-        255,
-        111,
-        169,
-        186,
-        255,
-        60,
-        140,
-        165,
-        255,
-        64,
-        142,
-        166,
-        255,
-        132,
-        181,
-        196,
-        255,
-        216,
-        229,
-        233,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        222,
-        233,
-        236,
-        255,
-        164,
-        199,
-        210,
-        255,
-        97,
-        161,
-        180,
-        255,
-        73,
-        147,
-        170,
-        255,
-        106,
-        166,
-        184,
-        255,
-        178,
-        207,
-        216,
-        255,
-        235,
-        239,
-        242,
-        255,
-        246,
-        246,
-        246,
-        255,
-        241,
-        243,
-        244,
-        255,
-        201,
-        221,
-        226,
-        255,
-        117,
-        172,
-        189,
-        255,
-        61,
-        141,
-        165,
-        255,
-        61,
-        140,
-        164,
-        255,
-        138,
-        185,
-        198,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        173,
-        190,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        196,
-        217,
-        224,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        74,
-        147,
-        171,
-        255,
-        132,
-        181,
-        195,
-        255,
-        150,
-        191,
-        204,
-        255,
-        77,
-        149,
-        172,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        95,
-        160,
-        180,
-        255,
-        158,
-        196,
-        207,
-        255,
-        120,
-        173,
-        191,
-        255,
-        61,
-        140,
-        165,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        63,
-        141,
-        165,
-        255,
-        230,
-        237,
-        239,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        163,
-        183,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        174,
-        190,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        202,
-        221,
-        226,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        67,
-        144,
-        167,
-        255,
-        236,
-        241,
-        242,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        174,
-        190,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        165,
-        255,
-        60,
-        140,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        136,
-        183,
-        198,
-        255,
-        64,
-        142,
-        166,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        165,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        165,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        165,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        165,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        165,
-        255,
-        71,
-        145,
-        168,
-        255,
-        153,
-        192,
-        205,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        173,
-        190,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        206,
-        224,
-        229,
-        255,
-        118,
-        172,
-        190,
-        255,
-        64,
-        141,
-        165,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        95,
-        160,
-        180,
-        255,
-        143,
-        187,
-        200,
-        255,
-        87,
-        155,
-        176,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        63,
-        141,
-        165,
-        255,
-        134,
-        181,
-        196,
-        255,
-        225,
-        235,
-        237,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        163,
-        183,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        174,
-        190,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        139,
-        184,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        212,
-        227,
-        231,
-        255,
-        129,
-        179,
-        194,
-        255,
-        89,
-        157,
-        177,
-        255,
-        85,
-        154,
-        175,
-        255,
-        111,
-        169,
-        187,
-        255,
-        183,
-        210,
-        219,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        243,
-        245,
-        245,
-        255,
-        172,
-        203,
-        213,
-        255,
-        106,
-        165,
-        184,
-        255,
-        83,
-        153,
-        174,
-        255,
-        93,
-        159,
-        179,
-        255,
-        142,
-        187,
-        201,
-        255,
-        221,
-        231,
-        235,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        174,
-        190,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        244,
-        245,
-        246,
-        255,
-        244,
-        245,
-        245,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        243,
-        244,
-        245,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        174,
-        190,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        174,
-        190,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        163,
-        183,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        119,
-        174,
-        190,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        139,
-        185,
-        199,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        246,
-        246,
-        246,
-        255,
-        102,
-        164,
-        183,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        163,
-        198,
-        210,
-        255,
-        129,
-        180,
-        195,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        165,
-        255,
-        60,
-        140,
-        164,
-        255,
-        93,
-        158,
-        178,
-        255,
-        158,
-        196,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        159,
-        197,
-        207,
-        255,
-        156,
-        194,
-        207,
-        255,
-        69,
-        144,
-        168,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        169,
-        202,
-        212,
-        255,
-        176,
-        206,
-        215,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        203,
-        221,
-        227,
-        255,
-        234,
-        239,
-        240,
-        255,
-        84,
-        153,
-        175,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        107,
-        167,
-        185,
-        255,
-        241,
-        243,
-        244,
-        255,
-        246,
-        246,
-        246,
-        255,
-        203,
-        221,
-        227,
-        255,
-        85,
-        154,
-        176,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        60,
-        140,
-        164,
-        255,
-        60,
-        139,
-        164,
-        255,
-        92,
-        157,
-        179,
-        255,
-        222,
-        232,
-        236,
-        255,
-        246,
-        246,
-        246,
-        255,
-    ],
-)
+# rgba pixels of the 50x65 image megacloud's wasm reads back from its canvas
+_RESOURCE = "megacloud_decodedpng.bin"
+
+
+@lru_cache(maxsize=None)
+def decoded_png() -> array:
+    """Loads the pixels on first use, nothing is read when the module is imported"""
+    if sys.version_info >= (3, 9):
+        from importlib.resources import files
+
+        data = files(__package__).joinpath(_RESOURCE).read_bytes()
+    else:
+        from importlib.resources import read_binary
+
+        data = read_binary(__package__, _RESOURCE)
+
+    return array("B", data)
@@ -6,15 +6,18 @@ from consumet_mc.models.source import Source
 from consumet_mc.models.video import Video
 
 
+_VIDEO_URL_REGEX = re.compile(
+    r"(?<=player\.src\()\s*{\s*type:\s*\"[^\"]+\",\s*src:\s*\"([^\"]+)\"\s*}\s*(?=\);)"
+)
+
+
 class Mp4Upload(VideoExtractor):
     def extract(self) -> Source:
         videos = []
         try:
             response = self.http_client.request("GET", self.server.url, redirect=True)
             response.raise_for_status()
-            video_url_regex = r"(?<=player\.src\()\s*{\s*type:\s*\"[^\"]+\",\s*src:\s*\"([^\"]+)\"\s*}\s*(?=\);)"
-
-            match = re.search(video_url_regex, response.text)
+            match = _VIDEO_URL_REGEX.search(response.text)
             if match:
                 video_url = match.group(1)
                 videos.append(Video(video_url, True if ".m3u8" in video_url else False))
@@ -3,11 +3,18 @@ import json
 import re
 
 
+from consumet_mc.extractors.aes_keys import KEY_FETCH_TIMEOUT, decrypt_with_first_key
 from consumet_mc.extractors.video_extractor import VideoExtractor
 from consumet_mc.models.source import Source
 from consumet_mc.models.subtitle import Subtitle
 from consumet_mc.models.video import Video
 from consumet_mc.utils import crypto
+from consumet_mc.utils.utils import BASE_URL_REGEX
+
+
+_TOKEN_REGEX = re.compile(r"[a-zA-Z0-9]{48}")
+_LK_DB_REGEX = re.compile(r"window\._lk_db\s*=\s*({.*?});")
+_QUOTED_REGEX = re.compile(r'"(.*?)"')
 
 
 class RabbitStream(VideoExtractor):
@@ -15,8 +22,7 @@ class RabbitStream(VideoExtractor):
         videos = []
         subtitles = []
         try:
-            base_url_regx = r"https://[a-zA-Z0-9.]*"
-            match = re.match(base_url_regx, self.server.url)
+            match = BASE_URL_REGEX.match(self.server.url)
             if not match:
                 raise Exception(f"Invalid server url {self.server.url}")
             base_url = match.group(0)
@@ -28,16 +34,14 @@ class RabbitStream(VideoExtractor):
             response = self.http_client.request("GET", self.server.url, headers=headers)
             response.raise_for_status()
 
-            token_regx1 = r"[a-zA-Z0-9]{48}"
-            token_regx2 = r"window\._lk_db\s*=\s*({.*?});"
-            match = re.search(token_regx1, response.text)
+            match = _TOKEN_REGEX.search(response.text)
             token = None
             if match:
                 token = match.group(0)
             if not token:
-                match = re.search(token_regx2, response.text)
+                match = _LK_DB_REGEX.search(response.text)
                 if match:
-                    token_parts = re.findall(r'"(.*?)"', match.group(1))
+                    token_parts = _QUOTED_REGEX.findall(match.group(1))
                     token = "".join(token_parts)
 
             if not token:
@@ -55,21 +59,15 @@ class RabbitStream(VideoExtractor):
             sources_encrypted = data["encrypted"]
             sources = None
             if sources_encrypted:
-                aes_keys = []
-
-                aes_keys.append(self._get_aes_key1())
-                aes_keys.append(self._get_aes_key2())
-
-                for aes_key in aes_keys:
-                    try:
-                        if aes_key:
-                            sources_json_str = self._decrypte_sources(
-                                data["sources"], aes_key
-                            )
-                            sources = json.loads(sources_json_str)
-                            break
-                    except Exception:
-                        pass
+                sources = decrypt_with_first_key(
+                    [
+                        ("keys.hs.vc/rabbitstream", self._get_aes_key1),
+                        ("key.hi-anime.site/rabbit", self._get_aes_key2),
+                    ],
+                    lambda aes_key: json.loads(
+                        self._decrypte_sources(data["sources"], aes_key)
+                    ),
+                )
 
                 if not sources:
                     raise Exception(f"Failed to decrypted sources :{sources_encrypted}")
@@ -93,7 +91,7 @@ class RabbitStream(VideoExtractor):
 
     def _get_aes_key1(self):
         url = "https://keys.hs.vc/"
-        response = self.http_client.request("GET", url)
+        response = self.http_client.request("GET", url, timeout=KEY_FETCH_TIMEOUT)
         response.raise_for_status()
 
         aes_key = None
@@ -105,7 +103,7 @@ class RabbitStream(VideoExtractor):
 
     def _get_aes_key2(self):
         url = "https://key.hi-anime.site/"
-        response = self.http_client.request("GET", url)
+        response = self.http_client.request("GET", url, timeout=KEY_FETCH_TIMEOUT)
         response.raise_for_status()
 
         aes_key = None
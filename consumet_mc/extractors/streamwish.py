@@ -9,6 +9,9 @@ from consumet_mc.extractors.video_extractor import VideoExtractor
 from consumet_mc.models.video import Video
 
 
+_VIDEO_URL_REGEX = re.compile(r"https?:\/\/[^\"]+?\.m3u8[^\"]*")
+
+
 class StreamWish(VideoExtractor):
     def extract(self) -> Source:
         videos = []
@@ -37,8 +40,7 @@ class StreamWish(VideoExtractor):
             decoded_source = unpack(response.text)
 
             if decoded_source:
-                video_url_regex = r"https?:\/\/[^\"]+?\.m3u8[^\"]*"
-                match = re.search(video_url_regex, decoded_source)
+                match = _VIDEO_URL_REGEX.search(decoded_source)
                 if match:
                     video_url = match.group(0)
                     videos.append(
@@ -6,6 +6,8 @@ from consumet_mc.extractors.video_extractor import VideoExtractor
 from consumet_mc.models.source import Source
 from consumet_mc.models.video import Video
 
+_VIDEO_URL_REGEX = re.compile(r"var urlPlay = '(.*?)'")
+
 
 class Tukipasti(VideoExtractor):
     def extract(self) -> Source:
@@ -13,8 +15,7 @@ class Tukipasti(VideoExtractor):
         try:
             response = self.http_client.request("GET", self.server.url)
             response.raise_for_status()
-            video_url_regex = r"var urlPlay = '(.*?)'"
-            match = re.search(video_url_regex, response.text)
+            match = _VIDEO_URL_REGEX.search(response.text)
 
             if match:
                 video_url = match.group(1)
@@ -9,6 +9,9 @@ from consumet_mc.models.source import Source
 from consumet_mc.models.video import Video
 
 
+_VIDEO_URL_REGEX = re.compile(r"file:\s*\"([^\"]+)\"")
+
+
 class Vidmoly(VideoExtractor):
     def extract(self) -> Source:
         try:
@@ -18,9 +21,8 @@ class Vidmoly(VideoExtractor):
             )
             response.raise_for_status()
 
-            video_url_regex = r"file:\s*\"([^\"]+)\""
             video_url = str(
-                cast(re.Match, re.search(video_url_regex, response.text)).group(1)
+                cast(re.Match, _VIDEO_URL_REGEX.search(response.text)).group(1)
             )
             videos.append(Video(video_url, True if ".m3u8" in video_url else False))
             return Source(videos)
@@ -1,13 +1,14 @@
 from __future__ import annotations
 import json
-import re
 
 
+from consumet_mc.extractors.aes_keys import KEY_FETCH_TIMEOUT, decrypt_with_first_key
 from consumet_mc.extractors.video_extractor import VideoExtractor
 from consumet_mc.models.source import Source
 from consumet_mc.models.subtitle import Subtitle
 from consumet_mc.models.video import Video
 from consumet_mc.utils import crypto
+from consumet_mc.utils.utils import BASE_URL_REGEX
 
 
 class Vidzcloud(VideoExtractor):
@@ -15,9 +16,8 @@ class Vidzcloud(VideoExtractor):
         videos = []
         subtitles = []
         try:
-            base_url_regx = r"https://[a-zA-Z0-9.]*"
             headers = {"Referer": self.server.url, "X-Requested-With": "XMLHttpRequest"}
-            match = re.match(base_url_regx, self.server.url)
+            match = BASE_URL_REGEX.match(self.server.url)
             if not match:
                 return Source([])
             base_url = match.group(0)
@@ -32,21 +32,15 @@ class Vidzcloud(VideoExtractor):
 
             sources_encrypted = data["sources"]
             sources = None
-            aes_keys = []
-
-            aes_keys.append(self._get_aes_key1())
-            aes_keys.append(self._get_aes_key2())
-
-            for aes_key in aes_keys:
-                try:
-                    if aes_key:
-                        sources_json_str = self._decrypte_sources(
-                            sources_encrypted, aes_key
-                        )
-                        sources = json.loads(sources_json_str)
-                        break
-                except Exception:
-                    pass
+            sources = decrypt_with_first_key(
+                [
+                    ("keys.hs.vc/rabbitstream", self._get_aes_key1),
+                    ("key.hi-anime.site/rabbit", self._get_aes_key2),
+                ],
+                lambda aes_key: json.loads(
+                    self._decrypte_sources(sources_encrypted, aes_key)
+                ),
+            )
 
             if not sources:
                 raise Exception(f"Failed to decrypted source url:{sources_encrypted}")
@@ -68,7 +62,7 @@ class Vidzcloud(VideoExtractor):
 
     def _get_aes_key1(self):
         url = "https://keys.hs.vc/"
-        response = self.http_client.request("GET", url)
+        response = self.http_client.request("GET", url, timeout=KEY_FETCH_TIMEOUT)
         response.raise_for_status()
 
         aes_key = None
@@ -80,7 +74,7 @@ class Vidzcloud(VideoExtractor):
 
     def _get_aes_key2(self):
         url = "https://key.hi-anime.site/"
-        response = self.http_client.request("GET", url)
+        response = self.http_client.request("GET", url, timeout=KEY_FETCH_TIMEOUT)
         response.raise_for_status()
 
         aes_key = None
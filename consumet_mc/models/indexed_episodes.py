@@ -0,0 +1,12 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+from consumet_mc.models.episode import Episode
+
+
+@dataclass
+class IndexedEpisodes:
+    episodes: List[Episode] = field(default_factory=list)
+    # whatever the provider needs to refresh the list incrementally,
+    # e.g. the last page it fetched or the validators of the list response
+    state: Dict[str, Any] = field(default_factory=dict)
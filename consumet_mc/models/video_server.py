@@ -1,14 +1,72 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import threading
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Any, Dict
+    from typing import Any, Callable, Dict, Optional
+
+
+class NoServerUrlError(LookupError):
+    """a video server has neither a url nor a resolver to get one"""
 
 
-@dataclass
 class VideoServer:
-    name: str
-    url: str
-    extra_data: Dict[str, Any] = field(default_factory=dict)
+    def __init__(
+        self,
+        name: str,
+        url: Optional[str] = None,
+        extra_data: Optional[Dict[str, Any]] = None,
+        resolver: Optional[Callable[[], str]] = None,
+    ) -> None:
+        self.name = name
+        self.extra_data: Dict[str, Any] = extra_data if extra_data is not None else {}
+        # called once, on first access of url, when the embed link costs a request to get
+        self.resolver = resolver
+        self._url = url
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        if self._url is None:
+            with self._lock:
+                if self._url is None:
+                    if self.resolver is None:
+                        raise NoServerUrlError(f"video server {self.name} has no url")
+                    self._url = self.resolver()
+        return self._url
+
+    @url.setter
+    def url(self, url: str) -> None:
+        self._url = url
+
+    @property
+    def is_resolved(self) -> bool:
+        return self._url is not None
+
+    def _identity(self) -> tuple:
+        # a lazy server is the same server before and after its url is resolved
+        if self.resolver is not None:
+            return (self.name, self.resolver, self.extra_data)
+        return (self.name, self._url, self.extra_data)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, VideoServer):
+            return NotImplemented
+        return self._identity() == other._identity()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        url = self._url if self._url is not None else "<unresolved>"
+        return f"VideoServer(name={self.name!r}, url={url!r}, extra_data={self.extra_data!r})"
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # the lock cannot be copied or pickled, every copy gets its own
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
@@ -1,18 +1,40 @@
-from .provider import Provider
+from __future__ import annotations
 
-from .kisskh import Kisskh
+import importlib
+from typing import TYPE_CHECKING
 
-from .hianime import HiAnime
-from .flixhq import Flixhq
-from .animepahe import AnimePahe
+if TYPE_CHECKING:
+    from typing import Any
 
-from .turkish import Turkish
-from .viewasian import ViewAsian
-from .dramacool import DramaCool
-from .allanime import AllAnime
-from .himovies import HiMovies
-from .aniworld import AniWorld
-from .sflix import Sflix
+    from .provider import Provider
+    from .kisskh import Kisskh
+    from .hianime import HiAnime
+    from .flixhq import Flixhq
+    from .animepahe import AnimePahe
+    from .turkish import Turkish
+    from .viewasian import ViewAsian
+    from .dramacool import DramaCool
+    from .allanime import AllAnime
+    from .himovies import HiMovies
+    from .aniworld import AniWorld
+    from .sflix import Sflix
+
+# module of every provider, imported on first access so that importing one
+# provider does not pull in the others and their extractors
+_PROVIDER_MODULES = {
+    "Provider": ".provider",
+    "Kisskh": ".kisskh",
+    "HiAnime": ".hianime",
+    "Flixhq": ".flixhq",
+    "AnimePahe": ".animepahe",
+    "Turkish": ".turkish",
+    "ViewAsian": ".viewasian",
+    "DramaCool": ".dramacool",
+    "AllAnime": ".allanime",
+    "HiMovies": ".himovies",
+    "AniWorld": ".aniworld",
+    "Sflix": ".sflix",
+}
 
 
 __all__ = (
@@ -29,3 +51,17 @@ __all__ = (
     "AniWorld",
     "Sflix",
 )
+
+
+def __getattr__(name: str) -> Any:
+    module = _PROVIDER_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
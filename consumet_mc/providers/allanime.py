@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING, cast
 
 from consumet_mc.extractors.builtin import Builtin
@@ -8,14 +7,19 @@ from consumet_mc.extractors.filemoon import Filemoon
 from consumet_mc.extractors.mp4upload import Mp4Upload
 from consumet_mc.extractors.video_extractor import VideoExtractor
 from consumet_mc.models.episode import Episode
+from consumet_mc.models.indexed_episodes import IndexedEpisodes
 from consumet_mc.models.paged_result import PagedResult
 from consumet_mc.models.video_server import VideoServer
+from consumet_mc.utils.cache import TTLCache
+from consumet_mc.utils.graphql import GraphQLField, build_query, persisted_queries
+from consumet_mc.utils.obfuscation import xor_bytes
 
 from .provider import Provider
 
 if TYPE_CHECKING:
-    from typing import List, Optional
+    from typing import Any, Dict, List, Optional
 
+    from httpx import Response
     from mov_cli import Config
     from mov_cli.http_client import HTTPClient
     from mov_cli.scraper import ScrapeEpisodesT, ScraperOptionsT
@@ -25,6 +29,23 @@ from consumet_mc.utils.utils import USER_AGENT
 
 __all__ = ("AllAnime",)
 
+# source urls starting with "--" are hex of the url xored with this key
+_SOURCE_URL_KEY = bytes([56])
+
+_SHOWS_SELECTION = (
+    "pageInfo { total } edges { _id name thumbnail availableEpisodes type }"
+)
+_SHOW_SELECTION = "_id name availableEpisodesDetail"
+_EPISODE_SELECTION = "episodeString sourceUrls notes"
+
+# servers of the episode fetched along with an episode list,
+# keyed by (sub_or_dub, media_id, episode_id)
+_prefetched_servers = TTLCache(ttl=2 * 60)
+
+
+class AllAnimeAPIError(Exception):
+    """the allanime api answered without data"""
+
 
 class AllAnime(Provider):
     def __init__(
@@ -41,59 +62,36 @@ class AllAnime(Provider):
         return "https://api.allanime.day"
 
     def _search_title(self, query: str, page: int) -> PagedResult:
-        SEARCH_GQL = """
-        query (
-        $search: SearchInput
-        $limit: Int
-        $page: Int
-        $translationType: VaildTranslationTypeEnumType
-        $countryOrigin: VaildCountryOriginEnumType
-        ) {
-        shows(
-            search: $search
-            limit: $limit
-            page: $page
-            translationType: $translationType
-            countryOrigin: $countryOrigin
-        ) {
-            pageInfo {
-            total
-            }
-            edges {
-            _id
-            name
-            thumbnail
-            availableEpisodes
-            type
-            }
-        }
-        }
-        """
         try:
             sub_or_dub = cast(str, self.options.get("sub_or_dub", "sub"))
-            url = f"{self._base_url}/api"
-            variables = {
-                "search": {
-                    "allowAdult": False,
-                    "allowUnknown": False,
-                    "query": query,
-                },
-                "limit": 26,
-                "page": page,
-                "translationType": sub_or_dub,
-                "countryOrigin": "ALL",
-            }
-            json_variable_str = json.dumps(variables)
-            params = {"variables": json_variable_str, "query": SEARCH_GQL}
-            headers = {"User-Agent": USER_AGENT, "Referer": "https://allmanga.to"}
-            response = self.http_client.request(
-                "GET", url, headers=headers, params=params
+            data = self._graphql(
+                {
+                    "shows": GraphQLField(
+                        "shows",
+                        _SHOWS_SELECTION,
+                        {
+                            "search": (
+                                "SearchInput",
+                                {
+                                    "allowAdult": False,
+                                    "allowUnknown": False,
+                                    "query": query,
+                                },
+                            ),
+                            "limit": ("Int", 26),
+                            "page": ("Int", page),
+                            "translationType": (
+                                "VaildTranslationTypeEnumType",
+                                sub_or_dub,
+                            ),
+                            "countryOrigin": ("VaildCountryOriginEnumType", "ALL"),
+                        },
+                    )
+                }
             )
-            response.raise_for_status()
 
-            data = response.json()
             paged_result = PagedResult()
-            for item in data["data"]["shows"]["edges"]:
+            for item in data["shows"]["edges"]:
                 if not item["thumbnail"].startswith("https"):
                     item["thumbnail"] = (
                         f"{self._images_base_url}/{item['thumbnail']}?w=250"
@@ -117,65 +115,45 @@ class AllAnime(Provider):
     def _scrape_video_servers(
         self, episode_id: str, media_id: Optional[str] = None
     ) -> list[VideoServer]:
-        EPISODES_GQL = """
-        query (
-        $showId: String!
-        $translationType: VaildTranslationTypeEnumType!
-        $episodeString: String!
-        ) {
-        episode(
-            showId: $showId
-            translationType: $translationType
-            episodeString: $episodeString
-        ) {
-            episodeString
-            sourceUrls
-            notes
-        }
-        }
-        """
-
         try:
             sub_or_dub = cast(str, self.options.get("sub_or_dub", "sub"))
-            url = f"{self._base_url}/api"
-            variables = {
-                "showId": media_id,
-                "translationType": sub_or_dub,
-                "episodeString": episode_id,
-            }
-            json_variable_str = json.dumps(variables)
-            params = {"variables": json_variable_str, "query": EPISODES_GQL}
-            headers = {"User-Agent": USER_AGENT, "Referer": "https://allmanga.to"}
-            response = self.http_client.request(
-                "GET", url, headers=headers, params=params
+            key = (sub_or_dub, media_id, episode_id)
+            servers = _prefetched_servers.get(key)
+            if servers is not None:
+                # the servers hold signed urls, they are only handed out once
+                _prefetched_servers.invalidate(*key)
+                return servers
+
+            data = self._graphql(
+                {"episode": self._episode_field(cast(str, media_id), episode_id)}
             )
-            response.raise_for_status()
-
-            data = response.json()
-            servers = []
-
-            for item in data["data"]["episode"]["sourceUrls"]:
-                server_url = item.get("sourceUrl")
-                if not server_url:
-                    continue
-
-                if str(server_url).startswith("--"):
-                    server_url = bytes(
-                        [segment ^ 56 for segment in bytearray.fromhex(server_url[2:])]
-                    ).decode("utf-8")
-
-                servers.append(
-                    VideoServer(
-                        item["sourceName"].lower(),
-                        server_url,
-                        extra_data={"referer": self._base_url},
-                    )
-                )
-            return servers
+            return self._parse_video_servers(data["episode"])
 
         except Exception as e:
             raise e
 
+    def _parse_video_servers(self, episode: Dict[str, Any]) -> List[VideoServer]:
+        servers = []
+
+        for item in episode["sourceUrls"]:
+            server_url = item.get("sourceUrl")
+            if not server_url:
+                continue
+
+            if str(server_url).startswith("--"):
+                server_url = xor_bytes(
+                    bytes.fromhex(server_url[2:]), _SOURCE_URL_KEY
+                ).decode("utf-8")
+
+            servers.append(
+                VideoServer(
+                    item["sourceName"].lower(),
+                    server_url,
+                    extra_data={"referer": self._base_url},
+                )
+            )
+        return servers
+
     def _get_video_extractor(self, server: VideoServer) -> Optional[VideoExtractor]:
         if server.name == "yt-mp4":  # Builtin
             return Builtin(self.http_client, server)
@@ -191,39 +169,145 @@ class AllAnime(Provider):
     def _scrape_episodes(
         self, media_id: str, season_id: Optional[str] = None
     ) -> List[Episode]:
-        SHOW_GQL = """
-        query ($showId: String!) {
-        show(_id: $showId) {
-        _id
-        name
-        availableEpisodesDetail
-        }
-        }
-        """
+        try:
+            return cast(
+                IndexedEpisodes, self._scrape_episode_index(media_id, season_id, None)
+            ).episodes
+
+        except Exception as e:
+            raise e
+
+    def _scrape_episode_index(
+        self,
+        media_id: str,
+        season_id: Optional[str],
+        indexed: Optional[IndexedEpisodes],
+        wanted_episode: Optional[int] = None,
+    ) -> Optional[IndexedEpisodes]:
         try:
             sub_or_dub = cast(str, self.options.get("sub_or_dub", "sub"))
-            url = f"{self._base_url}/api"
-            variables = {
-                "showId": media_id,
-            }
-            json_variable_str = json.dumps(variables)
-            params = {"variables": json_variable_str, "query": SHOW_GQL}
-            headers = {"User-Agent": USER_AGENT, "Referer": "https://allmanga.to"}
-            response = self.http_client.request(
-                "GET", url, headers=headers, params=params
-            )
-            response.raise_for_status()
+            fields = {"show": self._show_field(media_id)}
+
+            wanted_str = self._wanted_episode_string(indexed, wanted_episode)
+            if wanted_str is not None:
+                # the sources change with every request so there is nothing to
+                # revalidate, the show comes along with them instead
+                fields["episode"] = self._episode_field(media_id, wanted_str)
+                response = self._graphql_request(
+                    "GET", self._graphql_url, self._graphql_headers, fields
+                )
+                response.raise_for_status()
+                validators: Dict[str, Any] = {}
+            else:
+                response, validators = self._revalidate(
+                    self._graphql_url,
+                    indexed,
+                    request=self._graphql_request,
+                    headers=self._graphql_headers,
+                    fields=fields,
+                )
+                if response is None:
+                    return IndexedEpisodes(
+                        cast(IndexedEpisodes, indexed).episodes, validators
+                    )
 
-            data = response.json()
+            data = self._graphql_data(response)
 
             episodes: List[Episode] = []
-            episode_strs = data["data"]["show"]["availableEpisodesDetail"][sub_or_dub]
+            episode_strs = data["show"]["availableEpisodesDetail"][sub_or_dub]
             episode_strs.reverse()
 
+            # kept only when the selector does pick that episode of the list
+            if (
+                wanted_str is not None
+                and wanted_episode is not None
+                and data.get("episode")
+                and episode_strs[wanted_episode - 1 : wanted_episode] == [wanted_str]
+            ):
+                _prefetched_servers.set(
+                    (sub_or_dub, media_id, wanted_str),
+                    self._parse_video_servers(data["episode"]),
+                )
+
             for i in range(len(episode_strs)):
                 episodes.append(Episode(episode_strs[i], 1, i + 1))
 
-            return episodes
+            return IndexedEpisodes(episodes, validators)
 
         except Exception as e:
             raise e
+
+    def _wanted_episode_string(
+        self, indexed: Optional[IndexedEpisodes], wanted_episode: Optional[int]
+    ) -> Optional[str]:
+        """
+        episode string of wanted_episode, a position in the episode list. Without
+        a list from an earlier visit it is guessed to be the number itself, which
+        misses for lists with an episode 0 or in between episodes like "5.5",
+        their sources are then not prefetched
+        """
+        if wanted_episode is None:
+            return None
+        if indexed is None:
+            return str(wanted_episode)
+        if 0 < wanted_episode <= len(indexed.episodes):
+            return indexed.episodes[wanted_episode - 1].id
+        return None
+
+    @property
+    def _graphql_url(self) -> str:
+        return f"{self._base_url}/api"
+
+    @property
+    def _graphql_headers(self) -> Dict[str, str]:
+        return {"User-Agent": USER_AGENT, "Referer": "https://allmanga.to"}
+
+    def _show_field(self, media_id: str) -> GraphQLField:
+        return GraphQLField("show", _SHOW_SELECTION, {"_id": ("String!", media_id)})
+
+    def _episode_field(self, media_id: str, episode_id: str) -> GraphQLField:
+        sub_or_dub = cast(str, self.options.get("sub_or_dub", "sub"))
+        return GraphQLField(
+            "episode",
+            _EPISODE_SELECTION,
+            {
+                "showId": ("String!", media_id),
+                "translationType": ("VaildTranslationTypeEnumType!", sub_or_dub),
+                "episodeString": ("String!", episode_id),
+            },
+        )
+
+    def _graphql(self, fields: Dict[str, GraphQLField]) -> Dict[str, Any]:
+        """
+        data of one request selecting every field under its alias
+        """
+        response = self._graphql_request(
+            "GET", self._graphql_url, self._graphql_headers, fields
+        )
+        response.raise_for_status()
+        return self._graphql_data(response)
+
+    def _graphql_request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        fields: Optional[Dict[str, GraphQLField]] = None,
+    ) -> Response:
+        query, variables = build_query(fields or {})
+        return persisted_queries.request(
+            lambda params: self.http_client.request(
+                method, url, headers=headers, params=params
+            ),
+            query,
+            variables,
+        )
+
+    def _graphql_data(self, response: Response) -> Dict[str, Any]:
+        data = response.json()
+        if not data.get("data"):
+            errors = data.get("errors") or [{}]
+            raise AllAnimeAPIError(
+                errors[0].get("message", "AllAnime api returned no data")
+            )
+        return data["data"]
@@ -1,17 +1,19 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, cast
 
 from consumet_mc.extractors.kwik import Kwik
 from consumet_mc.extractors.video_extractor import VideoExtractor
 from consumet_mc.models.episode import Episode
+from consumet_mc.models.indexed_episodes import IndexedEpisodes
 from consumet_mc.models.paged_result import PagedResult
 from consumet_mc.models.video_server import VideoServer
 
 from .provider import Provider
 
 if TYPE_CHECKING:
-    from typing import List, Optional
+    from typing import Any, Dict, List, Optional
 
     from mov_cli import Config
     from mov_cli.http_client import HTTPClient
@@ -138,25 +140,96 @@ class AnimePahe(Provider):
         self, media_id: str, season_id: Optional[str] = None
     ) -> List[Episode]:
         try:
-            current_page = 1
+            return cast(
+                IndexedEpisodes, self._scrape_episode_index(media_id, season_id, None)
+            ).episodes
+
+        except Exception as e:
+            raise e
+
+    def _scrape_episode_index(
+        self,
+        media_id: str,
+        season_id: Optional[str],
+        indexed: Optional[IndexedEpisodes],
+        wanted_episode: Optional[int] = None,
+    ) -> Optional[IndexedEpisodes]:
+        try:
+            # pages are sorted by episode, so only the last known page and the ones
+            # after it can have changed since the last visit
+            first_page = 1
             episodes: List[Episode] = []
-            while True:
-                url = f"{self._base_url}/api?m=release&id={media_id}&sort=episode_asc&page={str(current_page)}"
-                response = self.http_client.request(
-                    "GET", url, headers=self._headers(media_id)
-                )
-                response.raise_for_status()
+            if indexed is not None:
+                first_page = int(indexed.state["last_page"])
+                episodes = indexed.episodes[: int(indexed.state["last_page_offset"])]
+
+            pages = self._scrape_release_pages(media_id, first_page)
 
-                data = response.json()
+            # episodes were added or removed before the last known page
+            if indexed is not None and pages[0].get("from") != len(episodes) + 1:
+                return self._scrape_episode_index(
+                    media_id, season_id, None, wanted_episode
+                )
 
+            for data in pages:
                 for item in data["data"]:
                     episodes.append(Episode(item["session"], 1, item["episode"]))
 
-                if data["current_page"] == data["last_page"]:
-                    break
-                current_page += 1
+            return IndexedEpisodes(
+                episodes,
+                {
+                    "last_page": int(pages[-1]["current_page"]),
+                    "last_page_offset": len(episodes) - len(pages[-1]["data"]),
+                },
+            )
+
+        except Exception as e:
+            raise e
+
+    def _scrape_release_pages(
+        self, media_id: str, first_page: int
+    ) -> List[Dict[str, Any]]:
+        """
+        release pages from first_page to the last one, the pages after first_page
+        are fetched concurrently
+        """
+        try:
+            data = self._scrape_release_page(media_id, first_page)
+            pages = [data]
+
+            last_page = int(data["last_page"])
+            if last_page > first_page:
+                with ThreadPoolExecutor(
+                    max_workers=min(self._get_max_workers(), last_page - first_page)
+                ) as executor:
+                    futures = [
+                        executor.submit(self._scrape_release_page, media_id, page)
+                        for page in range(first_page + 1, last_page + 1)
+                    ]
+                    # read in page order, so when pages fail the error of the first
+                    # one is raised whichever finished first
+                    try:
+                        for future in futures:
+                            pages.append(future.result())
+                    except Exception:
+                        for future in futures:
+                            future.cancel()
+                        raise
+
+            return pages
+
+        except Exception as e:
+            raise e
+
+    def _scrape_release_page(self, media_id: str, page: int) -> Dict[str, Any]:
+        try:
+            url = f"{self._base_url}/api?m=release&id={media_id}&sort=episode_asc&page={str(page)}"
+            response = self.http_client.request(
+                "GET", url, headers=self._headers(media_id)
+            )
+            response.raise_for_status()
 
-            return episodes
+            return response.json()
 
         except Exception as e:
             raise e
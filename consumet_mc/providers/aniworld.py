@@ -26,8 +26,12 @@ if TYPE_CHECKING:
 
 from mov_cli import Metadata, MetadataType
 
+_HTML_TAG_REGEX = re.compile(r"<.*?>")
+
 
 class AniWorld(Provider):
+    _max_workers = 2
+
     def __init__(
         self,
         config: Config,
@@ -53,7 +57,7 @@ class AniWorld(Provider):
             data = response.json()
             paged_result = PagedResult()
             for i in data:
-                title = re.sub(r"<.*?>", "", i["title"])
+                title = _HTML_TAG_REGEX.sub("", i["title"])
                 paged_result.results.append(
                     Metadata(i["link"], title, MetadataType.MULTI)
                 )
@@ -78,7 +82,7 @@ class AniWorld(Provider):
             paged_result = PagedResult()
             for tag in div_tags:
                 title = str(cast(Tag, tag.select_one("a"))["title"])
-                title = re.sub(r"<.*?>", "", title)
+                title = _HTML_TAG_REGEX.sub("", title)
                 id = str(cast(Tag, tag.select_one("a"))["href"])
                 img_url = str(cast(Tag, tag.select_one("a > img"))["data-src"])
                 img_url = f"{self._base_url}{img_url}"
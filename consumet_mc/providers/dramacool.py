@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING, cast
 
 from bs4.element import Tag
@@ -165,13 +166,16 @@ class DramaCool(Provider):
                     cast(Tag, server_tag.select_one(".title")).text
                 ).lower()
 
-                server_url = self._scrape_video_server_data(
-                    server_data_type, server_data_post, server_data_nume
-                )
-
                 servers.append(
                     VideoServer(
-                        server_name, server_url, extra_data={"referer": self._base_url}
+                        server_name,
+                        extra_data={"referer": self._base_url},
+                        resolver=partial(
+                            self._scrape_video_server_data,
+                            server_data_type,
+                            server_data_post,
+                            server_data_nume,
+                        ),
                     )
                 )
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING, cast
 
 from bs4.element import Tag
@@ -104,7 +105,7 @@ class Flixhq(Provider):
     def _scrape_recent_movies(self):
         url = f"{self._base_url}/home"
         try:
-            response = self.http_client.request("GET", url)
+            response = self._request("GET", url, cache="catalog")
             response.raise_for_status()
             soup = self.soup(response.text)
 
@@ -164,7 +165,7 @@ class Flixhq(Provider):
     def _scrape_trending_movies(self):
         url = f"{self._base_url}/home"
         try:
-            response = self.http_client.request("GET", url)
+            response = self._request("GET", url, cache="catalog")
             response.raise_for_status()
             soup = self.soup(response.text)
 
@@ -224,7 +225,7 @@ class Flixhq(Provider):
     def _scrape_trending_tv_shows(self):
         url = f"{self._base_url}/home"
         try:
-            response = self.http_client.request("GET", url)
+            response = self._request("GET", url, cache="catalog")
             response.raise_for_status()
             soup = self.soup(response.text)
 
@@ -293,7 +294,7 @@ class Flixhq(Provider):
             else:
                 url = f"{self._base_url}/ajax/episode/list/{episode_id}"
 
-            response = self.http_client.request("GET", url)
+            response = self._request("GET", url, cache="servers")
             response.raise_for_status()
 
             soup = self.soup(response.text)
@@ -317,10 +318,11 @@ class Flixhq(Provider):
                         .lower()
                     )
 
-                server_url = self._scrape_video_server_data(data_id)
                 servers.append(
                     VideoServer(
-                        server_name, server_url, extra_data={"referer": self._base_url}
+                        server_name,
+                        extra_data={"referer": self._base_url},
+                        resolver=partial(self._scrape_video_server_data, data_id),
                     )
                 )
 
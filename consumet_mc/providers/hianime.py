@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING, cast
 
 from bs4.element import Tag
@@ -7,6 +8,7 @@ from bs4.element import Tag
 from consumet_mc.extractors.megacloud.megacloud import Megacloud
 from consumet_mc.extractors.video_extractor import VideoExtractor
 from consumet_mc.models.episode import Episode
+from consumet_mc.models.indexed_episodes import IndexedEpisodes
 from consumet_mc.models.paged_result import PagedResult
 from consumet_mc.models.video_server import VideoServer
 
@@ -107,7 +109,7 @@ class HiAnime(Provider):
 
     def _scrape_card_page(self, url: str) -> PagedResult:
         try:
-            response = self.http_client.request("GET", url)
+            response = self._request("GET", url, cache="catalog")
             response.raise_for_status()
             soup = self.soup(response.text)
 
@@ -152,7 +154,7 @@ class HiAnime(Provider):
     ) -> list[VideoServer]:
         try:
             url = f"{self._base_url}/ajax/v2/episode/servers?episodeId={episode_id}"
-            response = self.http_client.request("GET", url)
+            response = self._request("GET", url, cache="servers")
             response.raise_for_status()
 
             soup = self.soup(response.json()["html"])
@@ -161,29 +163,39 @@ class HiAnime(Provider):
             servers = []
 
             sub_or_dub = self.options.get("sub_or_dub", "sub")
+            selected_server_name = self.options.get("server")
 
+            # every filter runs before a server's link is resolved, so only the
+            # servers that can actually be played cost an ajax request
             for server_tag in server_tags:
+                data_type = cast(str, server_tag["data-type"])
+                if data_type != sub_or_dub:
+                    continue
+
                 server_name = (
                     str(cast(Tag, server_tag.select_one("a")).text).strip().lower()
                 )
-                data_id = cast(str, server_tag["data-id"])
-                data_type = cast(str, server_tag["data-type"])
 
                 # * megacloud -> HD-1 HD-2 HD-3
+                if "hd" not in server_name:
+                    continue
+
+                if (
+                    selected_server_name
+                    and server_name != str(selected_server_name).lower()
+                ):
+                    continue
 
-                if "hd" in server_name:
-                    server_url = self._scrape_video_server_data(data_id)
-
-                    if data_type == sub_or_dub:
-                        servers.append(
-                            VideoServer(
-                                server_name,
-                                server_url,
-                                extra_data={
-                                    "referer": self._base_url,
-                                },
-                            )
-                        )
+                data_id = cast(str, server_tag["data-id"])
+                servers.append(
+                    VideoServer(
+                        server_name,
+                        extra_data={
+                            "referer": self._base_url,
+                        },
+                        resolver=partial(self._scrape_video_server_data, data_id),
+                    )
+                )
             return servers
 
         except Exception as e:
@@ -207,14 +219,32 @@ class HiAnime(Provider):
     def _scrape_episodes(
         self, media_id: str, season_id: Optional[str] = None
     ) -> List[Episode]:
+        try:
+            return cast(
+                IndexedEpisodes, self._scrape_episode_index(media_id, season_id, None)
+            ).episodes
+
+        except Exception as e:
+            raise e
+
+    def _scrape_episode_index(
+        self,
+        media_id: str,
+        season_id: Optional[str],
+        indexed: Optional[IndexedEpisodes],
+        wanted_episode: Optional[int] = None,
+    ) -> Optional[IndexedEpisodes]:
         try:
             url = f"{self._base_url}/ajax/v2/episode/list/{media_id.split('-')[-1]}"
             headers = {
                 "X-Requested-with": "XMLHttpRequest",
                 "Referer": f"{self._base_url}/watch/{media_id}",
             }
-            response = self.http_client.request("GET", url, headers=headers)
-            response.raise_for_status()
+            response, validators = self._revalidate(url, indexed, headers=headers)
+            if response is None:
+                return IndexedEpisodes(
+                    cast(IndexedEpisodes, indexed).episodes, validators
+                )
 
             soup = self.soup(
                 response.json()["html"],
@@ -227,7 +257,7 @@ class HiAnime(Provider):
 
                 episodes.append(Episode(episode_id, 1, episode_number))
 
-            return episodes
+            return IndexedEpisodes(episodes, validators)
 
         except Exception as e:
             raise e
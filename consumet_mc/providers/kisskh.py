@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from re import error
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from consumet_mc.extractors.kk import KK
 from consumet_mc.extractors.video_extractor import VideoExtractor
 from consumet_mc.models.episode import Episode
+from consumet_mc.models.indexed_episodes import IndexedEpisodes
 from consumet_mc.models.paged_result import PagedResult
 from consumet_mc.models.video_server import VideoServer
 
@@ -126,10 +127,28 @@ class Kisskh(Provider):
     def _scrape_episodes(
         self, media_id: str, season_id: Optional[str] = None
     ) -> List[Episode]:
+        try:
+            return cast(
+                IndexedEpisodes, self._scrape_episode_index(media_id, season_id, None)
+            ).episodes
+
+        except error as e:
+            raise e
+
+    def _scrape_episode_index(
+        self,
+        media_id: str,
+        season_id: Optional[str],
+        indexed: Optional[IndexedEpisodes],
+        wanted_episode: Optional[int] = None,
+    ) -> Optional[IndexedEpisodes]:
         try:
             extra_metadata_url = f"{self._base_url}/DramaList/Drama/{media_id}"
-            response = self.http_client.request("GET", extra_metadata_url)
-            response.raise_for_status()
+            response, validators = self._revalidate(extra_metadata_url, indexed)
+            if response is None:
+                return IndexedEpisodes(
+                    cast(IndexedEpisodes, indexed).episodes, validators
+                )
             extra_metadata = response.json()
 
             episodes: List[Episode] = []
@@ -137,7 +156,7 @@ class Kisskh(Provider):
             for idx, ep in enumerate(reversed(extra_metadata["episodes"])):
                 episodes.append(Episode(ep["id"], 1, idx))
 
-            return episodes
+            return IndexedEpisodes(episodes, validators)
 
         except error as e:
             raise e
@@ -1,5 +1,17 @@
 from __future__ import annotations
 
+import hashlib
+import threading
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import nullcontext
 from typing import TYPE_CHECKING, cast
 
 from mov_cli.media import Metadata, MetadataType, Multi, Single
@@ -8,13 +20,32 @@ from mov_cli.utils import EpisodeSelector
 
 from consumet_mc.extractors.video_extractor import VideoExtractor
 from consumet_mc.models.episode import Episode
+from consumet_mc.models.indexed_episodes import IndexedEpisodes
 from consumet_mc.models.paged_result import PagedResult
 from consumet_mc.models.season import Season
+from consumet_mc.models.source import Source
 from consumet_mc.models.video_server import VideoServer
+from consumet_mc.utils.cache import SingleFlight, TTLCache
+from consumet_mc.utils.episode_index import episode_index
+from consumet_mc.utils.health import ServerHealth, scoreboard
+from consumet_mc.utils.host_limiter import HostLimiter
+from consumet_mc.utils.http_cache import TTL_CLASSES, http_cache
+from consumet_mc.utils.utils import signed_url_expiry
 
 if TYPE_CHECKING:
-    from typing import List, Optional
+    from typing import (
+        Any,
+        Callable,
+        Dict,
+        Hashable,
+        Iterable,
+        Iterator,
+        List,
+        Optional,
+        Tuple,
+    )
 
+    from httpx import Response
     from mov_cli import Config
     from mov_cli.http_client import HTTPClient
     from mov_cli.scraper import ScraperOptionsT
@@ -22,10 +53,40 @@ if TYPE_CHECKING:
 
 from abc import ABC, abstractmethod
 
+# seasons and episode lists shared by every provider instance in the process,
+# keyed by (provider, sub_or_dub, media_id, ...)
+_listing_cache = TTLCache(ttl=600)
+_in_flight_requests = SingleFlight()
+
+# media of the episodes resolved ahead of time in prefetch mode, keyed by
+# _prefetch_key. each one is handed out once
+_PREFETCH_TTL: float = 60 * 60
+_prefetched_media = TTLCache(ttl=_PREFETCH_TTL)
+_running_prefetches: Dict[Tuple[Hashable, ...], Future] = {}
+_prefetches_lock = threading.Lock()
+
+# seconds before a signed url expires that a prefetched media stops being served
+_SIGNED_URL_MARGIN = 60
+
 
 class Provider(Scraper, ABC):
     """A base class for building scrapers from."""
 
+    _listing_cache_ttl: float = 600
+    # upper bound of concurrent requests a provider makes for one lookup,
+    # can be overridden with the "max_workers" option
+    _max_workers: int = 4
+    # number of servers extracted at once in race mode, "race_size" option
+    _race_size: int = 3
+    # concurrent requests scrape_many makes to one host, "max_per_host" option
+    _max_per_host: int = 2
+    # seconds a prefetched next episode is kept, "prefetch_ttl" option. long enough
+    # to outlast the episode playing meanwhile, the expiry of a signed video url
+    # shortens it
+    _prefetch_ttl: float = _PREFETCH_TTL
+    # seconds scrape waits for a prefetch still running before scraping anew
+    _prefetch_wait: float = 30
+
     def __init__(
         self,
         config: Config,
@@ -82,6 +143,21 @@ class Provider(Scraper, ABC):
         """
         ...
 
+    def _scrape_episode_index(
+        self,
+        media_id: str,
+        season_id: Optional[str],
+        indexed: Optional[IndexedEpisodes],
+        wanted_episode: Optional[int] = None,
+    ) -> Optional[IndexedEpisodes]:
+        """
+        Where incremental scraping of episodes should be, indexed is what the last
+        visit scraped or None on the first one. Returning None leaves the episode
+        list to _scrape_episodes. wanted_episode is the number of the episode the
+        list is fetched to pick, if any, so its servers can come along with it
+        """
+        return None
+
     @abstractmethod
     def _get_video_extractor(self, server: VideoServer) -> Optional[VideoExtractor]:
         """
@@ -89,6 +165,257 @@ class Provider(Scraper, ABC):
         """
         ...
 
+    def _get_max_workers(self) -> int:
+        return max(1, int(self.options.get("max_workers", self._max_workers)))
+
+    def _request(
+        self, method: str, url: str, cache: str = "never", **kwargs: Any
+    ) -> Response:
+        """
+        http_client.request behind the on-disk response cache and request coalescing,
+        cache is the ttl class of the response, see TTL_CLASSES
+        """
+        ttl = TTL_CLASSES[cache]
+        key = http_cache.key(method, url, **kwargs)
+
+        def fetch() -> Response:
+            response = http_cache.get(key) if ttl else None
+            if response is None:
+                response = self.http_client.request(method, url, **kwargs)
+                http_cache.set(key, response, ttl)
+            return response
+
+        # identical reads already in flight are shared instead of sent again
+        if method.upper() in ("GET", "HEAD"):
+            return _in_flight_requests.do(key, fetch)
+        return fetch()
+
+    @property
+    def _provider_name(self) -> str:
+        return type(self).__name__.lower()
+
+    def _server_key(self, server: VideoServer) -> str:
+        return f"{self._provider_name}/{server.name}"
+
+    def _rank_video_servers(
+        self, video_servers: List[VideoServer]
+    ) -> List[VideoServer]:
+        """
+        order servers by their recorded health, leaving out the ones in cooldown
+        unless every server is. without any recorded health the page's order is kept
+        """
+        recorded = scoreboard.get_many(self._server_key(s) for s in video_servers)
+        if not recorded:
+            return video_servers
+
+        healths = [
+            (s, recorded.get(self._server_key(s)) or ServerHealth())
+            for s in video_servers
+        ]
+        available = [
+            (s, health) for s, health in healths if not scoreboard.in_cooldown(health)
+        ]
+        ranked = sorted(
+            available or healths, key=lambda item: scoreboard.score(item[1])
+        )
+        return [s for s, _ in ranked]
+
+    def _extract(
+        self, video_extractor: VideoExtractor, limiter: Optional[HostLimiter] = None
+    ) -> Source:
+        """
+        extract() that records the outcome on the server health scoreboard, holding a
+        limiter slot of the server's host when given one
+        """
+        server = video_extractor.server
+        key = self._server_key(server)
+        started = time.monotonic()
+        try:
+            if limiter is None:
+                slot = nullcontext()
+            else:
+                if not server.is_resolved:
+                    # resolving a lazy url is a request to the provider's own host
+                    with limiter.slot(self._base_url):
+                        server.url  # noqa: B018
+                slot = limiter.slot(server.url)
+            with slot:
+                source = video_extractor.extract()
+        except Exception:
+            scoreboard.record(key, False, time.monotonic() - started)
+            raise
+
+        scoreboard.record(key, bool(source.videos), time.monotonic() - started)
+        return source
+
+    def _is_race_mode(self) -> bool:
+        return str(self.options.get("race", False)).lower() in ("true", "1", "yes")
+
+    def _race_extract(
+        self,
+        video_extractors: List[VideoExtractor],
+        limiter: Optional[HostLimiter] = None,
+    ) -> Optional[Source]:
+        """
+        run extract() on up to race_size extractors at a time and return the first
+        source with videos, starting the next extractor in line whenever one fails
+        """
+        race_size = max(1, int(self.options.get("race_size", self._race_size)))
+        queue = list(video_extractors)
+        running: Dict[Future, VideoExtractor] = {}
+        error: Optional[Exception] = None
+
+        executor = ThreadPoolExecutor(max_workers=race_size)
+        try:
+            while queue or running:
+                while queue and len(running) < race_size:
+                    video_extractor = queue.pop(0)
+                    running[
+                        executor.submit(self._extract, video_extractor, limiter)
+                    ] = video_extractor
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                # checked in server order so ties go to the preferred server
+                for future in [f for f in running if f in done]:
+                    video_extractor = running.pop(future)
+                    try:
+                        source = future.result()
+                    except Exception as e:
+                        self.logger.debug(
+                            f"video server {video_extractor.server.name} failed: {e}",
+                            exc_info=True,
+                        )
+                        error = e
+                        continue
+
+                    if source.videos:
+                        return source
+
+            if error:
+                raise error
+            return None
+
+        finally:
+            # the losers are left to finish in the background, their results are ignored
+            for future in running:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _cache_key(self, media_id: str, *parts: str):
+        sub_or_dub = str(self.options.get("sub_or_dub", "sub"))
+        return (self._provider_name, sub_or_dub, media_id, *parts)
+
+    def _get_seasons(self, media_id: str) -> List[Season]:
+        """
+        cached wrapper around _scrape_seasons
+        """
+        key = self._cache_key(media_id, "seasons")
+        seasons = _listing_cache.get(key)
+        if seasons is None:
+            seasons = self._scrape_seasons(media_id)
+            _listing_cache.set(key, seasons, self._listing_cache_ttl)
+
+        return list(seasons)
+
+    def _get_episodes(
+        self,
+        media_id: str,
+        season_id: Optional[str] = None,
+        wanted_episode: Optional[int] = None,
+    ) -> List[Episode]:
+        """
+        cached wrapper around _scrape_episodes, see _scrape_episode_index for
+        wanted_episode
+        """
+        key = self._cache_key(media_id, "episodes", season_id or "")
+        episodes = _listing_cache.get(key)
+        if episodes is None:
+            episodes = self._get_indexed_episodes(media_id, season_id, wanted_episode)
+            _listing_cache.set(key, episodes, self._listing_cache_ttl)
+
+        return list(episodes)
+
+    def _get_indexed_episodes(
+        self,
+        media_id: str,
+        season_id: Optional[str] = None,
+        wanted_episode: Optional[int] = None,
+    ) -> List[Episode]:
+        """
+        episodes refreshed from the episode index of the last visit when the provider
+        supports it, scraped in full otherwise
+        """
+        index_key = "/".join(self._cache_key(media_id, "episodes", season_id or ""))
+        indexed = episode_index.get(index_key)
+        try:
+            refreshed = self._scrape_episode_index(
+                media_id, season_id, indexed, wanted_episode
+            )
+        except Exception as e:
+            if indexed is None:
+                raise
+            self.logger.debug(f"Incremental episode refresh of {media_id} failed: {e}")
+            refreshed = self._scrape_episode_index(
+                media_id, season_id, None, wanted_episode
+            )
+
+        if refreshed is None:
+            return self._scrape_episodes(media_id, season_id)
+
+        episode_index.set(index_key, refreshed)
+        return refreshed.episodes
+
+    def _revalidate(
+        self,
+        url: str,
+        indexed: Optional[IndexedEpisodes],
+        request: Optional[Callable[..., Response]] = None,
+        **kwargs: Any,
+    ) -> Tuple[Optional[Response], Dict[str, Any]]:
+        """
+        GET url conditionally on the validators stored in indexed, with request or
+        http_client.request. The response is None when the episode list did not
+        change since indexed was scraped, it comes with the validators to store in
+        the refreshed index
+        """
+        state = indexed.state if indexed is not None else {}
+        headers = dict(kwargs.pop("headers", None) or {})
+        if state.get("etag"):
+            headers["If-None-Match"] = state["etag"]
+        if state.get("last_modified"):
+            headers["If-Modified-Since"] = state["last_modified"]
+
+        request = request or self.http_client.request
+        response = request("GET", url, headers=headers, **kwargs)
+        if indexed is not None and response.status_code == 304:
+            return None, state
+
+        response.raise_for_status()
+        validators = {
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "digest": hashlib.sha256(response.content).hexdigest(),
+        }
+        # servers without validators still send the same body for an unchanged list
+        if indexed is not None and validators["digest"] == state.get("digest"):
+            return None, validators
+        return response, validators
+
+    def invalidate_cache(self, media_id: Optional[str] = None) -> None:
+        """
+        drop cached seasons, episodes and episode indexes of media_id, or of every
+        media of this provider
+        """
+        if media_id is None:
+            _listing_cache.invalidate(self._provider_name)
+            episode_index.invalidate(f"{self._provider_name}/")
+            return
+
+        for sub_or_dub in ("sub", "dub"):
+            _listing_cache.invalidate(self._provider_name, sub_or_dub, media_id)
+            episode_index.invalidate(f"{self._provider_name}/{sub_or_dub}/{media_id}/")
+
     def search(self, query: str, limit: Optional[int] = None) -> List[Metadata]:
         page = self.options.get("page", 1)
         page = int(page)
@@ -105,13 +432,32 @@ class Provider(Scraper, ABC):
 
     def scrape_episodes(self, metadata: Metadata) -> ScrapeEpisodesT:
         season_episodes = {}
-        seasons = self._scrape_seasons(metadata.id)
+        seasons = self._get_seasons(metadata.id)
         if seasons:
-            for season in seasons:
-                episodes = self._scrape_episodes(metadata.id, season.id)
-                season_episodes[season.season_number] = len(episodes)
+            errors = []
+            with ThreadPoolExecutor(
+                max_workers=min(self._get_max_workers(), len(seasons))
+            ) as executor:
+                futures = [
+                    executor.submit(self._get_episodes, metadata.id, season.id)
+                    for season in seasons
+                ]
+
+                for season, future in zip(seasons, futures):
+                    try:
+                        episodes = future.result()
+                    except Exception as e:  # noqa: BLE001
+                        self.logger.warning(
+                            f"Failed to scrape episodes of season {season.season_number}: {e}"
+                        )
+                        errors.append(e)
+                        continue
+                    season_episodes[season.season_number] = len(episodes)
+
+            if not season_episodes and errors:
+                raise errors[0]
         else:
-            episodes = self._scrape_episodes(metadata.id)
+            episodes = self._get_episodes(metadata.id)
             season_episodes[1] = len(episodes)
 
         return season_episodes
@@ -119,23 +465,194 @@ class Provider(Scraper, ABC):
     def scrape(
         self, metadata: Metadata, episode: EpisodeSelector
     ) -> Optional[Multi | Single]:
-        server_name = self.options.get("server")
+        media = None
+        if self._is_prefetch_mode():
+            media = self._take_prefetched(self._prefetch_key(metadata, episode))
+        if media is None:
+            selected_episode = self._select_episode(metadata, episode)
+            media = self._scrape_episode(metadata, episode, selected_episode)
+
+        if self._is_prefetch_mode():
+            self._prefetch_next(metadata, episode)
+
+        return media
+
+    def scrape_many(
+        self,
+        metadata: Metadata,
+        episodes: Optional[Iterable[EpisodeSelector]] = None,
+    ) -> Iterator[Tuple[EpisodeSelector, Optional[Multi | Single]]]:
+        """
+        scrape() of every episode, or of the whole show when episodes is None, yielding
+        (episode, media) as each one completes. Seasons and episode lists are fetched
+        once, then server discovery and extraction of the episodes run concurrently
+        with at most max_per_host requests to a host at a time. An episode that fails
+        is logged and yields None
+        """
+        if episodes is None:
+            episodes = [
+                EpisodeSelector(number, season)
+                for season, count in self.scrape_episodes(metadata).items()
+                for number in range(1, count + 1)
+            ]
+
+        # selected up front, so the listings are not fetched by several workers at once
+        selected = []
+        for episode in episodes:
+            try:
+                selected.append((episode, self._select_episode(metadata, episode)))
+            except Exception as e:  # noqa: BLE001
+                self.logger.warning(
+                    f"Failed to find episode {episode.episode} of season {episode.season}: {e}"
+                )
+                yield episode, None
+
+        if not selected:
+            return
+
+        limiter = HostLimiter(int(self.options.get("max_per_host", self._max_per_host)))
+        executor = ThreadPoolExecutor(
+            max_workers=min(self._get_max_workers(), len(selected))
+        )
+        futures: Dict[Future, EpisodeSelector] = {}
+        try:
+            for episode, selected_episode in selected:
+                future = executor.submit(
+                    self._scrape_episode, metadata, episode, selected_episode, limiter
+                )
+                futures[future] = episode
 
-        seasons = self._scrape_seasons(metadata.id)
+            for future in as_completed(futures):
+                episode = futures[future]
+                try:
+                    media = future.result()
+                except Exception as e:  # noqa: BLE001
+                    self.logger.warning(
+                        f"Failed to scrape episode {episode.episode} of season {episode.season}: {e}"
+                    )
+                    media = None
+                yield episode, media
+        finally:
+            # a consumer that stops early does not wait for the remaining episodes
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _is_prefetch_mode(self) -> bool:
+        return str(self.options.get("prefetch", False)).lower() in ("true", "1", "yes")
+
+    def _prefetch_key(self, metadata: Metadata, episode: EpisodeSelector):
+        server_name = str(self.options.get("server") or "")
+        return self._cache_key(
+            metadata.id, "media", str(episode.season), str(episode.episode), server_name
+        )
+
+    def _prefetch_next(self, metadata: Metadata, episode: EpisodeSelector) -> None:
+        """
+        resolve the episode after episode in a background thread, the first one of the
+        next season after the last episode of a season
+        """
+        next_episode = EpisodeSelector(episode.episode + 1, episode.season)
+        try:
+            selected_episode = self._select_episode(metadata, next_episode)
+        except IndexError:
+            if not self._get_seasons(metadata.id):
+                return
+            next_episode = EpisodeSelector(1, episode.season + 1)
+            try:
+                selected_episode = self._select_episode(metadata, next_episode)
+            except IndexError:
+                return
+
+        key = self._prefetch_key(metadata, next_episode)
+        with _prefetches_lock:
+            if key in _running_prefetches or _prefetched_media.get(key) is not None:
+                return
+            future: Future = Future()
+            _running_prefetches[key] = future
+
+        def prefetch() -> None:
+            media = None
+            try:
+                media = self._scrape_episode(metadata, next_episode, selected_episode)
+                if media is not None:
+                    _prefetched_media.set(key, media, self._prefetched_media_ttl(media))
+            except Exception as e:
+                self.logger.debug(
+                    f"Prefetching episode {next_episode.episode} of season {next_episode.season} failed: {e}",
+                    exc_info=True,
+                )
+            finally:
+                with _prefetches_lock:
+                    del _running_prefetches[key]
+                future.set_result(media)
+
+        threading.Thread(target=prefetch, daemon=True).start()
+
+    def _prefetched_media_ttl(self, media: Multi | Single) -> float:
+        ttl = float(self.options.get("prefetch_ttl", self._prefetch_ttl))
+        expires_at = signed_url_expiry(media.url)
+        if expires_at is not None:
+            ttl = min(ttl, expires_at - time.time() - _SIGNED_URL_MARGIN)
+        return ttl
+
+    def _take_prefetched(self, key) -> Optional[Multi | Single]:
+        """
+        the prefetched media of key, waiting for its prefetch if it is still running.
+        None once the wait times out, the episode is then scraped again
+        """
+        with _prefetches_lock:
+            future = _running_prefetches.get(key)
+        if future is not None:
+            try:
+                future.result(timeout=self._prefetch_wait)
+            except FutureTimeoutError:
+                self.logger.debug(
+                    f"Prefetch still running after {self._prefetch_wait}s, scraping anew"
+                )
+                return None
+
+        media = _prefetched_media.get(key)
+        if media is not None:
+            _prefetched_media.invalidate(*key)
+        return media
+
+    def _select_episode(self, metadata: Metadata, episode: EpisodeSelector) -> Episode:
+        seasons = self._get_seasons(metadata.id)
         if seasons:
             seasons.reverse()
             season_id = seasons[-episode.season].id
-            episodes = self._scrape_episodes(metadata.id, season_id)
+            episodes = self._get_episodes(metadata.id, season_id, episode.episode)
         else:
-            episodes = self._scrape_episodes(metadata.id)
+            episodes = self._get_episodes(metadata.id, wanted_episode=episode.episode)
 
         episodes.reverse()
-        selected_episode = episodes[-episode.episode]
+        return episodes[-episode.episode]
 
-        video_servers = self._scrape_video_servers(selected_episode.id, metadata.id)
+    def _scrape_episode(
+        self,
+        metadata: Metadata,
+        episode: EpisodeSelector,
+        selected_episode: Episode,
+        limiter: Optional[HostLimiter] = None,
+    ) -> Optional[Multi | Single]:
+        """
+        scrape() of an episode already picked from the episode list, holding a
+        limiter slot of the host of every request phase when given one
+        """
+        server_name = self.options.get("server")
+
+        slot = limiter.slot(self._base_url) if limiter else nullcontext()
+        with slot:
+            video_servers = self._scrape_video_servers(
+                selected_episode.id, metadata.id
+            )
+        if not server_name:
+            video_servers = self._rank_video_servers(video_servers)
 
         selected_server = None
         video_extractor = None
+        video_extractors: List[VideoExtractor] = []
 
         if server_name:
             for s in video_servers:
@@ -150,6 +667,14 @@ class Provider(Scraper, ABC):
             video_extractor = self._get_video_extractor(selected_server)
             if not video_extractor:
                 raise Exception(f"video server {server_name} is Unsupported")
+        elif self._is_race_mode():
+            video_extractors = []
+            for s in video_servers:
+                video_extractor = self._get_video_extractor(s)
+                if video_extractor:
+                    video_extractors.append(video_extractor)
+            if not video_extractors:
+                raise Exception("no supported video server found")
         else:
             for s in video_servers:
                 video_extractor = self._get_video_extractor(s)
@@ -158,8 +683,11 @@ class Provider(Scraper, ABC):
             if not video_extractor:
                 raise Exception("no supported video server found")
 
-        source = video_extractor.extract()
-        if not source.videos:
+        if video_extractors:
+            source = self._race_extract(video_extractors, limiter)
+        else:
+            source = self._extract(cast(VideoExtractor, video_extractor), limiter)
+        if not source or not source.videos:
             return None
 
         video = source.videos[0]
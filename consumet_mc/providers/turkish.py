@@ -27,6 +27,11 @@ from mov_cli import Metadata, MetadataType
 __all__ = ("Turkish",)
 
 
+_IMAGE_URL_REGEX = re.compile(r"url\((.*?)\)")
+_TUKIPASTI_REGEX = re.compile(r"\"(https:\/\/tukipasti.com\/t\/.*?)\"")
+_ENGIFUOSI_REGEX = re.compile(r"\"(https:\/\/engifuosi.com\/f\/.*?)\"")
+
+
 class Turkish(Provider):
     def __init__(
         self,
@@ -59,8 +64,7 @@ class Turkish(Provider):
                 )
                 title = str(cast(Tag, li_tag.select_one(".ss-title")).text)
                 style = str(cast(Tag, li_tag.select_one("a"))["style"])
-                image_url_regex = r"url\((.*?)\)"
-                image_url = str(cast(Match, re.search(image_url_regex, style)).group(1))
+                image_url = str(cast(Match, _IMAGE_URL_REGEX.search(style)).group(1))
 
                 paged_result.results.append(
                     Metadata(id, title, MetadataType.MULTI, image_url)
@@ -79,7 +83,7 @@ class Turkish(Provider):
     def _scrape_series_list(self):
         url = f"{self._base_url}/series-list/"
         try:
-            response = self.http_client.request("GET", url)
+            response = self._request("GET", url, cache="catalog")
             response.raise_for_status()
             soup = self.soup(response.text)
 
@@ -111,12 +115,9 @@ class Turkish(Provider):
             response = self.http_client.request("GET", url)
             response.raise_for_status()
 
-            tukipasti_regex = r"\"(https:\/\/tukipasti.com\/t\/.*?)\""
-            engifuosi_regex = r"\"(https:\/\/engifuosi.com\/f\/.*?)\""
-
-            tukipasti_match = re.search(tukipasti_regex, response.text)
+            tukipasti_match = _TUKIPASTI_REGEX.search(response.text)
 
-            engifuosi_match = re.search(engifuosi_regex, response.text)
+            engifuosi_match = _ENGIFUOSI_REGEX.search(response.text)
 
             servers = []
 
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from mov_cli.utils import get_cache_directory, what_platform
+
+
+def cache_directory() -> Path:
+    """directory consumet-mc persists its caches in"""
+    directory = get_cache_directory(what_platform()).joinpath("consumet-mc")
+    directory.mkdir(exist_ok=True)
+    return directory
+
+
+class TTLCache:
+    """A small thread safe in-memory cache whose entries expire after a ttl (in seconds)"""
+
+    def __init__(self, ttl: float = 600) -> None:
+        self.ttl = ttl
+        self._entries: Dict[Tuple[Hashable, ...], Tuple[float, Any]] = {}
+        # fetch lock of every key being fetched and the number of callers using it
+        self._fetch_locks: Dict[Tuple[Hashable, ...], List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[Hashable, ...], default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+
+            return value
+
+    def set(
+        self, key: Tuple[Hashable, ...], value: Any, ttl: Optional[float] = None
+    ) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+
+    def get_or_fetch(
+        self,
+        key: Tuple[Hashable, ...],
+        fetch: Callable[[], Any],
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """
+        return the cached value of key, calling fetch on a miss. concurrent misses
+        of the same key wait for a single fetch, a None result is not cached
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            entry = self._fetch_locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+
+        try:
+            with entry[0]:
+                # filled in by the fetch this caller waited for
+                value = self.get(key)
+                if value is None:
+                    value = fetch()
+                    if value is not None:
+                        self.set(key, value, ttl)
+                return value
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                # dropped by its last user, so callers still waiting keep sharing it
+                if entry[1] == 0 and self._fetch_locks.get(key) is entry:
+                    del self._fetch_locks[key]
+
+    def invalidate(self, *prefix: Hashable) -> None:
+        """
+        drop every entry whose key starts with prefix, or every entry if no prefix is given
+        """
+        with self._lock:
+            if not prefix:
+                self._entries.clear()
+                return
+
+            for key in [k for k in self._entries if k[: len(prefix)] == prefix]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            now = time.monotonic()
+            return sum(1 for expires_at, _ in self._entries.values() if expires_at > now)
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Runs one call per key at a time, concurrent callers of the same key share its result"""
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
@@ -1,12 +1,14 @@
 import base64
 from binascii import unhexlify
 import os
-from typing import Optional
+from typing import Iterable, List, Optional, Tuple
 from Crypto.Cipher import AES
 from Crypto.Hash import MD5
 
+_BLOCK_SIZE = 16
 
-def aes_unsalt(key: bytes, salt: bytes, key_len=32, iv_len=16):
+
+def aes_unsalt(key: bytes, salt: bytes, key_len=32, iv_len=16) -> Tuple[bytes, bytes]:
     key_iv = b""
     prev = b""
     while len(key_iv) < (key_len + iv_len):
@@ -15,37 +17,67 @@ def aes_unsalt(key: bytes, salt: bytes, key_len=32, iv_len=16):
     return key_iv[:key_len], key_iv[key_len : key_len + iv_len]
 
 
+def _encode(value: str, hexed: bool = False) -> bytes:
+    return unhexlify(value) if hexed else value.encode()
+
+
+def _pad(data: bytes) -> bytes:
+    # PKCS#7
+    pad_len = _BLOCK_SIZE - len(data) % _BLOCK_SIZE
+    return data + bytes((pad_len,)) * pad_len
+
+
+def _unpad(data: bytes) -> bytes:
+    return data[: -data[-1]]
+
+
 def aes_decrypt(ciphertext_b64: str, key: str, iv: Optional[str] = None):
-    ciphertext = base64.b64decode(ciphertext_b64)
-    key_encoded = key.encode()
-    iv_encoded = iv.encode() if iv is not None else iv
+    return aes_decrypt_many([ciphertext_b64], key, iv)[0]
+
+
+def aes_decrypt_many(
+    ciphertexts_b64: Iterable[str], key: str, iv: Optional[str] = None
+) -> List[str]:
+    """aes_decrypt of every ciphertext, encoding key and iv once"""
+    key_encoded = _encode(key)
+    iv_encoded = _encode(iv) if iv is not None else iv
 
-    if ciphertext[:8] == b"Salted__":
-        salt = ciphertext[8:16]
-        ciphertext = ciphertext[16:]
-        key_encoded, iv_encoded = aes_unsalt(key_encoded, salt)
+    decrypted = []
+    for ciphertext_b64 in ciphertexts_b64:
+        ciphertext = base64.b64decode(ciphertext_b64)
+        cipher_key, cipher_iv = key_encoded, iv_encoded
 
-    cipher = AES.new(key_encoded, AES.MODE_CBC, iv_encoded)
-    decrypted = cipher.decrypt(ciphertext)
+        if ciphertext[:8] == b"Salted__":
+            salt = ciphertext[8:16]
+            ciphertext = ciphertext[16:]
+            cipher_key, cipher_iv = aes_unsalt(key_encoded, salt)
 
-    # Remove PKCS#7 padding
-    pad_len = decrypted[-1]
-    return decrypted[:-pad_len].decode("latin-1")
+        cipher = AES.new(cipher_key, AES.MODE_CBC, cipher_iv)
+        decrypted.append(_unpad(cipher.decrypt(ciphertext)).decode("latin-1"))
+    return decrypted
 
 
 def aes_encrypt(
     data: str, key: str, iv: Optional[str] = None, hexed: Optional[bool] = False
 ) -> bytes:
-    b_size = 16
-    data = data + (b_size - len(data) % b_size) * chr(b_size - len(data) % b_size)
-    key_encoded = key.encode() if not hexed else unhexlify((key))
-    if iv:
-        iv_encoded = iv.encode() if not hexed else unhexlify(iv)
-    else:
-        iv_encoded = None
-
-    cipher = AES.new(key_encoded, AES.MODE_CBC, iv_encoded)
-    return base64.b64encode(cipher.encrypt(data.encode()))
+    return aes_encrypt_many([data], key, iv, hexed)[0]
+
+
+def aes_encrypt_many(
+    data: Iterable[str],
+    key: str,
+    iv: Optional[str] = None,
+    hexed: Optional[bool] = False,
+) -> List[bytes]:
+    """aes_encrypt of every item of data, encoding key and iv once"""
+    key_encoded = _encode(key, bool(hexed))
+    iv_encoded = _encode(iv, bool(hexed)) if iv else None
+
+    encrypted = []
+    for item in data:
+        cipher = AES.new(key_encoded, AES.MODE_CBC, iv_encoded)
+        encrypted.append(base64.b64encode(cipher.encrypt(_pad(item.encode()))))
+    return encrypted
 
 
 def get_random_values(arr_view: memoryview):
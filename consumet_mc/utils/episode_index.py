@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import time
+from dataclasses import asdict
+from typing import TYPE_CHECKING
+
+from consumet_mc.models.episode import Episode
+from consumet_mc.models.indexed_episodes import IndexedEpisodes
+from consumet_mc.utils.store import JSONStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Optional
+
+# seconds an index is kept after its last refresh
+MAX_INDEX_AGE = 30 * 24 * 60 * 60
+# shows indexed on disk, the least recently refreshed ones are dropped beyond it
+MAX_INDEXES = 2000
+
+
+class EpisodeIndex:
+    """
+    Episode lists as of the last visit of a show, so providers can refresh them
+    incrementally
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_age: float = MAX_INDEX_AGE,
+        max_entries: int = MAX_INDEXES,
+    ) -> None:
+        self.max_age = max_age
+        self._store = JSONStore("episode_index", path, max_entries=max_entries)
+
+    @property
+    def path(self) -> Path:
+        return self._store.path
+
+    def get(self, key: str) -> Optional[IndexedEpisodes]:
+        data = self._store.get(key)
+        if data is None or data["updated_at"] <= time.time() - self.max_age:
+            return None
+
+        return IndexedEpisodes(
+            [Episode(**episode) for episode in data["episodes"]], data["state"]
+        )
+
+    def set(self, key: str, indexed: IndexedEpisodes) -> None:
+        self._store.set_many(
+            {
+                key: {
+                    "episodes": [asdict(episode) for episode in indexed.episodes],
+                    "state": indexed.state,
+                    "updated_at": time.time(),
+                }
+            }
+        )
+
+    def invalidate(self, prefix: str = "") -> None:
+        """
+        drop every index whose key starts with prefix
+        """
+        self._store.invalidate(prefix)
+
+
+episode_index = EpisodeIndex()
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+    from httpx import Response
+
+_NOT_FOUND = ("PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND")
+_NOT_SUPPORTED = ("PersistedQueryNotSupported", "PERSISTED_QUERY_NOT_SUPPORTED")
+
+
+@dataclass
+class GraphQLField:
+    name: str
+    selection: str
+    # argument name -> (graphql type, value)
+    arguments: Dict[str, Tuple[str, Any]] = field(default_factory=dict)
+
+
+def build_query(fields: Dict[str, GraphQLField]) -> Tuple[str, Dict[str, Any]]:
+    """
+    one query selecting every field under its alias, the variables of each field
+    are prefixed with its alias so fields with the same arguments do not clash
+    """
+    declarations = []
+    selections = []
+    variables: Dict[str, Any] = {}
+    for alias, gql_field in fields.items():
+        arguments = []
+        for argument, (gql_type, value) in gql_field.arguments.items():
+            variable = f"{alias}_{argument}"
+            declarations.append(f"${variable}: {gql_type}")
+            arguments.append(f"{argument}: ${variable}")
+            variables[variable] = value
+
+        arguments_str = f"({', '.join(arguments)})" if arguments else ""
+        selections.append(
+            f"{alias}: {gql_field.name}{arguments_str} {{ {gql_field.selection} }}"
+        )
+
+    declarations_str = f"({', '.join(declarations)}) " if declarations else ""
+    return f"query {declarations_str}{{ {' '.join(selections)} }}", variables
+
+
+class PersistedQueries:
+    """
+    Automatic persisted queries: a query is sent in full along with its sha256 the
+    first time, afterwards the hash alone stands in for it. Falls back to full
+    queries for good once the server reports it does not support them
+    """
+
+    def __init__(self) -> None:
+        self.supported = True
+        self._registered: Set[str] = set()
+        # queries whose hash alone was rejected for something else than a missing query
+        self._refused: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def request(
+        self,
+        send: Callable[[Dict[str, str]], Response],
+        query: str,
+        variables: Dict[str, Any],
+    ) -> Response:
+        """
+        send the get params of query with variables, send returns the response
+        """
+        digest = hashlib.sha256(query.encode()).hexdigest()
+        extensions = json.dumps(
+            {"persistedQuery": {"version": 1, "sha256Hash": digest}},
+            separators=(",", ":"),
+        )
+        variables_str = json.dumps(variables, separators=(",", ":"))
+
+        if self.supported and digest in self._registered:
+            response = send({"variables": variables_str, "extensions": extensions})
+            error = _persisted_query_error(response)
+            if error is None:
+                return response
+
+            with self._lock:
+                self._registered.discard(digest)
+                # only the server saying so turns them off for every query, a hash
+                # rejected otherwise, e.g. by a server ignoring the extension, is
+                # not tried again. a server error is no rejection
+                if error in _NOT_SUPPORTED:
+                    self.supported = False
+                elif error not in _NOT_FOUND and response.status_code < 500:
+                    self._refused.add(digest)
+
+        params = {"variables": variables_str, "query": query}
+        if self.supported:
+            params["extensions"] = extensions
+
+        response = send(params)
+        if not self.supported:
+            return response
+
+        error = _persisted_query_error(response)
+        if error in _NOT_SUPPORTED:
+            with self._lock:
+                self.supported = False
+            del params["extensions"]
+            return send(params)
+
+        if error is None and response.is_success:
+            with self._lock:
+                if digest not in self._refused:
+                    self._registered.add(digest)
+        return response
+
+
+def _persisted_query_error(response: Response) -> Optional[str]:
+    if response.status_code == 304:
+        return None
+
+    # most responses are answers, they are only parsed when they may be errors
+    content = response.content
+    if response.is_success and b'"errors"' not in content:
+        return None
+
+    try:
+        data = response.json()
+    except ValueError:
+        return "invalid response"
+
+    if not isinstance(data, dict):
+        return "invalid response"
+
+    errors = data.get("errors") or []
+    for error in errors:
+        message = error.get("message", "")
+        code = (error.get("extensions") or {}).get("code", "")
+        for name in _NOT_FOUND + _NOT_SUPPORTED:
+            if name in (message, code):
+                return name
+
+    if not response.is_success or (errors and not data.get("data")):
+        return errors[0].get("message", "error") if errors else "error"
+    return None
+
+
+persisted_queries = PersistedQueries()
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from consumet_mc.utils.store import JSONStore
+
+# latencies kept per server for the percentiles
+MAX_LATENCY_SAMPLES = 50
+
+
+@dataclass
+class ServerHealth:
+    successes: int = field(default=0)
+    failures: int = field(default=0)
+    consecutive_failures: int = field(default=0)
+    last_failure: Optional[float] = field(default=None)
+    latencies: List[float] = field(default_factory=list)
+
+    @property
+    def success_rate(self) -> float:
+        # smoothed so a server that was never tried ranks at 0.5
+        return (self.successes + 1) / (self.successes + self.failures + 2)
+
+    @property
+    def p50(self) -> Optional[float]:
+        return self._percentile(0.50)
+
+    @property
+    def p95(self) -> Optional[float]:
+        return self._percentile(0.95)
+
+    def _percentile(self, q: float) -> Optional[float]:
+        if not self.latencies:
+            return None
+        latencies = sorted(self.latencies)
+        return latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+
+
+class HealthScoreboard:
+    """
+    Success rate, extraction latency and last failure of every video server,
+    keyed by "<provider>/<server>" and persisted between runs
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        cooldown: float = 15 * 60,
+        max_consecutive_failures: int = 3,
+    ) -> None:
+        self.cooldown = cooldown
+        self.max_consecutive_failures = max_consecutive_failures
+        self._store = JSONStore("server_health", path)
+
+    @property
+    def path(self) -> Path:
+        return self._store.path
+
+    def get(self, key: str) -> ServerHealth:
+        return _server_health(self._store.get(key))
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, ServerHealth]:
+        """
+        health of every key with a recorded extraction
+        """
+        return {
+            key: _server_health(data)
+            for key, data in self._store.get_many(keys).items()
+        }
+
+    def record(self, key: str, success: bool, latency: float) -> None:
+        def update(data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+            health = _server_health(data)
+            if success:
+                health.successes += 1
+                health.consecutive_failures = 0
+                health.latencies.append(round(latency, 3))
+                del health.latencies[:-MAX_LATENCY_SAMPLES]
+            else:
+                health.failures += 1
+                health.consecutive_failures += 1
+                health.last_failure = time.time()
+            return asdict(health)
+
+        # merged with what other processes recorded in the meantime
+        self._store.update(key, update)
+
+    def in_cooldown(self, health: ServerHealth) -> bool:
+        if health.consecutive_failures < self.max_consecutive_failures:
+            return False
+        return time.time() - (health.last_failure or 0) < self.cooldown
+
+    def score(self, health: ServerHealth):
+        """
+        sort key, lower is more promising. success rate is bucketed so latency
+        breaks ties between servers that work about as often, the median first and
+        then the tail. servers without a recorded latency go after the ones with one
+        """
+        p50, p95 = health.p50, health.p95
+        return (
+            -round(health.success_rate, 1),
+            float("inf") if p50 is None else p50,
+            float("inf") if p95 is None else p95,
+        )
+
+    def reset(self) -> None:
+        self._store.clear()
+
+
+def _server_health(data: Optional[Dict[str, Any]]) -> ServerHealth:
+    try:
+        return ServerHealth(**(data or {}))
+    except TypeError:
+        return ServerHealth()
+
+
+scoreboard = HealthScoreboard()
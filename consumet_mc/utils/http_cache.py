@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import httpx
+
+from consumet_mc.utils.cache import cache_directory
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, Optional
+
+# seconds a response of each ttl class stays fresh, providers pick one per request
+TTL_CLASSES: Dict[str, float] = {
+    "catalog": 60 * 60,
+    "servers": 2 * 60,
+    "never": 0,
+}
+
+# headers that describe the raw body, they no longer apply to the decoded content we store
+_DROPPED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+
+class HTTPCache:
+    """
+    On-disk cache of successful http responses, backed by sqlite so several
+    processes on one host can share it
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self._path = path
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        if self._path is None:
+            self._path = cache_directory().joinpath("http_cache.sqlite3")
+        return self._path
+
+    @staticmethod
+    def key(method: str, url: str, **kwargs: Any) -> str:
+        """
+        hash of everything that makes two requests return different responses
+        """
+        parts = {
+            "method": method.upper(),
+            "url": url,
+            "params": kwargs.get("params"),
+            "headers": kwargs.get("headers"),
+            "data": kwargs.get("data"),
+            "json": kwargs.get("json"),
+        }
+        return hashlib.sha256(
+            json.dumps(parts, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[httpx.Response]:
+        try:
+            with self._lock:
+                row = (
+                    self._connect()
+                    .execute(
+                        "SELECT method, url, status, headers, content FROM responses"
+                        " WHERE key = ? AND expires_at > ?",
+                        (key, time.time()),
+                    )
+                    .fetchone()
+                )
+        except sqlite3.Error:
+            return None
+
+        if row is None:
+            return None
+
+        method, url, status, headers, content = row
+        return httpx.Response(
+            status,
+            headers=json.loads(headers),
+            content=content,
+            request=httpx.Request(method, url),
+        )
+
+    def set(self, key: str, response: httpx.Response, ttl: float) -> None:
+        if ttl <= 0 or not response.is_success:
+            return
+
+        headers = [
+            (name, value)
+            for name, value in response.headers.multi_items()
+            if name.lower() not in _DROPPED_HEADERS
+        ]
+        try:
+            with self._lock:
+                connection = self._connect()
+                with connection:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            key,
+                            response.request.method,
+                            str(response.request.url),
+                            response.status_code,
+                            json.dumps(headers),
+                            response.content,
+                            time.time() + ttl,
+                        ),
+                    )
+        except sqlite3.Error:
+            pass
+
+    def clear(self) -> None:
+        try:
+            with self._lock:
+                connection = self._connect()
+                with connection:
+                    connection.execute("DELETE FROM responses")
+        except sqlite3.Error:
+            pass
+
+    def _connect(self) -> sqlite3.Connection:
+        # a connection must not be shared with a forked worker
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(
+                str(self.path), timeout=10, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "key TEXT PRIMARY KEY, method TEXT, url TEXT, status INTEGER,"
+                    " headers TEXT, content BLOB, expires_at REAL)"
+                )
+                connection.execute(
+                    "DELETE FROM responses WHERE expires_at <= ?", (time.time(),)
+                )
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+
+http_cache = HTTPCache()
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import importlib
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Optional, Type
+
+    from mov_cli.scraper import Scraper
+
+
+class LazyScraper:
+    """
+    Stands in for a scraper class in the plugin hook data, the module defining it is
+    only imported once mov-cli instantiates it or reads one of its attributes
+    """
+
+    def __init__(self, module: str, name: str) -> None:
+        self.module = module
+        self.name = name
+        self._scraper: Optional[Type[Scraper]] = None
+        self._lock = threading.Lock()
+
+    def load(self) -> Type[Scraper]:
+        if self._scraper is None:
+            with self._lock:
+                if self._scraper is None:
+                    module = importlib.import_module(self.module)
+                    self._scraper = getattr(module, self.name)
+        return self._scraper
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._scraper is not None
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Scraper:
+        return self.load()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        # dunder lookups (copy, pickle, ...) should not import the provider
+        if name in ("_scraper", "_lock") or (
+            name.startswith("__") and name not in ("__name__", "__qualname__")
+        ):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyScraper):
+            return (self.module, self.name) == (other.module, other.name)
+        if isinstance(other, type):
+            return self.load() is other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.module, self.name))
+
+    def __repr__(self) -> str:
+        return f"<LazyScraper {self.module}.{self.name}>"
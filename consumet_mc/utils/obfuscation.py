@@ -0,0 +1,67 @@
+import string
+from functools import lru_cache
+
+_ROT13_TABLE = str.maketrans(
+    string.ascii_uppercase + string.ascii_lowercase,
+    string.ascii_uppercase[13:]
+    + string.ascii_uppercase[:13]
+    + string.ascii_lowercase[13:]
+    + string.ascii_lowercase[:13],
+)
+
+
+def rot13(s: str) -> str:
+    """Rotates every ascii letter of s by 13 places"""
+    return s.translate(_ROT13_TABLE)
+
+
+@lru_cache(maxsize=None)
+def _shift_table(shift: int) -> bytes:
+    return bytes((i - shift) % 256 for i in range(256))
+
+
+@lru_cache(maxsize=None)
+def _unshiftable_bytes(shift: int) -> bytes:
+    # bytes that would leave 0-255 once shifted
+    return bytes(i for i in range(256) if not 0 <= i - shift <= 0xFF)
+
+
+def char_shift(s: str, shift: int) -> str:
+    """Same as "".join(chr(ord(c) - shift) for c in s), in one translate for latin-1 text"""
+    try:
+        data = s.encode("latin-1")
+    except UnicodeEncodeError:
+        return "".join(chr(ord(c) - shift) for c in s)
+
+    try:
+        return char_shift_bytes(data, shift).decode("latin-1")
+    except ValueError:
+        return "".join(chr(ord(c) - shift) for c in s)
+
+
+def char_shift_bytes(data: bytes, shift: int) -> bytes:
+    """char_shift of latin-1 text kept as bytes, raises ValueError when a byte would leave 0-255"""
+    unshiftable = _unshiftable_bytes(shift)
+    if unshiftable and len(data.translate(None, unshiftable)) != len(data):
+        raise ValueError(f"cannot shift bytes by {shift}")
+    return data.translate(_shift_table(shift))
+
+
+@lru_cache(maxsize=None)
+def _xor_table(key: int) -> bytes:
+    return bytes(i ^ key for i in range(256))
+
+
+def xor_bytes(data: bytes, key: bytes) -> bytes:
+    """XORs data with key repeated over its whole length"""
+    if not key:
+        raise ValueError("xor key must not be empty")
+
+    if len(key) == 1:
+        return data.translate(_xor_table(key[0]))
+
+    size = len(data)
+    keystream = key * (size // len(key) + 1)
+    return (
+        int.from_bytes(data, "little") ^ int.from_bytes(keystream[:size], "little")
+    ).to_bytes(size, "little")
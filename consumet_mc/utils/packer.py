@@ -1,19 +1,21 @@
 import re
+from typing import Dict, List
+
+_FUNCTION_REGEX = re.compile(r"eval\(function\(p,a,c,k,e,d\)\{.*?\}\('.*?'.split")
+_PARAMETER_REGEX = re.compile(r"\}\('(.*?);?',(\d+),(\d+),'(.*)'")
+_WORD_REGEX = re.compile(r"\w+")
 
 
 def unpack(source: str):
     """Unpacks P.A.C.K.E.R packed js code"""
-    function_regex = r"eval\(function\(p,a,c,k,e,d\)\{.*?\}\('.*?'.split"
-    parameter_regex = r"\}\('(.*?);?',(\d+),(\d+),'(.*)'"
-
-    match_all = re.findall(function_regex, source)
+    match_all = _FUNCTION_REGEX.findall(source)
 
     if not match_all:
         return
 
     encoded_string = match_all[-1]
 
-    match = re.search(parameter_regex, encoded_string)
+    match = _PARAMETER_REGEX.search(encoded_string)
 
     if not match:
         return
@@ -23,15 +25,47 @@ def unpack(source: str):
     c = int(match.group(3))
     k = match.group(4).split("|")
 
-    for i in range(c - 1, 0, -1):
-        if k[i]:
-            regex = r"\b" + _to_base(i, a) + r"\b"
-            p = re.sub(regex, k[i], p)
+    p = _replace_tokens(p, a, c, k)
 
     p = p.replace("\\", "")
     return p
 
 
+def _replace_tokens(p: str, a: int, c: int, k: List[str]) -> str:
+    """
+    Replaces every word that is _to_base(i, a) with k[i] in one pass over p.
+
+    Same result as substituting the words one keyword at a time from c - 1 down to 1,
+    which also rewrites a keyword already put in p when it happens to be the
+    token of a lower index, so those chains are resolved up front.
+    """
+    token_indexes: Dict[str, int] = {}
+    for i in range(c - 1, 0, -1):
+        if k[i]:
+            token_indexes[_to_base(i, a)] = i
+
+    replacements: Dict[int, str] = {}
+    for i in sorted(token_indexes.values()):
+        keyword = k[i]
+        if "\\" in keyword:
+            # k[i] used to be a re.sub replacement template
+            keyword = re.sub("k", keyword, "k")
+
+        def resolve_below(match: "re.Match[str]", limit: int = i) -> str:
+            word = match.group(0)
+            j = token_indexes.get(word)
+            return replacements[j] if j is not None and j < limit else word
+
+        replacements[i] = _WORD_REGEX.sub(resolve_below, keyword)
+
+    def resolve(match: "re.Match[str]") -> str:
+        word = match.group(0)
+        i = token_indexes.get(word)
+        return replacements[i] if i is not None else word
+
+    return _WORD_REGEX.sub(resolve, p)
+
+
 def _to_base(num, base=36):
     if num == 0:
         return "0"
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from consumet_mc.utils.cache import cache_directory
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Dict, Iterable, Optional
+
+
+class JSONStore:
+    """
+    Json values by key, persisted in sqlite so several processes on one host can
+    share them. Every write reads what is stored in the same transaction, so
+    processes writing at once merge their changes instead of overwriting them
+    """
+
+    def __init__(
+        self,
+        name: str,
+        path: Optional[Path] = None,
+        max_entries: Optional[int] = None,
+    ) -> None:
+        self.name = name
+        # the least recently written entries are dropped beyond it
+        self.max_entries = max_entries
+        self._path = path
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        if self._path is None:
+            self._path = cache_directory().joinpath(f"{self.name}.sqlite3")
+        return self._path
+
+    def get(self, key: str) -> Any:
+        try:
+            with self._lock:
+                row = (
+                    self._connect()
+                    .execute("SELECT value FROM entries WHERE key = ?", (key,))
+                    .fetchone()
+                )
+        except sqlite3.Error:
+            return None
+
+        return json.loads(row[0]) if row is not None else None
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        the stored value of every key found, read in one query
+        """
+        keys = list(keys)
+        if not keys:
+            return {}
+        try:
+            with self._lock:
+                rows = (
+                    self._connect()
+                    .execute(
+                        "SELECT key, value FROM entries WHERE key IN"
+                        f" ({', '.join('?' * len(keys))})",
+                        keys,
+                    )
+                    .fetchall()
+                )
+        except sqlite3.Error:
+            return {}
+
+        return {key: json.loads(value) for key, value in rows}
+
+    def set_many(self, values: Dict[str, Any]) -> None:
+        def write(connection: sqlite3.Connection) -> None:
+            connection.executemany(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?)",
+                [(key, json.dumps(value)) for key, value in values.items()],
+            )
+
+        self._write(write)
+
+    def update(self, key: str, function: Callable[[Any], Any]) -> None:
+        """
+        store function(value), value being what is stored for key or None
+        """
+
+        def write(connection: sqlite3.Connection) -> None:
+            row = connection.execute(
+                "SELECT value FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            value = function(json.loads(row[0]) if row is not None else None)
+            connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?)", (key, json.dumps(value))
+            )
+
+        self._write(write)
+
+    def clear(self) -> None:
+        self._write(lambda connection: connection.execute("DELETE FROM entries"))
+
+    def invalidate(self, prefix: str) -> None:
+        """
+        drop every entry whose key starts with prefix
+        """
+        self._write(
+            lambda connection: connection.execute(
+                "DELETE FROM entries WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+            )
+        )
+
+    def _write(self, write: Callable[[sqlite3.Connection], Any]) -> None:
+        try:
+            with self._lock:
+                connection = self._connect()
+                # taken before reading, a concurrent writer waits for the commit
+                connection.execute("BEGIN IMMEDIATE")
+                try:
+                    write(connection)
+                    if self.max_entries is not None:
+                        # a replaced entry gets a new rowid, so rowids follow the writes
+                        connection.execute(
+                            "DELETE FROM entries WHERE rowid <= (SELECT rowid FROM"
+                            " entries ORDER BY rowid DESC LIMIT 1 OFFSET ?)",
+                            (self.max_entries,),
+                        )
+                    connection.execute("COMMIT")
+                except BaseException:
+                    connection.execute("ROLLBACK")
+                    raise
+        except sqlite3.Error:
+            pass
+
+    def _connect(self) -> sqlite3.Connection:
+        # a connection must not be shared with a forked worker
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(
+                str(self.path),
+                timeout=10,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
@@ -1 +1,26 @@
+import re
+from typing import Optional
+from urllib.parse import parse_qsl, urlparse
+
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/83.0.4103.116 Safari/537.36"
+
+# scheme and host of an embed url, the extractors build their api urls on it
+BASE_URL_REGEX = re.compile(r"https://[a-zA-Z0-9.]*")
+
+# query parameters signed video urls carry their expiry time in
+_EXPIRY_PARAMS = ("e", "exp", "expire", "expires", "expiry")
+
+
+def signed_url_expiry(url: str) -> Optional[float]:
+    """unix time a signed url stops working at, if its query says so"""
+    for name, value in parse_qsl(urlparse(url).query):
+        if name.lower() not in _EXPIRY_PARAMS or not value.isdigit():
+            continue
+
+        expires_at = float(value)
+        if expires_at > 1e12:  # milliseconds
+            expires_at /= 1000
+        # anything else is more likely a duration or an unrelated number
+        if expires_at > 1e9:
+            return expires_at
+    return None
@@ -0,0 +1,98 @@
+import threading
+import time
+
+import pytest
+
+from consumet_mc.extractors.aes_keys import (
+    decrypt_with_cached_key,
+    decrypt_with_first_key,
+    invalidate_aes_key,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_keys():
+    invalidate_aes_key()
+    yield
+    invalidate_aes_key()
+
+
+def test_key_is_fetched_once():
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        return "key"
+
+    for _ in range(3):
+        assert decrypt_with_cached_key("test", fetch, lambda key: key.upper()) == "KEY"
+    assert len(fetches) == 1
+
+
+def test_concurrent_misses_are_coalesced():
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        time.sleep(0.05)
+        return "key"
+
+    threads = [
+        threading.Thread(target=decrypt_with_cached_key, args=("test", fetch, len))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(fetches) == 1
+
+
+def test_stale_cached_key_is_refetched():
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        return "fresh"
+
+    def decrypt(key):
+        if key == "stale":
+            raise ValueError("bad padding")
+        return key
+
+    assert decrypt_with_cached_key("test", lambda: "stale", len) == 5
+    assert decrypt_with_cached_key("test", fetch, decrypt) == "fresh"
+    assert len(fetches) == 1
+
+
+def test_fresh_key_that_fails_is_not_retried():
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        return "key"
+
+    def decrypt(key):
+        raise ValueError("bad padding")
+
+    assert decrypt_with_cached_key("test", fetch, decrypt) is None
+    assert len(fetches) == 1
+
+
+def test_unreachable_endpoint_does_not_fail_decryption():
+    def dead():
+        raise ConnectionError("key host is down")
+
+    sources = decrypt_with_first_key([("dead", dead), ("alive", lambda: "key")], len)
+    assert sources == 3
+
+
+def test_first_arriving_key_is_used():
+    def slow():
+        time.sleep(1)
+        return "slow-key"
+
+    started = time.monotonic()
+    assert decrypt_with_first_key([("slow", slow), ("fast", lambda: "k")], len) == 1
+    assert time.monotonic() - started < 1
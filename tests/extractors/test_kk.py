@@ -0,0 +1,92 @@
+import base64
+import random
+from ctypes import c_int32
+
+import pytest
+
+from consumet_mc.extractors import kk
+from consumet_mc.extractors.kk import KK, KKeyCache
+from consumet_mc.models.video_server import VideoServer
+from consumet_mc.utils import crypto
+
+
+def reference_hash(token_str):
+    word = 0
+    for i in range(len(token_str)):
+        word = c_int32(word << 5).value - word + ord(token_str[i])
+    return word
+
+
+def reference_kkey(extractor, episode_id, guid):
+    key = ["", episode_id, "", "mg3c3b04ba", extractor._appVer, guid]
+    key += [extractor._platformVer] + [extractor._appName] * 6 + ["00", ""]
+    key.insert(1, str(reference_hash("|".join(key))))
+    encrypted = crypto.aes_encrypt(
+        "|".join(key), extractor._aes_key, extractor._aes_iv, True
+    )
+    return base64.b64decode(encrypted).hex().upper()
+
+
+@pytest.fixture
+def extractor(tmp_path, monkeypatch):
+    monkeypatch.setattr(kk, "kkey_cache", KKeyCache(tmp_path / "kkeys.sqlite3"))
+    return KK(None, VideoServer("kk", "https://kisskh.example/Episode/1.png"))  # type: ignore
+
+
+def test_calculate_hash_matches_ctypes(extractor):
+    rnd = random.Random(0)
+    for size in (0, 1, 7, 64, 500):
+        token = "".join(chr(rnd.randrange(32, 0x3000)) for _ in range(size))
+        assert extractor._calculate_hash(token) == reference_hash(token)
+
+
+def test_kkeys_match_reference(extractor):
+    kkeys = extractor.kkeys(["101", "102"])
+    for episode_id in ("101", "102"):
+        assert kkeys[episode_id] == (
+            reference_kkey(extractor, episode_id, extractor._viGuid),
+            reference_kkey(extractor, episode_id, extractor._subGuid),
+        )
+
+
+def test_kkeys_are_persisted(extractor, tmp_path, monkeypatch):
+    kkeys = extractor.kkeys(["101"])
+
+    def fail(*args, **kwargs):
+        raise AssertionError("kkey was encrypted again")
+
+    monkeypatch.setattr(crypto, "aes_encrypt_many", fail)
+    monkeypatch.setattr(kk, "kkey_cache", KKeyCache(tmp_path / "kkeys.sqlite3"))
+    assert extractor.kkeys(["101"]) == kkeys
+
+
+@pytest.mark.parametrize(
+    "attribute",
+    ["_viGuid", "_subGuid", "_aes_key", "_aes_iv", "_platformVer", "_appVer"],
+)
+def test_kkeys_of_other_inputs_are_not_served(extractor, monkeypatch, attribute):
+    extractor.kkeys(["101"])
+    monkeypatch.setattr(extractor, attribute, "0" * len(getattr(extractor, attribute)))
+    kkeys = extractor.kkeys(["101"])
+    assert kkeys["101"] == (
+        reference_kkey(extractor, "101", extractor._viGuid),
+        reference_kkey(extractor, "101", extractor._subGuid),
+    )
+
+
+def test_kkey_caches_sharing_a_file_do_not_overwrite_each_other(tmp_path):
+    first = KKeyCache(tmp_path / "kkeys.sqlite3")
+    second = KKeyCache(tmp_path / "kkeys.sqlite3")
+    first.set_many({"1": ("a", "b")})
+    second.set_many({"2": ("c", "d")})
+    assert KKeyCache(tmp_path / "kkeys.sqlite3").get("1") == ("a", "b")
+    assert KKeyCache(tmp_path / "kkeys.sqlite3").get("2") == ("c", "d")
+
+
+def test_kkey_cache_is_bounded(tmp_path):
+    cache = KKeyCache(tmp_path / "kkeys.sqlite3", max_entries=2)
+    cache.set_many({"1": ("a", "b"), "2": ("c", "d")})
+    cache.set_many({"3": ("e", "f")})
+    assert cache.get("1") is None
+    assert cache.get("2") == ("c", "d")
+    assert cache.get("3") == ("e", "f")
@@ -0,0 +1,9 @@
+from consumet_mc.extractors.megacloud.megacloud_decodedpng import decoded_png
+
+
+def test_decoded_png_is_the_rgba_image():
+    pixels = decoded_png()
+    assert pixels.typecode == "B"
+    assert len(pixels) == 50 * 65 * 4
+    assert pixels[:4].tolist() == [246, 246, 246, 255]
+    assert decoded_png() is pixels
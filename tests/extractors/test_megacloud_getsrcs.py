@@ -0,0 +1,228 @@
+import importlib
+import sys
+import threading
+import time
+import types
+from unittest import mock
+
+import httpx
+import pytest
+
+from consumet_mc.extractors import megacloud as megacloud_package
+
+
+class FakeModule:
+    """compiles by prefixing the wasm, deserializing checks the prefix"""
+
+    compiled = 0
+
+    def __init__(self, store, wasm_bytes: bytes) -> None:
+        FakeModule.compiled += 1
+        self.wasm_bytes = wasm_bytes
+
+    def serialize(self) -> bytes:
+        return b"compiled:" + self.wasm_bytes
+
+    @staticmethod
+    def deserialize(store, serialized: bytes) -> "FakeModule":
+        if not serialized.startswith(b"compiled:"):
+            raise RuntimeError("not a serialized module")
+        module = FakeModule.__new__(FakeModule)
+        module.wasm_bytes = serialized[len(b"compiled:") :]
+        return module
+
+
+class RecordingClient:
+    """records the requests and answers them with responses[url]"""
+
+    def __init__(self, responses=None) -> None:
+        self.responses = responses or {}
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        self.requests.append((method, url, kwargs))
+        if url not in self.responses:
+            raise RuntimeError(f"unexpected request to {url}")
+        return httpx.Response(
+            200, json=self.responses[url], request=httpx.Request(method, url)
+        )
+
+
+@pytest.fixture
+def getsrcs(tmp_path, monkeypatch):
+    # wasmer has no wheels for every python, the runtime is tested against fakes
+    wasmer = types.ModuleType("wasmer.wasmer")
+    for name in ("Function", "FunctionType", "Instance", "Type", "engine"):
+        setattr(wasmer, name, mock.MagicMock())
+    wasmer.Store = lambda engine: mock.MagicMock()
+    wasmer.Module = FakeModule
+    cranelift = types.ModuleType("wasmer_compiler_cranelift.wasmer_compiler_cranelift")
+    cranelift.Compiler = mock.MagicMock()
+
+    monkeypatch.setitem(sys.modules, "wasmer", types.ModuleType("wasmer"))
+    monkeypatch.setitem(sys.modules, "wasmer.wasmer", wasmer)
+    monkeypatch.setitem(
+        sys.modules, "wasmer_compiler_cranelift", types.ModuleType("cranelift")
+    )
+    monkeypatch.setitem(sys.modules, cranelift.__name__, cranelift)
+    name = "consumet_mc.extractors.megacloud.megacloud_getsrcs"
+    monkeypatch.delitem(sys.modules, name, raising=False)
+    # dropped from the package again afterwards, as the import sets it there
+    monkeypatch.setattr(megacloud_package, "megacloud_getsrcs", None, raising=False)
+    module = importlib.import_module(name)
+    monkeypatch.delitem(sys.modules, name)
+
+    monkeypatch.setattr(module, "cache_directory", lambda: tmp_path)
+    monkeypatch.setattr(FakeModule, "compiled", 0)
+    return module
+
+
+def test_compile_cache_miss_compiles_and_persists(getsrcs, tmp_path):
+    module = getsrcs.compile_module(None, b"wasm")
+    assert module.wasm_bytes == b"wasm"
+    assert FakeModule.compiled == 1
+    assert list(tmp_path.joinpath("megacloud").iterdir())
+
+
+def test_compile_cache_hit_in_memory(getsrcs):
+    getsrcs.compile_module(None, b"wasm")
+    module = getsrcs.compile_module(None, b"wasm")
+    assert module.wasm_bytes == b"wasm"
+    assert FakeModule.compiled == 1
+
+
+def test_compile_cache_hit_on_disk(getsrcs):
+    getsrcs.compile_module(None, b"wasm")
+    # a new process only has what the earlier one wrote to disk
+    getsrcs._compiled_modules.clear()
+    module = getsrcs.compile_module(None, b"wasm")
+    assert module.wasm_bytes == b"wasm"
+    assert FakeModule.compiled == 1
+
+
+def test_compile_cache_is_keyed_by_the_wasm(getsrcs):
+    getsrcs.compile_module(None, b"wasm")
+    module = getsrcs.compile_module(None, b"other wasm")
+    assert module.wasm_bytes == b"other wasm"
+    assert FakeModule.compiled == 2
+
+
+def test_corrupt_cache_file_is_recompiled(getsrcs, tmp_path):
+    getsrcs.compile_module(None, b"wasm")
+    getsrcs._compiled_modules.clear()
+    [path] = tmp_path.joinpath("megacloud").iterdir()
+    path.write_bytes(b"garbage")
+
+    module = getsrcs.compile_module(None, b"wasm")
+    assert module.wasm_bytes == b"wasm"
+    assert FakeModule.compiled == 2
+    assert path.read_bytes() == b"compiled:wasm"
+
+
+def test_get_sources_resets_the_runtime(getsrcs):
+    runtime = getsrcs.MegacloudRuntime()
+    runtime.fake_window.localStorage.setItem("kid", "left over")
+    runtime.arr.append("left over")
+    seen = []
+
+    def get_meta(url):
+        seen.append((runtime.fake_window.localStorage.getItem("kid"), len(runtime.arr)))
+        raise RuntimeError("stop")
+
+    runtime.get_meta = get_meta
+    with pytest.raises(RuntimeError, match="stop"):
+        runtime.get_sources(
+            "https://megacloud.tv/embed-2/e-1/abc", "https://hianime.to"
+        )
+    assert seen == [(None, len(getsrcs.MegacloudRuntime().arr))]
+
+
+def test_runtimes_do_not_share_state(getsrcs):
+    first, second = getsrcs.MegacloudRuntime(), getsrcs.MegacloudRuntime()
+    first.fake_window.localStorage.setItem("kid", "first")
+    assert second.fake_window.localStorage.getItem("kid") is None
+    assert first.arr is not second.arr
+    assert first.store is not second.store
+
+
+def test_pool_reuses_returned_runtimes(getsrcs):
+    pool = getsrcs.RuntimePool(max_size=2)
+    with pool.runtime() as first:
+        pass
+    with pool.runtime() as second:
+        pass
+    assert first is second
+    assert pool.size == 1
+
+
+def test_pool_is_bounded(getsrcs):
+    pool = getsrcs.RuntimePool(max_size=2)
+    lent = []
+    in_use = []
+    lock = threading.Lock()
+
+    def extract():
+        with pool.runtime() as runtime:
+            with lock:
+                assert runtime not in in_use
+                in_use.append(runtime)
+                lent.append(len(in_use))
+            time.sleep(0.02)
+            with lock:
+                in_use.remove(runtime)
+
+    threads = [threading.Thread(target=extract) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(lent) == 6
+    assert max(lent) == 2
+    assert pool.size == 2
+
+
+def test_pool_frees_the_slot_of_a_runtime_that_failed_to_build(getsrcs):
+    builds = []
+
+    def factory():
+        builds.append(1)
+        if len(builds) == 1:
+            raise RuntimeError("no wasm")
+        return getsrcs.MegacloudRuntime()
+
+    pool = getsrcs.RuntimePool(max_size=1, factory=factory)
+    with pytest.raises(RuntimeError), pool.runtime():
+        pass
+    with pool.runtime() as runtime:
+        assert runtime is not None
+    assert pool.size == 1
+
+
+def test_runtime_requests_go_through_the_http_client(getsrcs):
+    runtime = getsrcs.MegacloudRuntime()
+    runtime.http_client = RecordingClient({"https://megacloud.tv/a": {}})
+    runtime._get("https://megacloud.tv/a", {"Referer": "https://hianime.to"})
+    assert runtime.http_client.requests == [
+        (
+            "GET",
+            "https://megacloud.tv/a",
+            {"headers": {"Referer": "https://hianime.to"}, "redirect": True},
+        )
+    ]
+
+
+def test_runtime_without_http_client_uses_the_pooled_client(getsrcs, monkeypatch):
+    pooled = mock.Mock()
+    monkeypatch.setattr(getsrcs, "_default_client", lambda: pooled)
+    runtime = getsrcs.MegacloudRuntime()
+    runtime._get("https://megacloud.tv/a")
+    pooled.get.assert_called_once_with("https://megacloud.tv/a", headers=None)
+
+
+def test_get_sources_uses_the_given_http_client(getsrcs):
+    client = RecordingClient()
+    embed_url = "https://megacloud.tv/embed-2/e-1/abc?k=1"
+    with pytest.raises(RuntimeError, match="unexpected request"):
+        getsrcs.get_sources(embed_url, "https://hianime.to", http_client=client)
+    assert [url for _, url, _ in client.requests] == [embed_url]
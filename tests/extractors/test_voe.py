@@ -0,0 +1,33 @@
+import base64
+import json
+import random
+
+from consumet_mc.extractors.voe import Voe
+from consumet_mc.models.video_server import VideoServer
+from consumet_mc.utils.obfuscation import char_shift, rot13
+
+JUNK = ["@$", "^^", "~@", "%?", "*~", "!!", "#&"]
+DATA = {
+    "site_name": "voe.example",
+    "source": "https://cdn.example/hls/master.m3u8",
+    "captions": [{"file": "/vtt/en.vtt", "label": "English"}],
+    "title": "épisode 1",
+}
+
+
+def encode(data, seed=0):
+    rnd = random.Random(seed)
+    s = base64.b64encode(json.dumps(data).encode()).decode()
+    s = base64.b64encode(char_shift(s[::-1], -3).encode()).decode()
+    s = "".join(c + (rnd.choice(JUNK) if rnd.random() < 0.3 else "") for c in s)
+    return rot13(s)
+
+
+def test_decrypt_encoded_str():
+    voe = Voe(None, VideoServer("voe", "https://voe.example/e/abc"))  # type: ignore
+    assert voe._decrypt_encoded_str(encode(DATA)) == DATA
+
+
+def test_decrypt_invalid_encoded_str():
+    voe = Voe(None, VideoServer("voe", "https://voe.example/e/abc"))  # type: ignore
+    assert voe._decrypt_encoded_str("not voe") == {}
@@ -0,0 +1,64 @@
+import copy
+
+import pytest
+
+from consumet_mc.models.video_server import NoServerUrlError, VideoServer
+
+
+def test_url_without_resolver():
+    server = VideoServer("kwik", "https://kwik.si/e/abc")
+    assert server.is_resolved
+    assert server.url == "https://kwik.si/e/abc"
+
+
+def test_keyword_construction():
+    server = VideoServer(name="kwik", url="https://kwik.si/e/abc", extra_data={"a": 1})
+    assert server.url == "https://kwik.si/e/abc"
+    assert server.extra_data == {"a": 1}
+    assert server == VideoServer("kwik", "https://kwik.si/e/abc", {"a": 1})
+
+
+def test_url_setter():
+    server = VideoServer("hd-1", resolver=lambda: "https://megacloud.tv/embed-2/e-1/a")
+    server.url = "https://megacloud.tv/embed-2/e-1/b"
+    assert server.url == "https://megacloud.tv/embed-2/e-1/b"
+
+
+def test_resolver_is_deferred_and_memoized():
+    calls = []
+
+    def resolve():
+        calls.append(1)
+        return "https://megacloud.tv/embed-2/e-1/abc"
+
+    server = VideoServer("hd-1", resolver=resolve)
+    assert not server.is_resolved
+    assert not calls
+
+    assert server.url == "https://megacloud.tv/embed-2/e-1/abc"
+    assert server.url == "https://megacloud.tv/embed-2/e-1/abc"
+    assert len(calls) == 1
+
+
+def test_missing_url_and_resolver():
+    server = VideoServer("hd-1")
+    with pytest.raises(NoServerUrlError, match="has no url"):
+        _ = server.url
+
+
+def test_resolving_does_not_change_equality():
+    def resolve():
+        return "https://megacloud.tv/embed-2/e-1/abc"
+
+    server = VideoServer("hd-1", resolver=resolve)
+    other = VideoServer("hd-1", resolver=resolve)
+    _ = server.url
+    assert server == other
+    assert "_lock" not in repr(server)
+
+
+def test_copies_get_their_own_lock():
+    server = VideoServer("kwik", "https://kwik.si/e/abc", {"a": [1]})
+    for server_copy in (copy.copy(server), copy.deepcopy(server)):
+        assert server_copy == server
+        assert server_copy._lock is not server._lock
@@ -1,10 +1,14 @@
+import json
 from typing import Dict, List, Optional
+
+import httpx
 from mov_cli.config import Config
 from mov_cli.media import Media, Metadata, MetadataType
 from mov_cli.http_client import HTTPClient
 from mov_cli.utils import EpisodeSelector
 import pytest
 from consumet_mc.providers.allanime import AllAnime
+from consumet_mc.providers.provider import _listing_cache
 
 
 @pytest.fixture
@@ -61,3 +65,110 @@ def test_scrape_media_with_fm_hls_server_selected(
         solo_leveling_metadata, EpisodeSelector(1, 1)
     )
     assert media
+
+
+class FakeGraphQLClient:
+    """answers the show and episode fields of AllAnime queries"""
+
+    def __init__(self, episode_strs=("3", "2", "1")):
+        self.episode_strs = episode_strs
+        self.queries: List[str] = []
+
+    def request(self, method, url, headers=None, params=None, **kwargs):
+        query = params.get("query", "")
+        self.queries.append(query)
+        data = {}
+        if "show: show" in query:
+            data["show"] = {
+                "_id": "show-id",
+                "name": "Show",
+                "availableEpisodesDetail": {"sub": list(self.episode_strs), "dub": []},
+            }
+        if "episode: episode" in query:
+            variables = json.loads(params["variables"])
+            episode_str = next(
+                value for name, value in variables.items() if name.endswith("String")
+            )
+            file = f"https://cdn.example/{episode_str}.mp4".encode()
+            source_url = bytes(b ^ 56 for b in file).hex()
+            data["episode"] = {
+                "episodeString": episode_str,
+                "sourceUrls": [{"sourceUrl": f"--{source_url}", "sourceName": "Mp4"}],
+            }
+        return httpx.Response(
+            200, json={"data": data}, request=httpx.Request(method, url)
+        )
+
+
+@pytest.fixture
+def offline(tmp_path, monkeypatch):
+    from consumet_mc.providers import allanime as allanime_module
+    from consumet_mc.providers import provider as provider_module
+    from consumet_mc.utils.episode_index import EpisodeIndex
+    from consumet_mc.utils.graphql import PersistedQueries
+
+    monkeypatch.setattr(
+        provider_module, "episode_index", EpisodeIndex(tmp_path / "index.sqlite3")
+    )
+    # no query registered by another test is sent by its hash alone
+    monkeypatch.setattr(allanime_module, "persisted_queries", PersistedQueries())
+
+
+def test_episode_list_and_sources_share_a_round_trip(offline):
+    client = FakeGraphQLClient()
+    allanime = AllAnime(Config(), client)  # type: ignore
+    allanime.invalidate_cache("show-id")
+
+    episodes = allanime._get_episodes("show-id", wanted_episode=1)
+    servers = allanime._scrape_video_servers(episodes[0].id, "show-id")
+
+    assert [episode.id for episode in episodes] == ["1", "2", "3"]
+    assert [(server.name, server.url) for server in servers] == [
+        ("mp4", "https://cdn.example/1.mp4")
+    ]
+    assert len(client.queries) == 1
+
+
+def test_selected_episode_brings_its_sources_along(offline):
+    client = FakeGraphQLClient()
+    allanime = AllAnime(Config(), client)  # type: ignore
+    allanime.invalidate_cache("show-id")
+
+    episode = allanime._select_episode(
+        Metadata("show-id", "Show", MetadataType.MULTI), EpisodeSelector(2)
+    )
+    servers = allanime._scrape_video_servers(episode.id, "show-id")
+
+    assert episode.id == "2"
+    assert [server.url for server in servers] == ["https://cdn.example/2.mp4"]
+    assert len(client.queries) == 1
+
+
+def test_sources_of_an_episode_string_not_matching_its_number_are_not_kept(
+    offline,
+):
+    # with an episode 0 the 2nd episode is "1", not "2"
+    client = FakeGraphQLClient(episode_strs=("2", "1", "0"))
+    allanime = AllAnime(Config(), client)  # type: ignore
+    allanime.invalidate_cache("show-id")
+
+    episodes = allanime._get_episodes("show-id", wanted_episode=2)
+    servers = allanime._scrape_video_servers(episodes[1].id, "show-id")
+
+    assert [episode.id for episode in episodes] == ["0", "1", "2"]
+    assert [server.url for server in servers] == ["https://cdn.example/1.mp4"]
+    assert len(client.queries) == 2
+
+
+def test_episode_string_is_taken_from_the_last_visit(offline):
+    client = FakeGraphQLClient(episode_strs=("2", "1", "0"))
+    allanime = AllAnime(Config(), client)  # type: ignore
+    allanime.invalidate_cache("show-id")
+    allanime._get_episodes("show-id")
+    _listing_cache.invalidate("allanime")
+
+    episodes = allanime._get_episodes("show-id", wanted_episode=2)
+    servers = allanime._scrape_video_servers(episodes[1].id, "show-id")
+
+    assert [server.url for server in servers] == ["https://cdn.example/1.mp4"]
+    assert len(client.queries) == 2
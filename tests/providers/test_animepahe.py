@@ -1,4 +1,7 @@
+import time
 from typing import Dict, List, Optional
+
+import httpx
 from mov_cli.config import Config
 from mov_cli.media import Media, Metadata, MetadataType
 from mov_cli.http_client import HTTPClient
@@ -42,3 +45,84 @@ def test_scrape_episodes(animepahe: AnimePahe, naruto_metadata: Metadata):
 def test_scrape_media(animepahe: AnimePahe, naruto_metadata):
     media: Optional[Media] = animepahe.scrape(naruto_metadata, EpisodeSelector(1, 1))
     assert media
+
+
+class FakeReleaseClient:
+    """serves episodes in pages of per_page, failing the given pages"""
+
+    def __init__(self, episodes: int, per_page: int, failing=()):
+        self.episodes = episodes
+        self.per_page = per_page
+        self.failing = failing
+        self.requested_pages: List[int] = []
+
+    @property
+    def last_page(self):
+        return -(-self.episodes // self.per_page)
+
+    def request(self, method, url, **kwargs):
+        page = int(url.rsplit("page=", 1)[1])
+        self.requested_pages.append(page)
+        # later pages answer first
+        time.sleep(0.01 * max(0, self.last_page - page))
+        if page in self.failing:
+            return httpx.Response(500, request=httpx.Request(method, url))
+        first = (page - 1) * self.per_page + 1
+        data = [
+            {"session": f"s{episode}", "episode": episode}
+            for episode in range(first, min(page * self.per_page, self.episodes) + 1)
+        ]
+        return httpx.Response(
+            200,
+            json={
+                "total": self.episodes,
+                "current_page": page,
+                "last_page": self.last_page,
+                "from": first if data else None,
+                "data": data,
+            },
+            request=httpx.Request(method, url),
+        )
+
+
+def test_scrape_episodes_pages_in_order():
+    provider = AnimePahe(Config(), FakeReleaseClient(180, 30))  # type: ignore
+    episodes = provider._scrape_episodes("media")
+    assert [episode.episode_number for episode in episodes] == list(range(1, 181))
+
+
+def test_scrape_episodes_raises_first_failing_page():
+    provider = AnimePahe(Config(), FakeReleaseClient(180, 30, failing=(3, 5)))  # type: ignore
+    with pytest.raises(httpx.HTTPStatusError, match="page=3"):
+        provider._scrape_episodes("media")
+
+
+def test_episode_index_refreshes_from_last_known_page():
+    client = FakeReleaseClient(170, 30)
+    provider = AnimePahe(Config(), client)  # type: ignore
+    indexed = provider._scrape_episode_index("media", None, None)
+    assert indexed is not None
+
+    client.episodes = 200
+    client.requested_pages.clear()
+    refreshed = provider._scrape_episode_index("media", None, indexed)
+    assert refreshed is not None
+    assert sorted(client.requested_pages) == [6, 7]
+    assert [episode.episode_number for episode in refreshed.episodes] == list(
+        range(1, 201)
+    )
+
+
+def test_episode_index_falls_back_to_full_scrape():
+    client = FakeReleaseClient(170, 30)
+    provider = AnimePahe(Config(), client)  # type: ignore
+    indexed = provider._scrape_episode_index("media", None, None)
+    assert indexed is not None
+
+    # the show lost episodes, the last known page is gone
+    client.episodes = 100
+    refreshed = provider._scrape_episode_index("media", None, indexed)
+    assert refreshed is not None
+    assert [episode.episode_number for episode in refreshed.episodes] == list(
+        range(1, 101)
+    )
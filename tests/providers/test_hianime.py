@@ -1,10 +1,21 @@
 from typing import Dict, List, Optional
+import httpx
 from mov_cli.config import Config
 from mov_cli.media import Media, Metadata, MetadataType
 from mov_cli.http_client import HTTPClient
 from mov_cli.utils import EpisodeSelector
 import pytest
+from consumet_mc.extractors.aes_keys import invalidate_aes_key
 from consumet_mc.providers import HiAnime
+from consumet_mc.providers import provider as provider_module
+from consumet_mc.utils.http_cache import HTTPCache
+
+
+@pytest.fixture
+def http_cache(tmp_path, monkeypatch):
+    cache = HTTPCache(tmp_path / "http_cache.sqlite3")
+    monkeypatch.setattr(provider_module, "http_cache", cache)
+    return cache
 
 
 @pytest.fixture
@@ -16,6 +27,87 @@ def hianime():
     return provider
 
 
+class CountingHTTPClient(HTTPClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.urls: List[str] = []
+
+    def request(self, method, url, *args, **kwargs):
+        self.urls.append(url)
+        return super().request(method, url, *args, **kwargs)
+
+
+class FakeServersClient:
+    """serves the server list of an episode and the link of each server"""
+
+    servers = (
+        ("1", "sub", "HD-1"),
+        ("2", "sub", "HD-2"),
+        ("3", "sub", "StreamSB"),
+        ("4", "dub", "HD-1"),
+        ("5", "dub", "HD-2"),
+    )
+
+    def __init__(self) -> None:
+        self.urls: List[str] = []
+
+    def request(self, method, url, *args, **kwargs):
+        self.urls.append(url)
+        request = httpx.Request(method, url)
+        if "/ajax/v2/episode/servers" in url:
+            html = "".join(
+                f'<div class="item server-item" data-type="{data_type}" '
+                f'data-id="{data_id}"><a>{name}</a></div>'
+                for data_id, data_type, name in self.servers
+            )
+            return httpx.Response(200, json={"html": html}, request=request)
+
+        data_id = url.split("id=")[-1]
+        link = f"https://megacloud.tv/embed-2/e-1/{data_id}"
+        return httpx.Response(200, json={"link": link}, request=request)
+
+    def source_ids(self) -> List[str]:
+        return [
+            url.split("id=")[-1]
+            for url in self.urls
+            if "/ajax/v2/episode/sources" in url
+        ]
+
+
+@pytest.mark.parametrize(
+    "options, servers",
+    [
+        ({}, {"hd-1": "1", "hd-2": "2"}),
+        ({"sub_or_dub": "dub"}, {"hd-1": "4", "hd-2": "5"}),
+        ({"server": "HD-2"}, {"hd-2": "2"}),
+        ({"sub_or_dub": "dub", "server": "hd-1"}, {"hd-1": "4"}),
+    ],
+)
+def test_filtered_out_servers_are_not_resolved(options, servers, http_cache):
+    client = FakeServersClient()
+    provider = HiAnime(Config(), client)  # type: ignore
+    provider.options.update(options)
+
+    video_servers = provider._scrape_video_servers("1")
+    assert [s.name for s in video_servers] == list(servers)
+    assert client.source_ids() == []
+
+    for s in video_servers:
+        assert s.url == f"https://megacloud.tv/embed-2/e-1/{servers[s.name]}"
+    assert client.source_ids() == list(servers.values())
+
+
+def test_server_list_is_served_from_the_http_cache(http_cache):
+    client = FakeServersClient()
+    provider = HiAnime(Config(), client)  # type: ignore
+
+    for _ in range(2):
+        assert [s.name for s in provider._scrape_video_servers("1")] == ["hd-1", "hd-2"]
+    assert [url for url in client.urls if "/episode/servers" in url] == [
+        "https://hianime.to/ajax/v2/episode/servers?episodeId=1"
+    ]
+
+
 @pytest.fixture
 def naruto_metadata():
     return Metadata("naruto-677", "Naruto", MetadataType.MULTI)
@@ -85,3 +177,19 @@ def test_scrape_episodes(hianime: HiAnime, naruto_metadata: Metadata):
 def test_scrape_media(hianime: HiAnime, naruto_metadata):
     media: Optional[Media] = hianime.scrape(naruto_metadata, EpisodeSelector(1, 1))
     assert media
+
+
+def test_scrape_media_resolves_only_the_selected_server(naruto_metadata, http_cache):
+    # the aes key request is only made when no earlier test cached the key
+    invalidate_aes_key()
+    client = CountingHTTPClient()
+    provider = HiAnime(Config(), client)
+    provider.invalidate_cache(naruto_metadata.id)
+
+    media: Optional[Media] = provider.scrape(naruto_metadata, EpisodeSelector(1, 1))
+    assert media
+
+    source_requests = [url for url in client.urls if "/ajax/v2/episode/sources" in url]
+    assert len(source_requests) == 1
+    # episode list, server list, selected server link, getSources and the aes key
+    assert len(client.urls) == 5
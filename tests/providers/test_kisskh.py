@@ -1,4 +1,6 @@
 from typing import Dict, List, Optional
+
+import httpx
 from mov_cli.config import Config
 from mov_cli.media import Media, Metadata, MetadataType
 from mov_cli.http_client import HTTPClient
@@ -62,3 +64,64 @@ def test_scrape_episodes(kisskh: Kisskh, vincenzo_metadata: Metadata):
 def test_scrape_media(kisskh: Kisskh, vincenzo_metadata: Metadata):
     media: Optional[Media] = kisskh.scrape(vincenzo_metadata, EpisodeSelector(1, 1))
     assert media
+
+
+class FakeDramaClient:
+    """serves a drama with an etag, answering 304 when it is sent back"""
+
+    def __init__(self, episodes: int):
+        self.episodes = episodes
+        self.statuses: List[int] = []
+
+    @property
+    def etag(self):
+        return f'"{self.episodes}"'
+
+    def request(self, method, url, headers=None, **kwargs):
+        request = httpx.Request(method, url)
+        if (headers or {}).get("If-None-Match") == self.etag:
+            response = httpx.Response(304, request=request)
+        else:
+            episodes = [{"id": n} for n in range(self.episodes, 0, -1)]
+            response = httpx.Response(
+                200,
+                json={"episodes": episodes},
+                headers={"etag": self.etag},
+                request=request,
+            )
+        self.statuses.append(response.status_code)
+        return response
+
+
+def test_episode_index_is_revalidated():
+    client = FakeDramaClient(16)
+    provider = Kisskh(Config(), client)  # type: ignore
+    indexed = provider._scrape_episode_index("1219", None, None)
+    assert indexed is not None and len(indexed.episodes) == 16
+
+    refreshed = provider._scrape_episode_index("1219", None, indexed)
+    assert client.statuses == [200, 304]
+    assert refreshed == indexed
+
+    client.episodes = 17
+    refreshed = provider._scrape_episode_index("1219", None, indexed)
+    assert refreshed is not None
+    assert [episode.id for episode in refreshed.episodes] == list(range(1, 18))
+
+
+def test_get_episodes_keeps_an_episode_index(tmp_path, monkeypatch):
+    from consumet_mc.providers import provider as provider_module
+    from consumet_mc.utils.episode_index import EpisodeIndex
+
+    monkeypatch.setattr(
+        provider_module, "episode_index", EpisodeIndex(tmp_path / "index.sqlite3")
+    )
+    client = FakeDramaClient(16)
+    provider = Kisskh(Config(), client)  # type: ignore
+    provider.invalidate_cache("1219")
+
+    assert len(provider._get_episodes("1219")) == 16
+    # a later visit, once the in-memory listing is gone
+    provider_module._listing_cache.invalidate()
+    assert len(provider._get_episodes("1219")) == 16
+    assert client.statuses == [200, 304]
@@ -0,0 +1,489 @@
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import List, Optional
+from urllib.parse import urlparse
+
+import pytest
+from mov_cli.config import Config
+from mov_cli.media import Metadata, MetadataType, Single
+from mov_cli.utils import EpisodeSelector
+
+from consumet_mc.extractors.video_extractor import VideoExtractor
+from consumet_mc.models.episode import Episode
+from consumet_mc.models.paged_result import PagedResult
+from consumet_mc.models.season import Season
+from consumet_mc.models.source import Source
+from consumet_mc.models.video import Video
+from consumet_mc.models.video_server import VideoServer
+from consumet_mc.providers import provider as provider_module
+from consumet_mc.providers.provider import Provider
+from consumet_mc.utils.cache import TTLCache
+from consumet_mc.utils.episode_index import EpisodeIndex
+from consumet_mc.utils.health import HealthScoreboard
+from consumet_mc.utils.host_limiter import HostLimiter
+
+
+class Tracker:
+    """counts requests and the most that were in flight to each host at once"""
+
+    def __init__(self):
+        self.calls = Counter()
+        self.in_flight = Counter()
+        self.max_in_flight = Counter()
+        self._lock = threading.Lock()
+
+    def request(self, host: str, duration: float):
+        with self._lock:
+            self.calls[host] += 1
+            self.in_flight[host] += 1
+            self.max_in_flight[host] = max(
+                self.max_in_flight[host], self.in_flight[host]
+            )
+        time.sleep(duration)
+        with self._lock:
+            self.in_flight[host] -= 1
+
+
+class FakeExtractor(VideoExtractor):
+    def extract(self) -> Source:
+        tracker: Tracker = self.server.extra_data["tracker"]
+        episode_number = self.server.extra_data["episode_number"]
+        if episode_number == 3:
+            raise RuntimeError("extraction failed")
+        # later episodes finish first
+        tracker.request("cdn.example", 0.01 * (10 - episode_number))
+        query = self.server.extra_data["video_query"]
+        return Source([Video(f"https://cdn.example/{episode_number}.m3u8{query}")])
+
+
+class FakeProvider(Provider):
+    def __init__(self, tracker: Tracker):
+        super().__init__(Config(), None)  # type: ignore
+        self.tracker = tracker
+        self.video_query = ""
+        self.seasons: List[Season] = []
+        self.failing_seasons: List[str] = []
+        self.episodes_delay = 0.0
+
+    @property
+    def _base_url(self) -> str:
+        return "https://provider.example"
+
+    def _search_title(self, query: str, page: int) -> PagedResult:
+        return PagedResult()
+
+    def _scrape_seasons(self, media_id) -> List[Season]:
+        self.tracker.request("seasons", 0)
+        return self.seasons
+
+    def _scrape_episodes(
+        self, media_id: str, season_id: Optional[str] = None
+    ) -> List[Episode]:
+        season_number = int(season_id.split("-")[1]) if season_id else 1
+        # later seasons take longer
+        self.tracker.request("episodes", self.episodes_delay * season_number)
+        if season_id in self.failing_seasons:
+            raise RuntimeError(f"season {season_id} failed")
+        if season_id:
+            # season n has n + 1 episodes
+            return [
+                Episode(f"ep-{n}", season_number, n)
+                for n in range(1, season_number + 2)
+            ]
+        return [Episode(f"ep-{n}", 1, n) for n in range(1, 9)]
+
+    def _scrape_video_servers(
+        self, episode_id: str, media_id: Optional[str] = None
+    ) -> List[VideoServer]:
+        self.tracker.request("provider.example", 0.01)
+        episode_number = int(episode_id.split("-")[1])
+        return [
+            VideoServer(
+                "fake",
+                f"https://cdn.example/e/{episode_number}",
+                extra_data={
+                    "tracker": self.tracker,
+                    "episode_number": episode_number,
+                    "video_query": self.video_query,
+                },
+            )
+        ]
+
+    def _get_video_extractor(self, server: VideoServer) -> Optional[VideoExtractor]:
+        return FakeExtractor(None, server)  # type: ignore
+
+
+class RaceExtractor(VideoExtractor):
+    """sleeps for delay then fails, finds no videos or finds a video"""
+
+    def extract(self) -> Source:
+        tracker: Tracker = self.server.extra_data["tracker"]
+        outcome = self.server.extra_data["outcome"]
+        tracker.request("race", self.server.extra_data["delay"])
+        tracker.calls[self.server.name] += 1
+        if outcome == "fail":
+            raise RuntimeError(f"{self.server.name} failed")
+        if outcome == "empty":
+            return Source([])
+        return Source([Video(f"https://cdn.example/{self.server.name}.m3u8")])
+
+
+def race_extractors(tracker: Tracker, *servers) -> List[VideoExtractor]:
+    return [
+        RaceExtractor(
+            None,  # type: ignore
+            VideoServer(
+                name,
+                f"https://{name}.example/e/1",
+                extra_data={"tracker": tracker, "outcome": outcome, "delay": delay},
+            ),
+        )
+        for name, outcome, delay in servers
+    ]
+
+
+@pytest.fixture
+def fake_provider(tmp_path, monkeypatch):
+    monkeypatch.setattr(provider_module, "_listing_cache", TTLCache(ttl=600))
+    monkeypatch.setattr(provider_module, "_prefetched_media", TTLCache())
+    monkeypatch.setattr(
+        provider_module, "episode_index", EpisodeIndex(tmp_path / "index.sqlite3")
+    )
+    monkeypatch.setattr(
+        provider_module, "scoreboard", HealthScoreboard(tmp_path / "health.sqlite3")
+    )
+    provider = FakeProvider(Tracker())
+    provider.options["max_workers"] = 6
+    return provider
+
+
+def test_listings_are_cached_within_the_ttl(fake_provider: FakeProvider):
+    fake_provider.seasons = [Season("season-1", 1)]
+    assert fake_provider._get_seasons("show") == fake_provider._get_seasons("show")
+    assert fake_provider._get_episodes("show") == fake_provider._get_episodes("show")
+
+    tracker = fake_provider.tracker
+    assert tracker.calls["seasons"] == 1
+    assert tracker.calls["episodes"] == 1
+
+
+def test_listing_cache_is_keyed_by_media_and_sub_or_dub(fake_provider: FakeProvider):
+    fake_provider._get_episodes("show")
+    fake_provider._get_episodes("other-show")
+    assert fake_provider.tracker.calls["episodes"] == 2
+
+    fake_provider.options["sub_or_dub"] = "dub"
+    fake_provider._get_episodes("show")
+    fake_provider._get_episodes("show")
+    assert fake_provider.tracker.calls["episodes"] == 3
+
+    fake_provider.options["sub_or_dub"] = "sub"
+    fake_provider._get_episodes("show")
+    assert fake_provider.tracker.calls["episodes"] == 3
+
+
+def test_listing_cache_expires(fake_provider: FakeProvider):
+    fake_provider._listing_cache_ttl = 0.05
+    fake_provider._get_episodes("show")
+    time.sleep(0.1)
+    fake_provider._get_episodes("show")
+    assert fake_provider.tracker.calls["episodes"] == 2
+
+
+def test_servers_are_ranked_by_health(fake_provider: FakeProvider):
+    scoreboard = provider_module.scoreboard
+    scoreboard.record("fakeprovider/slow", True, 2.0)
+    scoreboard.record("fakeprovider/fast", True, 0.5)
+    scoreboard.record("fakeprovider/flaky", True, 0.1)
+    scoreboard.record("fakeprovider/flaky", False, 0.1)
+
+    servers = [VideoServer(name, "") for name in ("flaky", "new", "slow", "fast")]
+    ranked = fake_provider._rank_video_servers(servers)
+    assert [s.name for s in ranked] == ["fast", "slow", "flaky", "new"]
+
+
+def test_servers_in_cooldown_are_skipped(fake_provider: FakeProvider):
+    scoreboard = provider_module.scoreboard
+    for _ in range(scoreboard.max_consecutive_failures):
+        scoreboard.record("fakeprovider/broken", False, 0.1)
+        scoreboard.record("fakeprovider/down", False, 0.1)
+
+    servers = [VideoServer(name, "") for name in ("broken", "ok", "down")]
+    ranked = fake_provider._rank_video_servers(servers)
+    assert [s.name for s in ranked] == ["ok"]
+
+    # every server in cooldown, they are all tried rather than none
+    ranked = fake_provider._rank_video_servers(servers[::2])
+    assert [s.name for s in ranked] == ["broken", "down"]
+
+
+def test_ranking_reads_the_health_of_the_servers_once(
+    fake_provider: FakeProvider, monkeypatch
+):
+    scoreboard = provider_module.scoreboard
+    scoreboard.record("fakeprovider/slow", True, 2.0)
+    scoreboard.record("fakeprovider/fast", True, 0.5)
+    reads = []
+    get_many = scoreboard._store.get_many
+
+    def counting_get_many(keys):
+        reads.append(list(keys))
+        return get_many(reads[-1])
+
+    monkeypatch.setattr(scoreboard._store, "get_many", counting_get_many)
+    monkeypatch.setattr(scoreboard._store, "get", None)
+
+    servers = [VideoServer(name, "") for name in ("slow", "new", "fast")]
+    ranked = fake_provider._rank_video_servers(servers)
+    assert [s.name for s in ranked] == ["fast", "slow", "new"]
+    assert len(reads) == 1
+
+
+def test_servers_without_recorded_health_keep_their_order(
+    fake_provider: FakeProvider,
+):
+    servers = [VideoServer(name, "") for name in ("c", "a", "b")]
+    assert fake_provider._rank_video_servers(servers) == servers
+
+
+def test_race_returns_the_first_success(fake_provider: FakeProvider):
+    tracker = fake_provider.tracker
+    extractors = race_extractors(
+        tracker, ("slow", "ok", 0.2), ("fast", "ok", 0.01), ("medium", "ok", 0.1)
+    )
+    source = fake_provider._race_extract(extractors)
+    assert source is not None
+    assert source.videos[0].url == "https://cdn.example/fast.m3u8"
+
+
+def test_race_replaces_a_failed_server(fake_provider: FakeProvider):
+    fake_provider.options["race_size"] = 2
+    tracker = fake_provider.tracker
+    extractors = race_extractors(
+        tracker, ("a", "fail", 0.01), ("b", "ok", 0.5), ("c", "ok", 0.05)
+    )
+    source = fake_provider._race_extract(extractors)
+    # c only started once a failed, and still beat b
+    assert source is not None
+    assert source.videos[0].url == "https://cdn.example/c.m3u8"
+
+
+def test_race_ignores_sources_without_videos(fake_provider: FakeProvider):
+    tracker = fake_provider.tracker
+    extractors = race_extractors(tracker, ("a", "empty", 0.01), ("b", "ok", 0.05))
+    source = fake_provider._race_extract(extractors)
+    assert source is not None
+    assert source.videos[0].url == "https://cdn.example/b.m3u8"
+
+
+def test_race_raises_when_every_server_fails(fake_provider: FakeProvider):
+    tracker = fake_provider.tracker
+    extractors = race_extractors(tracker, ("a", "fail", 0.01), ("b", "fail", 0.02))
+    with pytest.raises(Exception, match="failed"):
+        fake_provider._race_extract(extractors)
+    assert tracker.calls["a"] == tracker.calls["b"] == 1
+
+
+def test_race_size_bounds_the_running_extractions(fake_provider: FakeProvider):
+    fake_provider.options["race_size"] = 2
+    tracker = fake_provider.tracker
+    extractors = race_extractors(
+        tracker, *[(f"s{n}", "fail", 0.02) for n in range(5)], ("last", "ok", 0.02)
+    )
+    source = fake_provider._race_extract(extractors)
+    assert source is not None
+    assert source.videos[0].url == "https://cdn.example/last.m3u8"
+    assert tracker.calls["race"] == 6
+    assert tracker.max_in_flight["race"] == 2
+
+
+def test_scrape_episodes_keeps_the_season_order(fake_provider: FakeProvider):
+    fake_provider.seasons = [Season(f"season-{n}", n) for n in (3, 1, 2)]
+    # the first season is the slowest, so it completes last
+    fake_provider.episodes_delay = 0.01
+    metadata = Metadata("show", "Show", MetadataType.MULTI)
+
+    season_episodes = fake_provider.scrape_episodes(metadata)
+    assert list(season_episodes.items()) == [(3, 4), (1, 2), (2, 3)]
+
+
+def test_scrape_episodes_is_bounded_by_max_workers(fake_provider: FakeProvider):
+    fake_provider.seasons = [Season(f"season-{n}", n) for n in range(1, 9)]
+    fake_provider.episodes_delay = 0.02
+    fake_provider.options["max_workers"] = 3
+    metadata = Metadata("show", "Show", MetadataType.MULTI)
+
+    assert len(fake_provider.scrape_episodes(metadata)) == 8
+    tracker = fake_provider.tracker
+    assert tracker.calls["episodes"] == 8
+    assert tracker.max_in_flight["episodes"] == 3
+
+
+def test_scrape_episodes_skips_a_failing_season(fake_provider: FakeProvider):
+    fake_provider.seasons = [Season(f"season-{n}", n) for n in range(1, 4)]
+    fake_provider.failing_seasons = ["season-2"]
+    metadata = Metadata("show", "Show", MetadataType.MULTI)
+
+    assert fake_provider.scrape_episodes(metadata) == {1: 2, 3: 4}
+
+
+def test_scrape_episodes_raises_when_every_season_fails(fake_provider: FakeProvider):
+    fake_provider.seasons = [Season(f"season-{n}", n) for n in range(1, 4)]
+    fake_provider.failing_seasons = [season.id for season in fake_provider.seasons]
+    metadata = Metadata("show", "Show", MetadataType.MULTI)
+
+    with pytest.raises(Exception, match="season season-1 failed"):
+        fake_provider.scrape_episodes(metadata)
+
+
+def test_scrape_many_resolves_every_episode(fake_provider: FakeProvider):
+    metadata = Metadata("show", "Show", MetadataType.MULTI)
+    results = list(
+        fake_provider.scrape_many(metadata, [EpisodeSelector(n) for n in range(1, 9)])
+    )
+
+    media = {episode.episode: media for episode, media in results}
+    assert sorted(media) == list(range(1, 9))
+    assert media[3] is None
+    assert media[5] is not None and media[5].url == "https://cdn.example/5.m3u8"
+    # yielded as they complete, not in episode order
+    assert [episode.episode for episode, _ in results] != list(range(1, 9))
+
+    tracker = fake_provider.tracker
+    assert tracker.calls["episodes"] == 1
+    assert tracker.max_in_flight["provider.example"] <= 2
+    assert tracker.max_in_flight["cdn.example"] <= 2
+
+
+def test_scrape_many_defaults_to_the_whole_show(fake_provider: FakeProvider):
+    fake_provider.options["max_per_host"] = 4
+    metadata = Metadata("show", "Show", MetadataType.MULTI)
+    results = list(fake_provider.scrape_many(metadata))
+
+    assert sorted(episode.episode for episode, _ in results) == list(range(1, 9))
+    assert fake_provider.tracker.max_in_flight["cdn.example"] <= 4
+
+
+class RecordingLimiter(HostLimiter):
+    """records the hosts whose slots are held"""
+
+    def __init__(self, limit: int) -> None:
+        super().__init__(limit)
+        self.held: List[str] = []
+
+    @contextmanager
+    def slot(self, url: str):
+        host = urlparse(url).hostname or ""
+        with super().slot(url):
+            self.held.append(host)
+            try:
+                yield
+            finally:
+                self.held.remove(host)
+
+
+class HeldSlotsExtractor(VideoExtractor):
+    def extract(self) -> Source:
+        limiter: RecordingLimiter = self.server.extra_data["limiter"]
+        self.server.extra_data["held"].append(list(limiter.held))
+        return Source([Video("https://cdn.example/1.m3u8")])
+
+
+def test_lazy_url_is_resolved_in_the_provider_slot(fake_provider: FakeProvider):
+    limiter = RecordingLimiter(1)
+    held: List[List[str]] = []
+
+    def resolve():
+        held.append(list(limiter.held))
+        return "https://cdn.example/e/1"
+
+    server = VideoServer(
+        "fake", extra_data={"held": held, "limiter": limiter}, resolver=resolve
+    )
+    fake_provider._extract(HeldSlotsExtractor(None, server), limiter)  # type: ignore
+
+    assert held == [["provider.example"], ["cdn.example"]]
+
+
+def wait_for_prefetches():
+    for _ in range(200):
+        with provider_module._prefetches_lock:
+            if not provider_module._running_prefetches:
+                return
+        time.sleep(0.01)
+
+
+def test_prefetch_resolves_the_next_episode(fake_provider: FakeProvider):
+    fake_provider.options["prefetch"] = True
+    metadata = Metadata("show", "Show", MetadataType.MULTI)
+
+    assert fake_provider.scrape(metadata, EpisodeSelector(1)) is not None
+    wait_for_prefetches()
+    assert fake_provider.tracker.calls["provider.example"] == 2
+
+    media = fake_provider.scrape(metadata, EpisodeSelector(2))
+    assert media is not None and media.url == "https://cdn.example/2.m3u8"
+    # episode 2 came from the prefetch, only episode 3 was prefetched since
+    wait_for_prefetches()
+    assert fake_provider.tracker.calls["provider.example"] == 3
+
+
+def test_prefetch_is_off_by_default(fake_provider: FakeProvider):
+    metadata = Metadata("show", "Show", MetadataType.MULTI)
+    fake_provider.scrape(metadata, EpisodeSelector(1))
+    wait_for_prefetches()
+    assert fake_provider.tracker.calls["provider.example"] == 1
+
+
+def test_prefetched_url_about_to_expire_is_not_served(fake_provider: FakeProvider):
+    fake_provider.options["prefetch"] = True
+    fake_provider.video_query = f"?expires={int(time.time()) + 30}"
+    metadata = Metadata("show", "Show", MetadataType.MULTI)
+
+    fake_provider.scrape(metadata, EpisodeSelector(1))
+    wait_for_prefetches()
+    fake_provider.scrape(metadata, EpisodeSelector(2))
+    wait_for_prefetches()
+    # episode 2 was scraped again, then episode 3 prefetched
+    assert fake_provider.tracker.calls["provider.example"] == 4
+
+
+def test_prefetched_media_is_not_served_once_prefetch_is_off(
+    fake_provider: FakeProvider,
+):
+    fake_provider.options["prefetch"] = True
+    metadata = Metadata("show", "Show", MetadataType.MULTI)
+
+    fake_provider.scrape(metadata, EpisodeSelector(1))
+    wait_for_prefetches()
+    fake_provider.options["prefetch"] = False
+    fake_provider.scrape(metadata, EpisodeSelector(2))
+    assert fake_provider.tracker.calls["provider.example"] == 3
+
+
+def test_prefetched_media_outlasts_the_episode_playing(fake_provider: FakeProvider):
+    media = Single("https://cdn.example/1.m3u8", "Show")
+    assert fake_provider._prefetched_media_ttl(media) >= 24 * 60
+
+
+def test_prefetch_still_running_is_not_waited_for_past_the_timeout(
+    fake_provider: FakeProvider, monkeypatch
+):
+    fake_provider.options["prefetch"] = True
+    fake_provider._prefetch_wait = 0.05
+    metadata = Metadata("show", "Show", MetadataType.MULTI)
+    stuck: Future = Future()
+    monkeypatch.setattr(
+        provider_module,
+        "_running_prefetches",
+        {fake_provider._prefetch_key(metadata, EpisodeSelector(2)): stuck},
+    )
+
+    media = fake_provider.scrape(metadata, EpisodeSelector(2))
+    stuck.set_result(None)
+    wait_for_prefetches()
+
+    assert media is not None and media.url == "https://cdn.example/2.m3u8"
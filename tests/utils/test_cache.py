@@ -0,0 +1,134 @@
+import threading
+import time
+
+import pytest
+
+from consumet_mc.utils.cache import SingleFlight, TTLCache
+
+
+@pytest.fixture
+def cache():
+    return TTLCache(ttl=60)
+
+
+def test_get_returns_default_on_miss(cache: TTLCache):
+    assert cache.get(("flixhq", "tv/watch-vincenzo-67955")) is None
+    assert cache.get(("flixhq", "tv/watch-vincenzo-67955"), []) == []
+
+
+def test_set_then_get(cache: TTLCache):
+    cache.set(("flixhq", "tv/watch-vincenzo-67955"), [1, 2, 3])
+    assert cache.get(("flixhq", "tv/watch-vincenzo-67955")) == [1, 2, 3]
+
+
+def test_entries_expire(cache: TTLCache):
+    cache.set(("hianime", "naruto-677"), [1], ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get(("hianime", "naruto-677")) is None
+    assert len(cache) == 0
+
+
+def test_invalidate_by_prefix(cache: TTLCache):
+    cache.set(("hianime", "sub", "naruto-677", "seasons"), [])
+    cache.set(("hianime", "sub", "naruto-677", "episodes", ""), [1])
+    cache.set(("hianime", "sub", "one-piece-100", "episodes", ""), [1])
+
+    cache.invalidate("hianime", "sub", "naruto-677")
+
+    assert cache.get(("hianime", "sub", "naruto-677", "seasons")) is None
+    assert cache.get(("hianime", "sub", "one-piece-100", "episodes", "")) == [1]
+
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_get_or_fetch_never_runs_two_fetches_of_a_key_at_once(cache: TTLCache):
+    running = []
+    most_running = []
+
+    def fetch():
+        running.append(1)
+        most_running.append(len(running))
+        time.sleep(0.01)
+        running.pop()
+        # nothing is cached, so every caller ends up fetching in turn
+
+    def get_or_fetch(delay: float):
+        # callers keep arriving while earlier ones finish their fetch
+        time.sleep(delay)
+        cache.get_or_fetch(("key",), fetch)
+
+    threads = [
+        threading.Thread(target=get_or_fetch, args=(0.007 * n,)) for n in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(most_running) == 6
+    assert max(most_running) == 1
+    assert not cache._fetch_locks
+
+
+def test_get_or_fetch_waiters_reuse_the_fetched_value(cache: TTLCache):
+    calls = []
+    barrier = threading.Barrier(4)
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.02)
+        return "value"
+
+    results = []
+
+    def get_or_fetch():
+        barrier.wait()
+        results.append(cache.get_or_fetch(("key",), fetch))
+
+    threads = [threading.Thread(target=get_or_fetch) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["value"] * 4
+    assert len(calls) == 1
+
+
+def test_single_flight_shares_concurrent_calls():
+    single_flight = SingleFlight()
+    calls = []
+    results = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.05)
+        return "<html></html>"
+
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(
+                single_flight.do(("GET", "https://flixhq.to/home"), fetch)
+            )
+        )
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == ["<html></html>"] * 8
+
+
+def test_single_flight_shares_errors_then_retries():
+    single_flight = SingleFlight()
+
+    def fail():
+        raise ConnectionError("upstream is down")
+
+    with pytest.raises(ConnectionError):
+        single_flight.do("key", fail)
+    assert single_flight.do("key", lambda: "ok") == "ok"
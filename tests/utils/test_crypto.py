@@ -0,0 +1,56 @@
+import base64
+import os
+
+from Crypto.Cipher import AES
+
+from consumet_mc.utils import crypto
+
+
+def openssl_encrypt(plaintext: bytes, password: str, salt: bytes) -> str:
+    key, iv = crypto.aes_unsalt(password.encode(), salt)
+    pad_len = 16 - len(plaintext) % 16
+    ciphertext = AES.new(key, AES.MODE_CBC, iv).encrypt(
+        plaintext + bytes([pad_len]) * pad_len
+    )
+    return base64.b64encode(b"Salted__" + salt + ciphertext).decode()
+
+
+def test_encrypt_decrypt_round_trip():
+    key = "k" * 32
+    iv = "i" * 16
+    for data in ("", "a", "x" * 15, "y" * 16, "z" * 17, "ünïcödé"):
+        encrypted = crypto.aes_encrypt(data, key, iv)
+        assert crypto.aes_decrypt(encrypted.decode(), key, iv) == data.encode().decode(
+            "latin-1"
+        )
+
+
+def test_encrypt_hexed_key_and_iv():
+    key = "4f6bdaa39E2F8CB07f5e722d9EDEF314"
+    iv = "01504af356e619cf2e42bba68C3F70F9"
+    encrypted = crypto.aes_encrypt("|123|kisskh|00|", key, iv, True)
+    expected = AES.new(bytes.fromhex(key), AES.MODE_CBC, bytes.fromhex(iv)).encrypt(
+        b"|123|kisskh|00|\x01"
+    )
+    assert base64.b64decode(encrypted) == expected
+
+
+def test_decrypt_salted_ciphertext():
+    salt = os.urandom(8)
+    ciphertext = openssl_encrypt(b'[{"file":"https://cdn.example/a.m3u8"}]', "pw", salt)
+    assert (
+        crypto.aes_decrypt(ciphertext, "pw")
+        == '[{"file":"https://cdn.example/a.m3u8"}]'
+    )
+
+
+def test_batch_matches_single_calls():
+    key = "4f6bdaa39E2F8CB07f5e722d9EDEF314"
+    iv = "01504af356e619cf2e42bba68C3F70F9"
+    data = ["|1|a|", "|2|bb|", "c" * 40]
+    assert crypto.aes_encrypt_many(data, key, iv, True) == [
+        crypto.aes_encrypt(item, key, iv, True) for item in data
+    ]
+
+    ciphertexts = [openssl_encrypt(item.encode(), "pw", os.urandom(8)) for item in data]
+    assert crypto.aes_decrypt_many(ciphertexts, "pw") == data
@@ -0,0 +1,56 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from consumet_mc.models.episode import Episode
+from consumet_mc.models.indexed_episodes import IndexedEpisodes
+from consumet_mc.utils.episode_index import EpisodeIndex
+
+
+@pytest.fixture
+def episode_index(tmp_path: Path):
+    return EpisodeIndex(tmp_path / "episode_index.sqlite3")
+
+
+def make_indexed(count: int = 3):
+    return IndexedEpisodes(
+        [Episode(f"ep-{n}", 1, n, title=f"Episode {n}") for n in range(1, count + 1)],
+        {"last_page": 1, "etag": None},
+    )
+
+
+def test_round_trip(episode_index: EpisodeIndex):
+    indexed = make_indexed()
+    episode_index.set("animepahe/sub/naruto/episodes/", indexed)
+    assert episode_index.get("animepahe/sub/naruto/episodes/") == indexed
+    assert episode_index.get("animepahe/dub/naruto/episodes/") is None
+
+
+def test_invalidate_prefix(episode_index: EpisodeIndex):
+    episode_index.set("animepahe/sub/naruto/episodes/", make_indexed())
+    episode_index.set("animepahe/sub/bleach/episodes/", make_indexed())
+    episode_index.set("hianime/sub/naruto/episodes/", make_indexed())
+
+    episode_index.invalidate("animepahe/sub/naruto/")
+    assert episode_index.get("animepahe/sub/naruto/episodes/") is None
+    assert episode_index.get("animepahe/sub/bleach/episodes/") is not None
+
+    episode_index.invalidate("animepahe/")
+    assert episode_index.get("animepahe/sub/bleach/episodes/") is None
+    assert episode_index.get("hianime/sub/naruto/episodes/") is not None
+
+
+def test_old_indexes_expire(tmp_path: Path):
+    episode_index = EpisodeIndex(tmp_path / "episode_index.sqlite3", max_age=0.05)
+    episode_index.set("kisskh/sub/1219/episodes/", make_indexed())
+    time.sleep(0.1)
+    assert episode_index.get("kisskh/sub/1219/episodes/") is None
+
+
+def test_least_recently_refreshed_indexes_are_dropped(tmp_path: Path):
+    episode_index = EpisodeIndex(tmp_path / "episode_index.sqlite3", max_entries=2)
+    for media_id in ("naruto", "bleach", "one-piece"):
+        episode_index.set(f"hianime/sub/{media_id}/episodes/", make_indexed())
+    assert episode_index.get("hianime/sub/naruto/episodes/") is None
+    assert episode_index.get("hianime/sub/one-piece/episodes/") is not None
@@ -0,0 +1,132 @@
+import json
+
+import httpx
+
+from consumet_mc.utils.graphql import GraphQLField, PersistedQueries, build_query
+
+
+def test_build_query_aliases_fields_and_variables():
+    query, variables = build_query(
+        {
+            "show": GraphQLField("show", "_id name", {"_id": ("String!", "abc")}),
+            "episode": GraphQLField(
+                "episode",
+                "sourceUrls",
+                {"showId": ("String!", "abc"), "episodeString": ("String!", "1")},
+            ),
+        }
+    )
+    assert query == (
+        "query ($show__id: String!, $episode_showId: String!,"
+        " $episode_episodeString: String!) {"
+        " show: show(_id: $show__id) { _id name }"
+        " episode: episode(showId: $episode_showId,"
+        " episodeString: $episode_episodeString) { sourceUrls } }"
+    )
+    assert variables == {
+        "show__id": "abc",
+        "episode_showId": "abc",
+        "episode_episodeString": "1",
+    }
+
+
+class FakeServer:
+    """an apollo like server, answering persisted queries it has seen"""
+
+    def __init__(
+        self, supports_persisted_queries: bool = True, ignores_extensions: bool = False
+    ):
+        self.supports_persisted_queries = supports_persisted_queries
+        self.ignores_extensions = ignores_extensions
+        self.failures = []
+        self.known = set()
+        self.sent = []
+
+    def send(self, params):
+        self.sent.append(dict(params))
+        request = httpx.Request("GET", "https://api.example/api")
+        if self.failures:
+            return httpx.Response(self.failures.pop(0), request=request)
+        if self.ignores_extensions:
+            if "query" not in params:
+                error = {"message": "Must provide query string."}
+                return httpx.Response(400, json={"errors": [error]}, request=request)
+            return httpx.Response(200, json={"data": {"ok": True}}, request=request)
+
+        extensions = json.loads(params.get("extensions", "{}"))
+        digest = extensions.get("persistedQuery", {}).get("sha256Hash")
+
+        if digest and not self.supports_persisted_queries:
+            error = {"message": "PersistedQueryNotSupported"}
+            return httpx.Response(200, json={"errors": [error]}, request=request)
+
+        if "query" not in params:
+            if digest not in self.known:
+                error = {"message": "PersistedQueryNotFound"}
+                return httpx.Response(200, json={"errors": [error]}, request=request)
+        elif digest:
+            self.known.add(digest)
+
+        return httpx.Response(200, json={"data": {"ok": True}}, request=request)
+
+
+def test_query_is_sent_once_then_by_hash():
+    server = FakeServer()
+    persisted_queries = PersistedQueries()
+    for _ in range(3):
+        response = persisted_queries.request(server.send, "query { ok }", {})
+        assert response.json() == {"data": {"ok": True}}
+
+    assert "query" in server.sent[0]
+    assert all("query" not in params for params in server.sent[1:])
+    assert len(server.sent) == 3
+
+
+def test_forgotten_hash_is_sent_again_in_full():
+    server = FakeServer()
+    persisted_queries = PersistedQueries()
+    persisted_queries.request(server.send, "query { ok }", {})
+    server.known.clear()
+
+    response = persisted_queries.request(server.send, "query { ok }", {})
+    assert response.json() == {"data": {"ok": True}}
+    assert ["query" in params for params in server.sent] == [True, False, True]
+    assert persisted_queries.supported
+
+
+def test_unsupported_server_gets_full_queries():
+    server = FakeServer(supports_persisted_queries=False)
+    persisted_queries = PersistedQueries()
+    for _ in range(2):
+        response = persisted_queries.request(server.send, "query { ok }", {})
+        assert response.json() == {"data": {"ok": True}}
+
+    assert not persisted_queries.supported
+    assert "extensions" not in server.sent[-1]
+
+
+def test_other_error_on_hash_resends_the_query_and_keeps_persisting():
+    server = FakeServer()
+    persisted_queries = PersistedQueries()
+    persisted_queries.request(server.send, "query { ok }", {})
+    server.failures.append(502)
+
+    response = persisted_queries.request(server.send, "query { ok }", {})
+    assert response.json() == {"data": {"ok": True}}
+    assert persisted_queries.supported
+    assert "extensions" in server.sent[-1]
+
+    persisted_queries.request(server.send, "query { ok }", {})
+    assert "query" not in server.sent[-1]
+
+
+def test_server_ignoring_extensions_gets_the_query_in_full():
+    server = FakeServer(ignores_extensions=True)
+    persisted_queries = PersistedQueries()
+    for _ in range(3):
+        response = persisted_queries.request(server.send, "query { ok }", {})
+        assert response.json() == {"data": {"ok": True}}
+
+    # the hash alone is tried once, then the query is always sent in full
+    assert ["query" in params for params in server.sent] == [True, False, True, True]
+    assert persisted_queries.supported
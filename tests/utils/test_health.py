@@ -0,0 +1,116 @@
+import threading
+from pathlib import Path
+
+import pytest
+
+from consumet_mc.utils.health import HealthScoreboard
+
+
+@pytest.fixture
+def scoreboard(tmp_path: Path):
+    return HealthScoreboard(
+        tmp_path / "server_health.sqlite3", max_consecutive_failures=2
+    )
+
+
+def test_record_and_percentiles(scoreboard: HealthScoreboard):
+    for latency in (1.0, 2.0, 3.0, 4.0):
+        scoreboard.record("hianime/hd-1", True, latency)
+    scoreboard.record("hianime/hd-1", False, 10.0)
+
+    health = scoreboard.get("hianime/hd-1")
+    assert health.successes == 4
+    assert health.failures == 1
+    assert health.p50 == 3.0
+    assert health.p95 == 4.0
+    assert health.last_failure
+
+
+def test_cooldown_after_consecutive_failures(scoreboard: HealthScoreboard):
+    scoreboard.record("flixhq/upcloud", False, 1.0)
+    assert not scoreboard.in_cooldown(scoreboard.get("flixhq/upcloud"))
+
+    scoreboard.record("flixhq/upcloud", False, 1.0)
+    assert scoreboard.in_cooldown(scoreboard.get("flixhq/upcloud"))
+
+    scoreboard.record("flixhq/upcloud", True, 1.0)
+    assert not scoreboard.in_cooldown(scoreboard.get("flixhq/upcloud"))
+
+
+def test_score_prefers_healthy_servers(scoreboard: HealthScoreboard):
+    scoreboard.record("allanime/fm-hls", False, 1.0)
+    scoreboard.record("allanime/mp4", True, 1.0)
+
+    keys = ["allanime/fm-hls", "allanime/yt-mp4", "allanime/mp4"]
+    assert sorted(keys, key=lambda key: scoreboard.score(scoreboard.get(key))) == [
+        "allanime/mp4",
+        "allanime/yt-mp4",
+        "allanime/fm-hls",
+    ]
+
+
+def test_score_ranks_missing_latency_last(scoreboard: HealthScoreboard):
+    scoreboard.record("flixhq/upcloud", True, 3.0)
+    scoreboard.record("flixhq/upcloud", False, 1.0)
+    scoreboard.record("flixhq/vidcloud", True, 1.0)
+    scoreboard.record("flixhq/vidcloud", False, 1.0)
+
+    # all three work half the time, the untried one has no latency yet
+    keys = ["flixhq/voe", "flixhq/upcloud", "flixhq/vidcloud"]
+    assert sorted(keys, key=lambda key: scoreboard.score(scoreboard.get(key))) == [
+        "flixhq/vidcloud",
+        "flixhq/upcloud",
+        "flixhq/voe",
+    ]
+
+
+def test_concurrent_writers_are_merged(scoreboard: HealthScoreboard):
+    # every instance stands in for another process sharing the file
+    others = [HealthScoreboard(scoreboard.path) for _ in range(4)]
+
+    def record(instance: HealthScoreboard):
+        for _ in range(25):
+            instance.record("hianime/hd-1", True, 1.0)
+
+    threads = [threading.Thread(target=record, args=(o,)) for o in others]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert scoreboard.get("hianime/hd-1").successes == 100
+
+
+def test_persisted_between_instances(scoreboard: HealthScoreboard):
+    scoreboard.record("hianime/hd-2", True, 0.5)
+
+    reloaded = HealthScoreboard(scoreboard.path)
+    assert reloaded.get("hianime/hd-2").successes == 1
+
+
+def test_reset(scoreboard: HealthScoreboard):
+    scoreboard.record("hianime/hd-2", False, 0.5)
+    scoreboard.reset()
+    assert HealthScoreboard(scoreboard.path).get("hianime/hd-2").failures == 0
+
+
+def test_score_breaks_median_ties_by_the_tail(scoreboard: HealthScoreboard):
+    for latency in (1.0, 1.0, 1.0, 9.0):
+        scoreboard.record("hianime/hd-1", True, latency)
+    for latency in (1.0, 1.0, 1.0, 2.0):
+        scoreboard.record("hianime/hd-2", True, latency)
+
+    keys = ["hianime/hd-1", "hianime/hd-2"]
+    assert sorted(keys, key=lambda key: scoreboard.score(scoreboard.get(key))) == [
+        "hianime/hd-2",
+        "hianime/hd-1",
+    ]
+
+
+def test_get_many_returns_the_recorded_servers(scoreboard: HealthScoreboard):
+    scoreboard.record("hianime/hd-1", True, 1.0)
+    scoreboard.record("hianime/hd-2", False, 1.0)
+
+    healths = scoreboard.get_many(["hianime/hd-1", "hianime/hd-2", "hianime/hd-3"])
+    assert sorted(healths) == ["hianime/hd-1", "hianime/hd-2"]
+    assert healths["hianime/hd-2"].failures == 1
@@ -0,0 +1,74 @@
+import gzip
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+from consumet_mc.utils.http_cache import HTTPCache
+
+
+@pytest.fixture
+def http_cache(tmp_path: Path):
+    return HTTPCache(tmp_path / "http_cache.sqlite3")
+
+
+def make_response(status: int = 200, content: bytes = b'{"episodes": []}'):
+    return httpx.Response(
+        status,
+        headers={"content-type": "application/json"},
+        content=content,
+        request=httpx.Request("GET", "https://kisskh.do/api/DramaList/Drama/1"),
+    )
+
+
+def test_key_depends_on_params_and_headers():
+    url = "https://hianime.to/most-popular"
+    assert HTTPCache.key("GET", url) == HTTPCache.key("get", url)
+    assert HTTPCache.key("GET", url) != HTTPCache.key("GET", url, params={"page": 2})
+    assert HTTPCache.key("GET", url) != HTTPCache.key(
+        "GET", url, headers={"Referer": "https://hianime.to"}
+    )
+
+
+def test_round_trip(http_cache: HTTPCache):
+    http_cache.set("key", make_response(), 60)
+
+    response = http_cache.get("key")
+    assert response is not None
+    assert response.status_code == 200
+    assert response.json() == {"episodes": []}
+    assert str(response.url) == "https://kisskh.do/api/DramaList/Drama/1"
+    response.raise_for_status()
+
+
+def test_decoded_content_is_stored(http_cache: HTTPCache):
+    response = httpx.Response(
+        200,
+        headers={"content-encoding": "gzip"},
+        content=gzip.compress(b"<html></html>"),
+        request=httpx.Request("GET", "https://flixhq.to/home"),
+    )
+    http_cache.set("key", response, 60)
+
+    cached = http_cache.get("key")
+    assert cached is not None
+    assert cached.text == "<html></html>"
+
+
+def test_errors_and_never_are_not_cached(http_cache: HTTPCache):
+    http_cache.set("error", make_response(status=500), 60)
+    http_cache.set("never", make_response(), 0)
+    assert http_cache.get("error") is None
+    assert http_cache.get("never") is None
+
+
+def test_expired_responses_are_ignored(http_cache: HTTPCache):
+    http_cache.set("key", make_response(), 0.01)
+    time.sleep(0.02)
+    assert http_cache.get("key") is None
+
+
+def test_shared_between_instances(http_cache: HTTPCache):
+    http_cache.set("key", make_response(), 60)
+    assert HTTPCache(http_cache.path).get("key") is not None
@@ -0,0 +1,37 @@
+import subprocess
+import sys
+
+import consumet_mc
+from consumet_mc.utils.lazy import LazyScraper
+
+
+def test_importing_plugin_does_not_import_providers():
+    code = (
+        "import sys, consumet_mc;"
+        "print(any(m.startswith('consumet_mc.providers') for m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert output.strip() == "False"
+
+
+def test_lazy_scraper_loads_on_use():
+    scraper = LazyScraper("consumet_mc.providers.sflix", "Sflix")
+    assert not scraper.is_loaded
+
+    from consumet_mc.providers import Sflix
+
+    assert scraper.load() is Sflix
+    assert scraper == Sflix
+    assert scraper.__name__ == "Sflix"
+    assert scraper == LazyScraper("consumet_mc.providers.sflix", "Sflix")
+
+
+def test_plugin_scrapers_are_the_provider_classes():
+    from consumet_mc import providers
+
+    scrapers = consumet_mc.plugin["scrapers"]
+    assert scrapers["DEFAULT"] == scrapers["hianime"]
+    for scraper in scrapers.values():
+        assert scraper.load() is getattr(providers, scraper.name)
@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from consumet_mc.utils.obfuscation import char_shift, char_shift_bytes, rot13, xor_bytes
+
+
+def reference_rot13(s):
+    result = []
+    for c in s:
+        if "A" <= c <= "Z":
+            result.append(chr((ord(c) - ord("A") + 13) % 26 + ord("A")))
+        elif "a" <= c <= "z":
+            result.append(chr((ord(c) - ord("a") + 13) % 26 + ord("a")))
+        else:
+            result.append(c)
+    return "".join(result)
+
+
+def reference_char_shift(s, shift):
+    return "".join(chr(ord(c) - shift) for c in s)
+
+
+def test_rot13_matches_reference():
+    rnd = random.Random(0)
+    s = "".join(chr(rnd.randrange(0, 0x3000)) for _ in range(5000))
+    assert rot13(s) == reference_rot13(s)
+    assert rot13(rot13(s)) == s
+
+
+def test_char_shift_matches_reference():
+    rnd = random.Random(0)
+    for shift in (-300, -3, 0, 3):
+        for low, high in ((3, 0x80), (3, 0x100), (0x100, 0x3000)):
+            s = "".join(chr(rnd.randrange(low, high)) for _ in range(200))
+            assert char_shift(s, shift) == reference_char_shift(s, shift)
+
+
+def test_char_shift_out_of_range():
+    with pytest.raises(ValueError):
+        reference_char_shift("\x01", 3)
+    with pytest.raises(ValueError):
+        char_shift("\x01", 3)
+    with pytest.raises(ValueError):
+        char_shift_bytes(b"\x01", 3)
+
+
+def test_char_shift_bytes():
+    assert char_shift_bytes(b"dEf", 3) == b"aBc"
+
+
+def reference_xor(data, key):
+    return bytes(b ^ key[i % len(key)] for i, b in enumerate(data))
+
+
+@pytest.mark.parametrize("key_size", [1, 3, 4, 32])
+@pytest.mark.parametrize("size", [0, 1, 5, 1000])
+def test_xor_bytes_matches_reference(key_size, size):
+    rnd = random.Random(size * 100 + key_size)
+    data = bytes(rnd.randrange(256) for _ in range(size))
+    key = bytes(rnd.randrange(256) for _ in range(key_size))
+    assert xor_bytes(data, key) == reference_xor(data, key)
+    assert xor_bytes(xor_bytes(data, key), key) == data
+
+
+def test_xor_bytes_keeps_leading_and_trailing_zeros():
+    assert xor_bytes(b"\x00\x01\x00", b"\x01\x01") == b"\x01\x00\x01"
+    assert xor_bytes(b"\x05\x05", b"\x05\x05") == b"\x00\x00"
+
+
+def test_xor_bytes_rejects_empty_key():
+    with pytest.raises(ValueError):
+        xor_bytes(b"abc", b"")
@@ -0,0 +1,61 @@
+import random
+import re
+
+from consumet_mc.utils.packer import _replace_tokens, _to_base, unpack
+
+PACKED = (
+    "<script>eval(function(p,a,c,k,e,d){e=function(c){return c.toString(36)};"
+    "if(!''.replace(/^/,String)){while(c--){d[c.toString(a)]=k[c]||c.toString(a)}"
+    "k=[function(e){return d[e]}];e=function(){return'\\\\w+'};c=1};"
+    "while(c--){if(k[c]){p=p.replace(new RegExp('\\\\b'+e(c)+'\\\\b','g'),k[c])}}"
+    "return p}('3 2=\\'1://4.5/6.7\\';',36,8,'|https|source|var|cdn|example|index|m3u8'"
+    ".split('|'),0,{}))</script>"
+)
+
+
+def reference_replace_tokens(p, a, c, k):
+    # the per keyword substitution loop unpack used before the single pass tokenizer
+    for i in range(c - 1, 0, -1):
+        if k[i]:
+            p = re.sub(r"\b" + _to_base(i, a) + r"\b", k[i], p)
+    return p
+
+
+def test_unpack():
+    assert unpack(PACKED) == "var source='https://cdn.example/index.m3u8'"
+
+
+def test_unpack_without_packed_code():
+    assert unpack("<html></html>") is None
+
+
+def test_chained_keywords_match_reference():
+    # k[3] is the token of k[2] which is the token of k[1]
+    p = "3 2 1 0"
+    k = ["", "one", "1", "2"]
+    assert _replace_tokens(p, 36, 4, k) == reference_replace_tokens(p, 36, 4, k)
+    assert _replace_tokens(p, 36, 4, k) == "one one one 0"
+
+
+def test_random_payloads_match_reference():
+    rnd = random.Random(0)
+    alphabet = "abcdefghijklmnopqrstuvwxyzABC0123456789_$."
+
+    for _ in range(500):
+        a = rnd.choice([10, 36, 62])
+        c = rnd.randint(1, 120)
+        k = []
+        for _ in range(c):
+            r = rnd.random()
+            if r < 0.2:
+                k.append("")
+            elif r < 0.5:
+                k.append(_to_base(rnd.randint(0, c + 5), a))
+            else:
+                k.append("".join(rnd.choice(alphabet) for _ in range(rnd.randint(1, 5))))
+        p = "".join(
+            _to_base(rnd.randint(0, c + 3), a) + rnd.choice(" .(;$_")
+            for _ in range(60)
+        )
+
+        assert _replace_tokens(p, a, c, k) == reference_replace_tokens(p, a, c, k)
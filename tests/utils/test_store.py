@@ -0,0 +1,77 @@
+import threading
+from pathlib import Path
+
+import pytest
+
+from consumet_mc.utils.store import JSONStore
+
+
+@pytest.fixture
+def store(tmp_path: Path):
+    return JSONStore("test", tmp_path / "store.sqlite3")
+
+
+def test_get_returns_none_on_miss(store: JSONStore):
+    assert store.get("missing") is None
+
+
+def test_set_many_then_get(store: JSONStore):
+    store.set_many({"a": [1, 2], "b": {"c": None}})
+    assert store.get("a") == [1, 2]
+    assert store.get("b") == {"c": None}
+
+
+def test_get_many_skips_missing_keys(store: JSONStore):
+    store.set_many({"a": 1, "b": [2]})
+    assert store.get_many(["a", "b", "c"]) == {"a": 1, "b": [2]}
+    assert store.get_many([]) == {}
+
+
+def test_update_sees_the_stored_value(store: JSONStore):
+    store.update("count", lambda value: (value or 0) + 1)
+    store.update("count", lambda value: (value or 0) + 1)
+    assert store.get("count") == 2
+
+
+def test_clear(store: JSONStore):
+    store.set_many({"a": 1})
+    store.clear()
+    assert store.get("a") is None
+
+
+def test_invalidate_prefix(store: JSONStore):
+    store.set_many({"a/1": 1, "a/2": 2, "b/1": 3})
+    store.invalidate("a/")
+    assert store.get_many(["a/1", "a/2", "b/1"]) == {"b/1": 3}
+
+
+def test_persisted_between_instances(store: JSONStore):
+    store.set_many({"a": 1})
+    assert JSONStore("test", store.path).get("a") == 1
+
+
+def test_least_recently_written_entries_are_dropped(tmp_path: Path):
+    store = JSONStore("test", tmp_path / "store.sqlite3", max_entries=2)
+    store.set_many({"a": 1, "b": 2})
+    store.update("a", lambda value: value + 1)
+    store.set_many({"c": 3})
+    assert store.get("a") == 2
+    assert store.get("b") is None
+    assert store.get("c") == 3
+
+
+def test_concurrent_updates_are_not_lost(store: JSONStore):
+    # every instance has its own connection, as another process would
+    others = [JSONStore("test", store.path) for _ in range(4)]
+
+    def update(instance: JSONStore):
+        for _ in range(25):
+            instance.update("count", lambda value: (value or 0) + 1)
+
+    threads = [threading.Thread(target=update, args=(o,)) for o in others]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert store.get("count") == 100
@@ -0,0 +1,12 @@
+from consumet_mc.utils.utils import signed_url_expiry
+
+
+def test_signed_url_expiry():
+    assert signed_url_expiry("https://cdn.example/a.m3u8?e=1700000000") == 1700000000
+    assert (
+        signed_url_expiry("https://cdn.example/a.m3u8?token=x&Expires=1700000000000")
+        == 1700000000
+    )
+    assert signed_url_expiry("https://cdn.example/a.m3u8?e=3600") is None
+    assert signed_url_expiry("https://cdn.example/a.m3u8?t=1700000000") is None
+    assert signed_url_expiry("https://cdn.example/a.m3u8") is None